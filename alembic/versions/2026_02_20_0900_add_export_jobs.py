@@ -0,0 +1,50 @@
+"""Add background export jobs
+
+Revision ID: export_jobs_001
+Revises: form_builder_001
+Create Date: 2026-02-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'export_jobs_001'
+down_revision = 'form_builder_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('export_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('export_type', sa.String(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False, server_default='csv'),
+        sa.Column('params', sa.JSON(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False, server_default='pending'),
+        sa.Column('total_rows', sa.Integer(), nullable=True),
+        sa.Column('rows_written', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('chunk_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_key', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_id'), 'export_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_export_jobs_workspace_id'), 'export_jobs', ['workspace_id'], unique=False)
+    op.create_index(op.f('ix_export_jobs_status'), 'export_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_export_jobs_status'), table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_workspace_id'), table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_id'), table_name='export_jobs')
+    op.drop_table('export_jobs')
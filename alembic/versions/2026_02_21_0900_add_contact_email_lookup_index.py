@@ -0,0 +1,29 @@
+"""Index contacts by workspace and lowercased email
+
+Revision ID: contact_import_001
+Revises: export_jobs_001
+Create Date: 2026-02-21 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'contact_import_001'
+down_revision = 'export_jobs_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs the set-based email dedupe in bulk contact imports
+    op.create_index(
+        'ix_contacts_workspace_id_lower_email',
+        'contacts',
+        ['workspace_id', sa.text('lower(email)')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_workspace_id_lower_email', table_name='contacts')
@@ -0,0 +1,44 @@
+"""Allow one active alert per referenced entity
+
+Revision ID: alerts_active_ref_001
+Revises: contact_import_001
+Create Date: 2026-02-22 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'alerts_active_ref_001'
+down_revision = 'contact_import_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Resolve duplicates left by earlier check-then-insert scans, keeping the newest
+    op.execute("""
+        UPDATE alerts SET status = 'RESOLVED', resolved_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY type, reference_type, reference_id
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM alerts
+                WHERE status = 'ACTIVE' AND reference_id IS NOT NULL
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+    op.create_index(
+        'ux_alerts_active_reference',
+        'alerts',
+        ['type', 'reference_type', 'reference_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'ACTIVE' AND reference_id IS NOT NULL")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_alerts_active_reference', table_name='alerts')
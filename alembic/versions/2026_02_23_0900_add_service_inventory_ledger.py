@@ -0,0 +1,57 @@
+"""Add service inventory mapping and reservation ledger
+
+Revision ID: service_inventory_001
+Revises: alerts_active_ref_001
+Create Date: 2026-02-23 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'service_inventory_001'
+down_revision = 'alerts_active_ref_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('service_inventory',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('quantity_per_booking', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['item_id'], ['inventory_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('service_id', 'item_id', name='uq_service_inventory_service_item')
+    )
+    op.create_index(op.f('ix_service_inventory_id'), 'service_inventory', ['id'], unique=False)
+    op.create_index(op.f('ix_service_inventory_service_id'), 'service_inventory', ['service_id'], unique=False)
+    
+    op.create_table('inventory_reservations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['item_id'], ['inventory_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('booking_id', 'item_id', 'kind', name='uq_inventory_reservations_booking_item_kind')
+    )
+    op.create_index(op.f('ix_inventory_reservations_id'), 'inventory_reservations', ['id'], unique=False)
+    op.create_index(op.f('ix_inventory_reservations_item_id'), 'inventory_reservations', ['item_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_inventory_reservations_item_id'), table_name='inventory_reservations')
+    op.drop_index(op.f('ix_inventory_reservations_id'), table_name='inventory_reservations')
+    op.drop_table('inventory_reservations')
+    op.drop_index(op.f('ix_service_inventory_service_id'), table_name='service_inventory')
+    op.drop_index(op.f('ix_service_inventory_id'), table_name='service_inventory')
+    op.drop_table('service_inventory')
@@ -0,0 +1,58 @@
+"""Add last message preview to conversations for the inbox list
+
+Revision ID: conversation_inbox_001
+Revises: service_inventory_001
+Create Date: 2026-02-24 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'conversation_inbox_001'
+down_revision = 'service_inventory_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('last_message_preview', sa.String(), nullable=True))
+    op.add_column('conversations', sa.Column('last_message_direction', sa.String(), nullable=True))
+    op.add_column('conversations', sa.Column('last_message_channel', sa.String(), nullable=True))
+
+    # Backfill from each conversation's newest message; enum columns store member names
+    op.execute("""
+        UPDATE conversations AS c
+        SET last_message_at = latest.created_at,
+            last_message_preview = CASE
+                WHEN length(latest.preview) > 160 THEN rtrim(left(latest.preview, 159)) || '…'
+                ELSE latest.preview
+            END,
+            last_message_direction = lower(latest.direction::text),
+            last_message_channel = lower(latest.type::text)
+        FROM (
+            SELECT DISTINCT ON (conversation_id)
+                conversation_id,
+                created_at,
+                direction,
+                type,
+                btrim(regexp_replace(content, '\\s+', ' ', 'g')) AS preview
+            FROM messages
+            ORDER BY conversation_id, created_at DESC, id DESC
+        ) AS latest
+        WHERE latest.conversation_id = c.id
+    """)
+
+    op.create_index(
+        'ix_conversations_inbox',
+        'conversations',
+        ['workspace_id', 'status', 'last_message_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversations_inbox', table_name='conversations')
+    op.drop_column('conversations', 'last_message_channel')
+    op.drop_column('conversations', 'last_message_direction')
+    op.drop_column('conversations', 'last_message_preview')
@@ -0,0 +1,28 @@
+"""Index messages for keyset pagination of conversation history
+
+Revision ID: message_history_001
+Revises: conversation_inbox_001
+Create Date: 2026-02-25 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'message_history_001'
+down_revision = 'conversation_inbox_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_conversation_created',
+        'messages',
+        ['conversation_id', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_conversation_created', table_name='messages')
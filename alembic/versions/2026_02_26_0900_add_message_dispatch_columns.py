@@ -0,0 +1,33 @@
+"""Track outbound message dispatch on messages
+
+Revision ID: message_dispatch_001
+Revises: message_history_001
+Create Date: 2026-02-26 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'message_dispatch_001'
+down_revision = 'message_history_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('messages', sa.Column('dispatched_at', sa.DateTime(), nullable=True))
+    op.add_column('messages', sa.Column('error', sa.Text(), nullable=True))
+    op.create_index(
+        'ix_messages_dispatch_pending',
+        'messages',
+        ['status', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('queued', 'sending')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_dispatch_pending', table_name='messages')
+    op.drop_column('messages', 'error')
+    op.drop_column('messages', 'dispatched_at')
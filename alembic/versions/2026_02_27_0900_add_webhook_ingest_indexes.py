@@ -0,0 +1,36 @@
+"""Add indexes for matching provider webhooks to messages and contacts
+
+Revision ID: webhook_ingest_001
+Revises: message_dispatch_001
+Create Date: 2026-02-27 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'webhook_ingest_001'
+down_revision = 'message_dispatch_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_external_id',
+        'messages',
+        ['external_id'],
+        unique=False,
+        postgresql_where=sa.text('external_id IS NOT NULL')
+    )
+    op.create_index(
+        'ix_contacts_workspace_phone_digits',
+        'contacts',
+        ['workspace_id', sa.text("right(regexp_replace(phone, '\\D', '', 'g'), 10)")],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_workspace_phone_digits', table_name='contacts')
+    op.drop_index('ix_messages_external_id', table_name='messages')
@@ -0,0 +1,31 @@
+"""Track provider status lookups for sent messages
+
+Revision ID: message_status_reconcile_001
+Revises: webhook_ingest_001
+Create Date: 2026-02-28 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'message_status_reconcile_001'
+down_revision = 'webhook_ingest_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('messages', sa.Column('status_checked_at', sa.DateTime(), nullable=True))
+    op.create_index(
+        'ix_messages_status_pending',
+        'messages',
+        ['dispatched_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'sent'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_status_pending', table_name='messages')
+    op.drop_column('messages', 'status_checked_at')
@@ -0,0 +1,52 @@
+"""Add calendar sync state and mirrored external busy intervals
+
+Revision ID: calendar_sync_001
+Revises: message_status_reconcile_001
+Create Date: 2026-03-01 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'calendar_sync_001'
+down_revision = 'message_status_reconcile_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('sync_token', sa.String(), nullable=True))
+    op.add_column('integrations', sa.Column('last_synced_at', sa.DateTime(), nullable=True))
+    op.add_column('bookings', sa.Column('external_event_id', sa.String(), nullable=True))
+
+    op.create_table(
+        'external_busy_intervals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('integration_id', sa.Integer(), nullable=False),
+        sa.Column('external_event_id', sa.String(), nullable=False),
+        sa.Column('start_at', sa.DateTime(), nullable=False),
+        sa.Column('end_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['integration_id'], ['integrations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('integration_id', 'external_event_id', name='uq_external_busy_intervals_integration_event')
+    )
+    op.create_index(op.f('ix_external_busy_intervals_id'), 'external_busy_intervals', ['id'], unique=False)
+    op.create_index(
+        'ix_external_busy_intervals_workspace_start',
+        'external_busy_intervals',
+        ['workspace_id', 'start_at', 'end_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_external_busy_intervals_workspace_start', table_name='external_busy_intervals')
+    op.drop_index(op.f('ix_external_busy_intervals_id'), table_name='external_busy_intervals')
+    op.drop_table('external_busy_intervals')
+    op.drop_column('bookings', 'external_event_id')
+    op.drop_column('integrations', 'last_synced_at')
+    op.drop_column('integrations', 'sync_token')
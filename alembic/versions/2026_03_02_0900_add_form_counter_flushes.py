@@ -0,0 +1,28 @@
+"""Record applied form counter flushes
+
+Revision ID: form_counter_flushes_001
+Revises: calendar_sync_001
+Create Date: 2026-03-02 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'form_counter_flushes_001'
+down_revision = 'calendar_sync_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'form_counter_flushes',
+        sa.Column('flush_id', sa.String(), nullable=False),
+        sa.Column('applied_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('flush_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('form_counter_flushes')
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace
 from app.schemas.alert import AlertResponse
 from app.services.alert_service import AlertService
@@ -18,7 +18,7 @@ async def list_alerts(
     status: str = Query("active"),
     severity: str = Query("all"),
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List alerts"""
     return await alert_service.list_alerts(db, workspace.id, skip, limit, status, severity)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace, check_booking_permission
 from app.schemas.booking import BookingResponse, BookingCreate, BookingUpdate
 from app.services.booking_service import BookingService
@@ -21,7 +21,7 @@ async def list_bookings(
     date_to: Optional[date] = None,
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_booking_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List bookings"""
     return await booking_service.list_bookings(db, workspace.id, skip, limit, status, date_from, date_to)
@@ -40,7 +40,7 @@ async def create_booking(
 async def get_todays_bookings(
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_booking_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get today's bookings"""
     return await booking_service.get_todays_bookings(db, workspace.id)
@@ -50,7 +50,7 @@ async def get_upcoming_bookings(
     days: int = Query(7, ge=1, le=30),
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_booking_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get upcoming bookings"""
     return await booking_service.get_upcoming_bookings(db, workspace.id, days)
@@ -60,7 +60,7 @@ async def get_booking(
     booking_id: int,
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_booking_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get booking details"""
     return await booking_service.get_booking(db, booking_id, workspace.id)
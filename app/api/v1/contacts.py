@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace, check_inbox_permission
-from app.schemas.contact import ContactResponse, ContactCreate, ContactUpdate
-from app.services.contact_service import ContactService
+from app.schemas.contact import ContactResponse, ContactCreate, ContactUpdate, ContactImportResponse
+from app.services.contact_service import ContactService, iter_import_rows
 from app.models.workspace import Workspace
 from app.models.user import User
 
@@ -18,7 +18,7 @@ async def list_contacts(
     search: Optional[str] = None,
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_inbox_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List contacts"""
     return await contact_service.list_contacts(db, workspace.id, skip, limit, search)
@@ -33,12 +33,33 @@ async def create_contact(
     """Create contact"""
     return await contact_service.create_contact(db, workspace.id, contact_data)
 
+@router.post("/import", response_model=ContactImportResponse)
+async def import_contacts(
+    file: UploadFile = File(...),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: User = Depends(check_inbox_permission),
+    db: Session = Depends(get_db)
+):
+    """Bulk import contacts from a CSV or JSON lines file
+    
+    Columns: full_name (or name), email, phone, preferred_channel. Contacts whose
+    email already exists in the workspace are skipped. Errors name the
+    spreadsheet row (CSV, the first row under the header is 2) or the line
+    number (JSON lines).
+    """
+    filename = file.filename or ""
+    if not filename.lower().endswith((".csv", ".jsonl", ".ndjson")):
+        raise HTTPException(status_code=400, detail="Upload a .csv or .jsonl file")
+    
+    rows = iter_import_rows(file.file, filename)
+    return await contact_service.import_contacts(db, workspace.id, rows)
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: int,
     workspace: Workspace = Depends(get_current_workspace),
     current_user: User = Depends(check_inbox_permission),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get contact details"""
     return await contact_service.get_contact(db, contact_id, workspace.id)
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.database import get_db
 from app.api.deps import get_current_workspace, check_inbox_permission
-from app.schemas.conversation import ConversationResponse, ConversationDetail, MessageSend
+from app.schemas.conversation import ConversationInboxItem, ConversationDetail, MessagePage, MessageSend
 from app.services.conversation_service import ConversationService
 from app.models.workspace import Workspace
 from app.models.user import User
@@ -11,7 +11,7 @@ from app.models.user import User
 router = APIRouter()
 conversation_service = ConversationService()
 
-@router.get("/", response_model=List[ConversationResponse])
+@router.get("/", response_model=List[ConversationInboxItem])
 async def list_conversations(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -20,9 +20,19 @@ async def list_conversations(
     current_user: User = Depends(check_inbox_permission),
     db: Session = Depends(get_db)
 ):
-    """List conversations"""
+    """List conversations with contact and last message preview"""
     return await conversation_service.list_conversations(db, workspace.id, skip, limit, status)
 
+# Declared before /{conversation_id} so "unread" isn't parsed as an ID
+@router.get("/unread", response_model=Dict[str, Any])
+async def get_unread_count(
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: User = Depends(check_inbox_permission),
+    db: Session = Depends(get_db)
+):
+    """Get unread message count"""
+    return await conversation_service.get_unread_count(db, workspace.id)
+
 @router.get("/{conversation_id}", response_model=ConversationDetail)
 async def get_conversation(
     conversation_id: int,
@@ -33,6 +43,18 @@ async def get_conversation(
     """Get conversation with messages"""
     return await conversation_service.get_conversation_detail(db, conversation_id, workspace.id)
 
+@router.get("/{conversation_id}/messages", response_model=MessagePage)
+async def list_messages(
+    conversation_id: int,
+    before: Optional[int] = Query(None, description="Return messages older than this message ID"),
+    limit: int = Query(50, ge=1, le=200),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: User = Depends(check_inbox_permission),
+    db: Session = Depends(get_db)
+):
+    """Get message history, newest page first"""
+    return await conversation_service.list_messages(db, conversation_id, workspace.id, before, limit)
+
 @router.post("/{conversation_id}/messages")
 async def send_message(
     conversation_id: int,
@@ -53,12 +75,3 @@ async def pause_automation(
 ):
     """Pause automation for conversation"""
     return await conversation_service.pause_automation(db, conversation_id, workspace.id)
-
-@router.get("/unread", response_model=Dict[str, Any])
-async def get_unread_count(
-    workspace: Workspace = Depends(get_current_workspace),
-    current_user: User = Depends(check_inbox_permission),
-    db: Session = Depends(get_db)
-):
-    """Get unread message count"""
-    return await conversation_service.get_unread_count(db, workspace.id)
\ No newline at end of file
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import List
+from app.database import get_db, get_read_db
+from app.api.deps import get_current_user, get_current_workspace
+from app.schemas.export import ExportJobCreate, ExportJobResponse
+from app.services.export_job_service import ExportJobService
+from app.services.export_service import CONTENT_TYPES
+from app.models.workspace import Workspace
+from app.models.user import User
+
+router = APIRouter()
+export_job_service = ExportJobService()
+
+@router.post("/", response_model=ExportJobResponse, status_code=202)
+async def create_export(
+    job_data: ExportJobCreate,
+    current_user: User = Depends(get_current_user),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Start a background export; progress is pushed as `export_progress` events"""
+    return await export_job_service.create_job(db, workspace.id, current_user.id, job_data)
+
+@router.get("/", response_model=List[ExportJobResponse])
+async def list_exports(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """List export jobs"""
+    return await export_job_service.list_jobs(db, workspace.id, skip, limit)
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+async def get_export(
+    job_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """Get export job status"""
+    return await export_job_service.get_job(db, job_id, workspace.id)
+
+@router.get("/{job_id}/download")
+async def download_export(
+    job_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Download a completed export"""
+    job = await export_job_service.get_job(db, job_id, workspace.id)
+    body = export_job_service.iter_download(job)
+    
+    return StreamingResponse(
+        body,
+        media_type=CONTENT_TYPES[job.format],
+        headers={"Content-Disposition": f'attachment; filename="{export_job_service.download_filename(job)}"'}
+    )
+
+@router.delete("/{job_id}")
+async def delete_export(
+    job_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Delete export job and its file"""
+    await export_job_service.delete_job(db, job_id, workspace.id)
+    return {"message": "Export deleted"}
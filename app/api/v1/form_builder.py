@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace, get_current_owner
 from app.schemas.form import (
     FormCreateCustom, FormCreateExternal, FormCreateDocument, FormUpdate,
@@ -10,6 +12,9 @@ from app.schemas.form import (
     FormSubmissionListResponse, FormAnalytics
 )
 from app.services.form_builder_service import FormBuilderService
+from app.services.export_service import ExportService, CONTENT_TYPES, iter_file
+from app.utils.responses import validated_model_response
+from app.models.form import Form
 from app.models.workspace import Workspace
 from app.models.user import User
 
@@ -25,7 +30,7 @@ async def list_forms(
     form_type: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List all forms for the workspace"""
     forms = await form_service.list_forms(
@@ -34,12 +39,13 @@ async def list_forms(
     
     total = len(forms)  # You may want to implement proper count query
     
-    return FormListResponse(
+    # Items were validated in bulk by the service; skip response_model re-validation
+    return validated_model_response(FormListResponse.model_construct(
         forms=forms,
         total=total,
         page=page,
         per_page=per_page
-    )
+    ))
 
 @router.post("/custom", response_model=FormResponse)
 async def create_custom_form(
@@ -84,7 +90,7 @@ async def create_document_form(
 async def get_form(
     form_id: int,
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get form details"""
     return await form_service.get_form(db, form_id, workspace.id)
@@ -132,7 +138,7 @@ async def delete_form(
 async def get_form_analytics(
     form_id: int,
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get form analytics"""
     return await form_service.get_form_analytics(db, form_id, workspace.id)
@@ -147,7 +153,7 @@ async def list_submissions(
     status: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List form submissions"""
     submissions = await form_service.list_submissions(
@@ -156,18 +162,19 @@ async def list_submissions(
     
     total = len(submissions)  # Implement proper count query
     
-    return FormSubmissionListResponse(
+    # Items were validated in bulk by the service; skip response_model re-validation
+    return validated_model_response(FormSubmissionListResponse.model_construct(
         submissions=submissions,
         total=total,
         page=page,
         per_page=per_page
-    )
+    ))
 
 @router.get("/submissions/{submission_id}", response_model=CustomFormSubmissionResponse)
 async def get_submission(
     submission_id: int,
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get submission details"""
     return await form_service.get_submission(db, submission_id, workspace.id)
@@ -204,9 +211,32 @@ async def export_form_submissions(
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db)
 ):
-    """Export form submissions to CSV, Excel, or JSON"""
-    # Implementation for exporting submissions
-    return {"message": f"Exporting form {form_id} submissions as {format}"}
+    """Export form submissions to CSV, Excel, or JSON
+
+    Rows are streamed from a server-side cursor with one column per form field.
+    """
+    form = db.query(Form).filter(
+        Form.id == form_id, Form.workspace_id == workspace.id
+    ).first()
+    if not form:
+        raise HTTPException(status_code=404, detail="Form not found")
+
+    export_service = ExportService(db)
+    extension = "xlsx" if format == "excel" else format
+    headers = {
+        "Content-Disposition": f'attachment; filename="{export_service.export_filename(form, extension)}"'
+    }
+
+    if format == "csv":
+        body = export_service.stream_submissions_csv(form)
+    elif format == "json":
+        body = export_service.stream_submissions_json(form)
+    else:
+        # xlsx is a zip archive, so it is built in a temp file before streaming
+        path = await run_in_threadpool(export_service.write_submissions_xlsx, form)
+        body = iter_file(path, remove=True)
+
+    return StreamingResponse(body, media_type=CONTENT_TYPES[extension], headers=headers)
 
 # Advanced Features
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace, get_current_owner
 from app.schemas.inventory import InventoryItemResponse, InventoryItemCreate, InventoryItemUpdate
 from app.services.inventory_service import InventoryService
@@ -14,7 +14,7 @@ inventory_service = InventoryService()
 @router.get("/", response_model=List[InventoryItemResponse])
 async def list_inventory(
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List inventory items"""
     return await inventory_service.list_items(db, workspace.id)
@@ -32,7 +32,7 @@ async def add_inventory_item(
 @router.get("/alerts")
 async def get_low_stock_alerts(
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
     """Get low stock alerts"""
     return await inventory_service.get_low_stock_alerts(db, workspace.id)
@@ -41,7 +41,7 @@ async def get_low_stock_alerts(
 async def get_inventory_item(
     item_id: int,
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get inventory item details"""
     return await inventory_service.get_item(db, item_id, workspace.id)
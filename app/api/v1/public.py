@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import Dict, Any
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.contact import ContactFormSubmission
 from app.schemas.booking import PublicBookingCreate, BookingResponse
 from app.services.contact_service import ContactService
 from app.services.booking_service import BookingService
 from app.services.workspace_service import WorkspaceService
+from app.utils.response_cache import CachedResponse, response_cache, workspace_tag
 
 router = APIRouter()
 contact_service = ContactService()
@@ -31,10 +32,16 @@ async def submit_contact_form(
 async def get_booking_page(
     workspace_slug: str,
     service_slug: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
-    """Get booking page data (public)"""
-    return await booking_service.get_public_booking_data(db, workspace_slug, service_slug)
+    """Get booking page data (public, cached until the workspace or service changes)"""
+    async def load() -> CachedResponse:
+        data = await booking_service.get_public_booking_data(db, workspace_slug, service_slug)
+        return CachedResponse.json(data, [workspace_tag(data["workspace"]["id"])])
+    
+    entry = await response_cache.get_or_load(f"booking:{workspace_slug}:{service_slug}", load)
+    return response_cache.respond(request, entry)
 
 @router.post("/booking/{workspace_slug}/{service_slug}", response_model=BookingResponse)
 async def create_booking(
@@ -5,6 +5,7 @@ from app.schemas.form import (
     PublicFormResponse, FormSubmissionCreate, CustomFormSubmissionResponse
 )
 from app.services.form_builder_service import FormBuilderService
+from app.utils.response_cache import CachedResponse, response_cache, workspace_tag
 
 router = APIRouter()
 form_service = FormBuilderService()
@@ -12,11 +13,20 @@ form_service = FormBuilderService()
 @router.get("/forms/{share_link}", response_model=PublicFormResponse)
 async def get_public_form(
     share_link: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Get form by public share link (no authentication required)"""
     share_link = f"/f/{share_link}"  # Ensure proper format
-    return await form_service.get_public_form(db, share_link)
+    
+    async def load() -> CachedResponse:
+        form = await form_service.get_public_form_entry(db, share_link, use_cache=False)
+        return CachedResponse.json(form.response.model_dump(), [workspace_tag(form.workspace_id)], form_id=form.form_id)
+    
+    entry = await response_cache.get_or_load(f"form:{share_link}", load)
+    # Cached and revalidated (304) loads still count as views
+    form_service.record_view(db, entry.meta["form_id"])
+    return response_cache.respond(request, entry)
 
 @router.post("/forms/{share_link}/submit", response_model=CustomFormSubmissionResponse)
 async def submit_form(
@@ -58,40 +68,9 @@ async def validate_form_field(
     """Validate specific form field (for real-time validation)"""
     share_link = f"/f/{share_link}"
     
-    # Get form to access validation rules
-    try:
-        form = await form_service.get_public_form(db, share_link)
-    except HTTPException:
-        raise HTTPException(status_code=404, detail="Form not found")
-    
-    # Validate field against form rules
-    errors = {}
-    for field_id, value in field_data.items():
-        # Find field in form
-        field_config = None
-        for field in form.fields:
-            if field["id"] == field_id:
-                field_config = field
-                break
-        
-        if not field_config:
-            continue
-        
-        # Validate required fields
-        if field_config.get("required", False) and not value:
-            errors[field_id] = "This field is required"
-        
-        # Validate field-specific rules
-        validation_rules = field_config.get("validation", [])
-        for rule in validation_rules:
-            if rule["type"] == "min" and len(str(value)) < rule["value"]:
-                errors[field_id] = rule["message"]
-            elif rule["type"] == "max" and len(str(value)) > rule["value"]:
-                errors[field_id] = rule["message"]
-            elif rule["type"] == "pattern":
-                import re
-                if not re.match(rule["value"], str(value)):
-                    errors[field_id] = rule["message"]
+    # Cached definition: no view count bump, no refetch, rules already compiled
+    entry = await form_service.get_public_form_entry(db, share_link)
+    errors = entry.validator.validate(field_data, partial=True)
     
     return {"valid": len(errors) == 0, "errors": errors}
 
@@ -99,15 +78,25 @@ async def validate_form_field(
 @router.get("/forms/{share_link}/embed")
 async def get_embed_form(
     share_link: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Get embeddable form HTML (for iframe)"""
     share_link = f"/f/{share_link}"
     
-    form = await form_service.get_public_form(db, share_link)
+    async def load() -> CachedResponse:
+        form = await form_service.get_public_form_entry(db, share_link, use_cache=False)
+        return CachedResponse.html(
+            _render_embed(form.response, share_link), [workspace_tag(form.workspace_id)], form_id=form.form_id
+        )
     
+    entry = await response_cache.get_or_load(f"form-embed:{share_link}", load)
+    form_service.record_view(db, entry.meta["form_id"])
+    return response_cache.respond(request, entry)
+
+def _render_embed(form: PublicFormResponse, share_link: str) -> str:
     # Return minimal HTML for embedding
-    html = f"""
+    return f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -139,6 +128,3 @@ async def get_embed_form(
     </body>
     </html>
     """
-    
-    from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=html)
\ No newline at end of file
@@ -2,20 +2,23 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from datetime import date
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_workspace, get_current_owner
 from app.schemas.service import ServiceResponse, ServiceCreate, ServiceUpdate
+from app.schemas.inventory import ServiceInventoryResponse, ServiceInventoryUpdate
 from app.services.booking_service import BookingService
+from app.services.inventory_service import InventoryService
 from app.models.workspace import Workspace
 from app.models.user import User
 
 router = APIRouter()
 booking_service = BookingService()
+inventory_service = InventoryService()
 
 @router.get("/", response_model=List[ServiceResponse])
 async def list_services(
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List services"""
     return await booking_service.list_services(db, workspace.id)
@@ -34,7 +37,7 @@ async def create_service(
 async def get_service(
     service_id: int,
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get service details"""
     return await booking_service.get_service(db, service_id, workspace.id)
@@ -66,7 +69,40 @@ async def get_availability(
     service_id: int,
     booking_date: date = Query(...),
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
     """Get available time slots for a service on a specific date"""
-    return await booking_service.get_availability(db, service_id, workspace.id, booking_date)
\ No newline at end of file
+    return await booking_service.get_availability(db, service_id, workspace.id, booking_date)
+
+@router.get("/{service_id}/inventory", response_model=List[ServiceInventoryResponse])
+async def list_service_inventory(
+    service_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """List inventory items reserved for each booking of a service"""
+    return await inventory_service.list_service_items(db, service_id, workspace.id)
+
+@router.put("/{service_id}/inventory/{item_id}", response_model=ServiceInventoryResponse)
+async def set_service_inventory_item(
+    service_id: int,
+    item_id: int,
+    link_data: ServiceInventoryUpdate,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: User = Depends(get_current_owner),
+    db: Session = Depends(get_db)
+):
+    """Set how much of an inventory item each booking of a service uses"""
+    return await inventory_service.set_service_item(db, service_id, item_id, workspace.id, link_data)
+
+@router.delete("/{service_id}/inventory/{item_id}")
+async def remove_service_inventory_item(
+    service_id: int,
+    item_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: User = Depends(get_current_owner),
+    db: Session = Depends(get_db)
+):
+    """Stop reserving an inventory item for a service's bookings"""
+    await inventory_service.remove_service_item(db, service_id, item_id, workspace.id)
+    return {"message": "Inventory item removed from service"}
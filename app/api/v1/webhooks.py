@@ -0,0 +1,129 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Tuple
+import logging
+import orjson
+import redis
+from app.config import settings
+from app.database import get_db
+from app.integrations.base import BaseIntegration
+from app.integrations.email.sendgrid import SendGridIntegration
+from app.integrations.registry import integration_registry
+from app.integrations.sms.twilio import TwilioIntegration
+from app.services.webhook_ingest import (
+    webhook_ingest_service,
+    twilio_status_event,
+    twilio_inbound_event,
+    sendgrid_status_events,
+    sendgrid_inbound_event
+)
+from app.tasks.message_tasks import process_webhook_events
+from app.utils.exceptions import BadRequestException, ForbiddenException, NotFoundException
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Twilio reads the reply to an incoming SMS as TwiML; an empty response sends nothing back
+EMPTY_TWIML = '<?xml version="1.0" encoding="UTF-8"?><Response></Response>'
+
+
+def _provider_client(db: Session, integration_id: int, provider_class: type) -> Tuple[int, BaseIntegration]:
+    workspace_id, client = integration_registry.get_client_by_id(db, integration_id)
+    if not isinstance(client, provider_class):
+        raise NotFoundException("Integration not found")
+    return workspace_id, client
+
+
+def _enqueue(events: List[Dict[str, Any]]):
+    """Buffer events for the drain task; 503 makes the provider retry if Redis is down"""
+    try:
+        schedule = webhook_ingest_service.enqueue(events)
+    except redis.RedisError as e:
+        logger.error(f"Could not buffer {len(events)} webhook events: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Try again later")
+
+    if schedule:
+        try:
+            process_webhook_events.apply_async(countdown=settings.WEBHOOK_FLUSH_DELAY_SECONDS)
+        except Exception as e:
+            logger.warning(f"Could not schedule webhook drain, leaving it for the beat run: {str(e)}")
+
+
+async def _verified_twilio_params(request: Request, client: TwilioIntegration) -> Dict[str, str]:
+    params = {key: value for key, value in (await request.form()).items() if isinstance(value, str)}
+
+    # Twilio signs the public URL it was configured with, not the one we see behind the proxy
+    url = settings.BACKEND_URL.rstrip("/") + request.url.path
+    if request.url.query:
+        url += "?" + request.url.query
+
+    if not client.verify_webhook_signature(url, params, request.headers.get("X-Twilio-Signature", "")):
+        raise ForbiddenException("Invalid signature")
+    return params
+
+
+@router.post("/twilio/{integration_id}/sms")
+async def twilio_incoming_sms(integration_id: int, request: Request, db: Session = Depends(get_db)):
+    """Incoming SMS to a Twilio number"""
+    workspace_id, client = _provider_client(db, integration_id, TwilioIntegration)
+    params = await _verified_twilio_params(request, client)
+
+    event = twilio_inbound_event(workspace_id, params)
+    if event:
+        _enqueue([event])
+    return Response(content=EMPTY_TWIML, media_type="text/xml")
+
+
+@router.post("/twilio/{integration_id}/status")
+async def twilio_status_callback(integration_id: int, request: Request, db: Session = Depends(get_db)):
+    """Delivery status callback for an outbound SMS"""
+    workspace_id, client = _provider_client(db, integration_id, TwilioIntegration)
+    params = await _verified_twilio_params(request, client)
+
+    event = twilio_status_event(workspace_id, params)
+    if event:
+        _enqueue([event])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/sendgrid/{integration_id}/events")
+async def sendgrid_event_webhook(integration_id: int, request: Request, db: Session = Depends(get_db)):
+    """SendGrid Event Webhook (batched delivery events, signed)"""
+    workspace_id, client = _provider_client(db, integration_id, SendGridIntegration)
+    body = await request.body()
+
+    if not client.verify_event_signature(
+        body,
+        request.headers.get("X-Twilio-Email-Event-Webhook-Signature", ""),
+        request.headers.get("X-Twilio-Email-Event-Webhook-Timestamp", "")
+    ):
+        raise ForbiddenException("Invalid signature")
+
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise BadRequestException("Invalid JSON")
+    if not isinstance(payload, list):
+        raise BadRequestException("Expected a list of events")
+
+    _enqueue(sendgrid_status_events(workspace_id, payload))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/sendgrid/{integration_id}/inbound")
+async def sendgrid_inbound_parse(
+    integration_id: int,
+    request: Request,
+    token: str = "",
+    db: Session = Depends(get_db)
+):
+    """SendGrid Inbound Parse (incoming email, authenticated by the token in the configured URL)"""
+    workspace_id, client = _provider_client(db, integration_id, SendGridIntegration)
+    if not client.verify_inbound_token(token):
+        raise ForbiddenException("Invalid token")
+
+    form = {key: value for key, value in (await request.form()).items() if isinstance(value, str)}
+    event = sendgrid_inbound_event(workspace_id, form)
+    if event:
+        _enqueue([event])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import Dict, Any
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.api.deps import get_current_user, get_current_workspace, get_current_owner
 from app.schemas.workspace import WorkspaceResponse, WorkspaceUpdate
 from app.services.workspace_service import WorkspaceService
@@ -38,7 +38,7 @@ async def activate_workspace(
 @router.get("/dashboard")
 async def get_dashboard_data(
     workspace: Workspace = Depends(get_current_workspace),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
     """Get dashboard data"""
     return await workspace_service.get_dashboard_data(db, workspace.id)
\ No newline at end of file
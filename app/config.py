@@ -5,11 +5,26 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10  # Connections kept open per process
+    DB_MAX_OVERFLOW: int = 20  # Extra connections opened under load, closed when returned
+    DB_POOL_TIMEOUT_SECONDS: int = 30  # Wait for a free connection before failing the request
+    DB_POOL_RECYCLE_SECONDS: int = 30 * 60  # Replace connections older than this (-1 never)
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout; drops ones the server or a proxy closed
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # Server-side statement_timeout (0 disables)
+    DB_ECHO: bool = False  # Log every SQL statement
+    DB_PGBOUNCER: bool = False  # Behind PgBouncer in transaction mode: no session-level settings
+    DB_NULL_POOL: bool = False  # Don't pool in-process (let PgBouncer pool); pool sizes are ignored
+    DATABASE_REPLICA_URL: str = ""  # Streaming replica for read-only endpoints; empty reads from the primary
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5  # Reads fall back to the primary while the replica is further behind
+    DATABASE_REPLICA_LAG_CHECK_SECONDS: int = 5  # How often each process re-measures replica lag
+    DATABASE_REPLICA_CONNECT_TIMEOUT_SECONDS: int = 2
+    DATABASE_REPLICA_STICKY_SECONDS: int = 10  # Reads go to the primary this long after the client writes (keep above max lag)
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
+    CREDENTIALS_ENCRYPTION_KEY: str = ""  # Fernet key for integration credentials; derived from SECRET_KEY if empty
     
     # Redis
     REDIS_URL: str
@@ -27,6 +42,9 @@ class Settings(BaseSettings):
     # Google Calendar
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
+    GOOGLE_OAUTH_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_CALENDAR_API_URL: str = "https://www.googleapis.com/calendar/v3"  # Point both at scripts/fake_google_calendar.py to test locally
+    GOOGLE_CALENDAR_BATCH_URL: str = "https://www.googleapis.com/batch/calendar/v3"
     
     # Supabase
     SUPABASE_URL: str = ""
@@ -50,6 +68,63 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     
+    # Exports
+    EXPORT_STORAGE_BACKEND: str = "local"  # local or supabase
+    EXPORT_STORAGE_DIR: str = "storage/exports"  # Must be shared by API and workers
+    EXPORT_STORAGE_BUCKET: str = "exports"
+    EXPORT_CHUNK_ROWS: int = 10000
+    EXPORT_TASK_BUDGET_SECONDS: int = 15 * 60  # Re-enqueue before the Celery time limit
+    EXPORT_STALE_AFTER_SECONDS: int = 10 * 60  # Running jobs without a heartbeat this long are requeued
+    EXPORT_RETENTION_HOURS: int = 72
+    
+    # Outbound messages
+    DISPATCH_BATCH_SIZE: int = 100  # Message IDs per dispatch task
+    DISPATCH_CONCURRENCY: int = 20  # Concurrent provider requests (and pooled connections) per task
+    DISPATCH_TIMEOUT_SECONDS: int = 30
+    DISPATCH_REQUEUE_AFTER_SECONDS: int = 60  # Queued messages older than this are re-enqueued by the sweep
+    DISPATCH_STALE_AFTER_SECONDS: int = 10 * 60  # Claimed but unfinished this long: fail rather than risk resending
+    
+    STATUS_RECONCILE_AFTER_SECONDS: int = 5 * 60  # Give delivery callbacks this long before polling
+    STATUS_RECONCILE_INTERVAL_SECONDS: int = 15 * 60  # Between lookups of the same message
+    STATUS_RECONCILE_MAX_AGE_HOURS: int = 24  # Stop polling messages sent longer ago than this
+    STATUS_RECONCILE_PAGE_SIZE: int = 500
+    STATUS_RECONCILE_BUDGET_SECONDS: int = 4 * 60  # Per run; the next beat run picks up the rest
+    
+    # Integration health checks
+    INTEGRATION_HEALTH_TTL_SECONDS: int = 15 * 60  # Cached results outlive a few check intervals
+    INTEGRATION_HEALTH_CONCURRENCY: int = 10
+    INTEGRATION_HEALTH_TIMEOUT_SECONDS: int = 10  # Per integration; a hung provider counts as failed
+    
+    # Calendar sync
+    CALENDAR_SYNC_CONCURRENCY: int = 10  # Calendars read at once per sync run
+    CALENDAR_SYNC_TIMEOUT_SECONDS: int = 60
+    CALENDAR_SYNC_LOOKBACK_DAYS: int = 1  # Busy time older than this is neither fetched nor kept
+    
+    # Provider webhooks
+    WEBHOOK_BATCH_SIZE: int = 500  # Queued callbacks processed per transaction
+    WEBHOOK_FLUSH_DELAY_SECONDS: int = 1  # Callbacks arriving within this window share one drain task
+    WEBHOOK_DRAIN_LOCK_SECONDS: int = 5 * 60
+    
+    # Form counters
+    FORM_COUNTER_FLUSH_LOCK_SECONDS: int = 5 * 60
+    FORM_COUNTER_FLUSH_RETENTION_HOURS: int = 24  # Applied flush IDs kept to skip replays of a resumed flush
+    
+    # Caching
+    PUBLIC_FORM_CACHE_TTL_SECONDS: int = 60
+    SLUG_CACHE_TTL_SECONDS: int = 10 * 60  # Workspace/service slug -> ID (slugs never change)
+    RESPONSE_CACHE_TTL_SECONDS: int = 10 * 60  # Shared public page responses; purged when their workspace changes
+    RESPONSE_CACHE_LOCAL_TTL_SECONDS: int = 5  # Per-process copies, may outlive a purge by this long
+    RESPONSE_CACHE_CONTROL: str = "public, no-cache"  # Browsers revalidate with If-None-Match and get 304s
+    
+    # WebSockets
+    WS_USER_CACHE_TTL_SECONDS: int = 300  # Cached user lookups for tokens without workspace claim
+    WS_SERVER_LOGGING: bool = False  # Socket.IO/Engine.IO internal logging (very verbose)
+    WS_EMIT_WINDOW_MS: int = 50  # Events to the same room within this window share one frame
+    WS_MAX_FLUSHES_PER_SECOND: int = 5  # Per-room frame rate cap
+    WS_MAX_EVENTS_PER_FRAME: int = 200
+    WS_MAX_PENDING_EVENTS: int = 5000  # Per-room buffer cap; oldest events are dropped beyond this
+    WS_REDIS_MESSAGE_QUEUE: bool = True  # Relay emits through Redis pub/sub so workers can reach clients
+    
     @property
     def cors_origins_list(self) -> List[str]:
         if self.ENVIRONMENT == "production":
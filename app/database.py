@@ -1,19 +1,152 @@
-from sqlalchemy import create_engine
+from fastapi import Depends
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
+from typing import Any, Dict, Optional
+import logging
+import threading
+import time
 from app.config import settings
+from app.utils.read_routing import primary_required
+
+logger = logging.getLogger(__name__)
+
+
+def _engine_options(**connect_args: Any) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "echo": settings.DB_ECHO
+    }
+
+    if settings.DB_NULL_POOL:
+        # PgBouncer does the pooling; each checkout opens a (cheap) bouncer connection
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS
+        )
+
+    # Behind PgBouncer in transaction mode session settings don't stick (and
+    # startup options are rejected), so the timeout is set per transaction instead
+    options["connect_args"] = dict(connect_args)
+    if settings.DB_STATEMENT_TIMEOUT_MS and not settings.DB_PGBOUNCER:
+        options["connect_args"]["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    return options
+
+
+def _set_statement_timeout(connection):
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+
+
+def _create_engine(url: str, **connect_args: Any):
+    created = create_engine(url, **_engine_options(**connect_args))
+    if settings.DB_STATEMENT_TIMEOUT_MS and settings.DB_PGBOUNCER:
+        event.listen(created, "begin", _set_statement_timeout)
+    return created
+
 
 # Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG
+engine = _create_engine(settings.DATABASE_URL)
+
+# Read replica, used only through get_read_db(). Connects fail fast so a
+# down replica costs a read little more than going to the primary
+replica_engine = (
+    _create_engine(settings.DATABASE_REPLICA_URL, connect_timeout=settings.DATABASE_REPLICA_CONNECT_TIMEOUT_SECONDS)
+    if settings.DATABASE_REPLICA_URL else None
 )
 
+# Most connections checked out at once since startup, for sizing the pool
+_pool_peak = {"checked_out": 0}
+
+
+@event.listens_for(engine, "checkout")
+def _track_pool_peak(dbapi_connection, connection_record, connection_proxy):
+    if isinstance(engine.pool, QueuePool):
+        _pool_peak["checked_out"] = max(_pool_peak["checked_out"], engine.pool.checkedout())
+
+
+def pool_status() -> Dict[str, Any]:
+    """Connection pool usage in this process"""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    capacity = pool.size() + settings.DB_MAX_OVERFLOW
+    checked_out = pool.checkedout()
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "peak_checked_out": _pool_peak["checked_out"],
+        "saturation": round(checked_out / capacity, 2) if capacity else None
+    }
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine or engine)
+
+# Last measured replica lag, re-measured at most every DATABASE_REPLICA_LAG_CHECK_SECONDS
+_replica_lag = {"checked_at": float("-inf"), "lag_seconds": None}
+_replica_lock = threading.Lock()
+
+# Zero when everything received has been replayed, so an idle primary doesn't read as lag
+_REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+def replica_lag() -> Optional[float]:
+    """Replica replay lag in seconds, or None when it can't be reached"""
+    if replica_engine is None:
+        return None
+
+    if time.monotonic() - _replica_lag["checked_at"] < settings.DATABASE_REPLICA_LAG_CHECK_SECONDS:
+        return _replica_lag["lag_seconds"]
+
+    with _replica_lock:
+        if time.monotonic() - _replica_lag["checked_at"] < settings.DATABASE_REPLICA_LAG_CHECK_SECONDS:
+            return _replica_lag["lag_seconds"]
+        try:
+            with replica_engine.connect() as connection:
+                lag = float(connection.exec_driver_sql(_REPLICA_LAG_SQL).scalar())
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, reading from primary: {str(e)}")
+            lag = None
+        _replica_lag.update(checked_at=time.monotonic(), lag_seconds=lag)
+    return lag
+
+
+def use_replica() -> bool:
+    """Whether reads in this context can go to the replica"""
+    if replica_engine is None or primary_required():
+        return False
+    lag = replica_lag()
+    return lag is not None and lag <= settings.DATABASE_REPLICA_MAX_LAG_SECONDS
+
+
+def replica_status() -> Dict[str, Any]:
+    if replica_engine is None:
+        return {"configured": False}
+    lag = replica_lag()
+    return {
+        "configured": True,
+        "lag_seconds": lag,
+        "serving_reads": lag is not None and lag <= settings.DATABASE_REPLICA_MAX_LAG_SECONDS
+    }
+
 
 # Base class for models
 Base = declarative_base()
@@ -24,4 +157,22 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Dependency for read-only routes
+def get_read_db(db=Depends(get_db)):
+    """Session on the read replica, or the primary when there is none, it lags
+    by more than DATABASE_REPLICA_MAX_LAG_SECONDS, or the client wrote recently
+
+    On the primary this is the request's get_db() session (shared with the
+    auth dependencies), so a read holds one primary connection, not two.
+    """
+    if not use_replica():
+        yield db
+        return
+
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
@@ -1,12 +1,34 @@
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
+import aiohttp
+import copy
 
 
 class BaseIntegration(ABC):
     """Base class for all integrations"""
     
-    def __init__(self, credentials: Dict[str, Any]):
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
         self.credentials = credentials
+        self.http_session = http_session
+    
+    def with_session(self, http_session: aiohttp.ClientSession) -> "BaseIntegration":
+        """Shallow copy of this client that sends through the given pooled session"""
+        client = copy.copy(self)
+        client.http_session = http_session
+        return client
+    
+    @asynccontextmanager
+    async def _http(self):
+        """Yield the shared HTTP session if one was given, else a one-off session
+        
+        Batch senders pass a pooled session so requests reuse connections.
+        """
+        if self.http_session is not None:
+            yield self.http_session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
     
     @abstractmethod
     async def test_connection(self) -> bool:
@@ -17,6 +39,13 @@ class BaseIntegration(ABC):
     async def get_status(self) -> Dict[str, Any]:
         """Get current status of the integration"""
         pass
+    
+    async def fetch_message_status(self, external_id: str) -> Optional[Dict[str, Any]]:
+        """Provider status of a sent message as {"status", "error"}, None if unknown
+        
+        Providers without a lookup API keep this default.
+        """
+        return None
 
 
 class BaseEmailIntegration(BaseIntegration):
@@ -51,9 +80,10 @@ class BaseSMSIntegration(BaseIntegration):
     async def send_sms(
         self,
         to_phone: str,
-        message: str
+        message: str,
+        status_callback: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send an SMS message"""
+        """Send an SMS message, with delivery updates posted to status_callback if given"""
         pass
 
 
@@ -1,27 +1,161 @@
 from app.integrations.base import BaseCalendarIntegration
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+import json
+import time
+import uuid
+import aiohttp
+from app.config import settings
+
+# Google accepts up to 50 calls per calendar batch request
+BATCH_LIMIT = 50
+
+
+class SyncTokenExpired(Exception):
+    """The stored sync token was rejected (410 Gone); a full sync is required"""
 
 
 class GoogleCalendarIntegration(BaseCalendarIntegration):
-    """Google Calendar integration (placeholder implementation)"""
+    """Google Calendar integration"""
+    
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(credentials, http_session)
+        self.calendar_id = credentials.get("calendar_id", "primary")
+        
+        if not credentials.get("access_token") and not credentials.get("refresh_token"):
+            raise ValueError("access_token or refresh_token is required for Google Calendar")
+        
+        self.base_url = settings.GOOGLE_CALENDAR_API_URL.rstrip("/")
+        self.batch_url = settings.GOOGLE_CALENDAR_BATCH_URL
+        # Shared by copies from with_session(), so a refreshed token is reused by the cached client.
+        # A stored access token is used until it fails only when it can't be refreshed
+        self._token = {
+            "access_token": credentials.get("access_token"),
+            "expires_at": 0 if credentials.get("refresh_token") else float("inf")
+        }
+    
+    async def _access_token(self, session: aiohttp.ClientSession) -> str:
+        """Current access token, refreshed through the OAuth token endpoint when expired"""
+        if self._token["access_token"] and self._token["expires_at"] > time.time() + 60:
+            return self._token["access_token"]
+        
+        async with session.post(settings.GOOGLE_OAUTH_TOKEN_URL, data={
+            "grant_type": "refresh_token",
+            "refresh_token": self.credentials.get("refresh_token"),
+            "client_id": self.credentials.get("client_id") or settings.GOOGLE_CLIENT_ID,
+            "client_secret": self.credentials.get("client_secret") or settings.GOOGLE_CLIENT_SECRET
+        }) as response:
+            response.raise_for_status()
+            data = await response.json()
+        
+        self._token["access_token"] = data["access_token"]
+        self._token["expires_at"] = time.time() + int(data.get("expires_in", 3600))
+        return self._token["access_token"]
+    
+    async def _headers(self, session: aiohttp.ClientSession) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {await self._access_token(session)}",
+            "Content-Type": "application/json"
+        }
     
-    def __init__(self, credentials: Dict[str, Any]):
-        super().__init__(credentials)
-        # TODO: Initialize Google Calendar API client
-        pass
+    def _events_path(self, event_id: Optional[str] = None) -> str:
+        path = f"/calendars/{self.calendar_id}/events"
+        return f"{path}/{event_id}" if event_id else path
     
     async def test_connection(self) -> bool:
         """Test Google Calendar API connection"""
-        # TODO: Implement Google Calendar connection test
-        return True
+        try:
+            async with self._http() as session:
+                async with session.get(
+                    f"{self.base_url}/calendars/{self.calendar_id}",
+                    headers=await self._headers(session)
+                ) as response:
+                    return response.status == 200
+        except Exception:
+            return False
     
     async def get_status(self) -> Dict[str, Any]:
         """Get Google Calendar status"""
-        # TODO: Implement Google Calendar status check
-        return {
-            "status": "connected",
-            "message": "Google Calendar integration (placeholder)"
+        try:
+            async with self._http() as session:
+                async with session.get(
+                    f"{self.base_url}/calendars/{self.calendar_id}",
+                    headers=await self._headers(session)
+                ) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        return {
+                            "status": "connected",
+                            "calendar": data.get("summary"),
+                            "time_zone": data.get("timeZone")
+                        }
+                    else:
+                        return {
+                            "status": "error",
+                            "message": f"API returned status {response.status}"
+                        }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
+    async def list_events(
+        self,
+        sync_token: Optional[str] = None,
+        page_token: Optional[str] = None,
+        time_min: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """One page of events: everything from time_min, or only changes since sync_token
+        
+        The last page carries nextSyncToken for the next incremental sync.
+        Raises SyncTokenExpired when Google no longer accepts sync_token.
+        """
+        params = {"maxResults": "250", "singleEvents": "true"}
+        if sync_token:
+            params["syncToken"] = sync_token
+        elif time_min:
+            params["timeMin"] = time_min
+        if page_token:
+            params["pageToken"] = page_token
+        
+        async with self._http() as session:
+            async with session.get(
+                f"{self.base_url}{self._events_path()}",
+                headers=await self._headers(session),
+                params=params
+            ) as response:
+                if response.status == 410:
+                    raise SyncTokenExpired()
+                response.raise_for_status()
+                return await response.json()
+    
+    def event_body(
+        self,
+        title: str,
+        start_time: str,
+        end_time: str,
+        description: Optional[str] = None,
+        attendees: Optional[list] = None,
+        time_zone: Optional[str] = None,
+        private: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Event resource for start/end ISO datetimes (local to time_zone if they carry no offset)"""
+        body = {
+            "summary": title,
+            "start": {"dateTime": start_time},
+            "end": {"dateTime": end_time}
         }
+        if time_zone:
+            body["start"]["timeZone"] = time_zone
+            body["end"]["timeZone"] = time_zone
+        if description:
+            body["description"] = description
+        if attendees:
+            body["attendees"] = [{"email": email} for email in attendees]
+        if private:
+            body["extendedProperties"] = {"private": private}
+        return body
     
     async def create_event(
         self,
@@ -32,29 +166,130 @@ class GoogleCalendarIntegration(BaseCalendarIntegration):
         attendees: Optional[list] = None
     ) -> Dict[str, Any]:
         """Create calendar event"""
-        # TODO: Implement Google Calendar event creation
-        return {
-            "success": True,
-            "event_id": "placeholder_event_id",
-            "message": "Event created (placeholder)"
-        }
+        result = (await self.batch_events([{
+            "key": "create",
+            "method": "POST",
+            "body": self.event_body(title, start_time, end_time, description, attendees)
+        }]))["create"]
+        
+        if result["status"] not in (200, 201):
+            return {"success": False, "error": f"Google Calendar API error: {result['status']}"}
+        return {"success": True, "event_id": result["body"].get("id")}
     
     async def update_event(
         self,
         event_id: str,
         **kwargs
     ) -> Dict[str, Any]:
-        """Update calendar event"""
-        # TODO: Implement Google Calendar event update
-        return {
-            "success": True,
-            "message": "Event updated (placeholder)"
-        }
+        """Update calendar event (kwargs are event resource fields, e.g. summary, start, end)"""
+        result = (await self.batch_events([{
+            "key": "update",
+            "method": "PATCH",
+            "event_id": event_id,
+            "body": kwargs
+        }]))["update"]
+        
+        if result["status"] != 200:
+            return {"success": False, "error": f"Google Calendar API error: {result['status']}"}
+        return {"success": True, "event_id": event_id}
     
     async def delete_event(self, event_id: str) -> Dict[str, Any]:
         """Delete calendar event"""
-        # TODO: Implement Google Calendar event deletion
+        result = (await self.batch_events([{
+            "key": "delete",
+            "method": "DELETE",
+            "event_id": event_id
+        }]))["delete"]
+        
+        # Already gone counts as deleted
+        if result["status"] not in (200, 204, 404, 410):
+            return {"success": False, "error": f"Google Calendar API error: {result['status']}"}
+        return {"success": True}
+    
+    async def batch_events(self, operations: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Run event insert/patch/delete calls as multipart batch requests
+        
+        Each operation is {"key", "method" (POST, PATCH, DELETE), "event_id"
+        (PATCH/DELETE), "body" (POST/PATCH)}. Returns {key: {"status",
+        "body"}}; a failed call is reported in its status, never raised.
+        """
+        results = {}
+        async with self._http() as session:
+            for start in range(0, len(operations), BATCH_LIMIT):
+                chunk = operations[start:start + BATCH_LIMIT]
+                results.update(await self._send_batch(session, chunk))
+        return results
+    
+    async def _send_batch(
+        self,
+        session: aiohttp.ClientSession,
+        operations: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        api_path = urlparse(self.base_url).path
+        
+        parts = []
+        for operation in operations:
+            request = f"{operation['method']} {api_path}{self._events_path(operation.get('event_id'))}"
+            if operation["method"] == "DELETE":
+                request += "?sendUpdates=none"
+            part = (
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item-{operation['key']}>\r\n\r\n"
+                f"{request} HTTP/1.1\r\n"
+            )
+            if operation.get("body") is not None:
+                part += f"Content-Type: application/json\r\n\r\n{json.dumps(operation['body'])}"
+            parts.append(part + "\r\n")
+        payload = "".join(parts) + f"--{boundary}--\r\n"
+        
+        headers = await self._headers(session)
+        headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+        
+        async with session.post(self.batch_url, headers=headers, data=payload.encode()) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            body = await response.text()
+        
+        results = _parse_batch_response(body, content_type)
+        # Calls missing from the response are reported as failed
         return {
-            "success": True,
-            "message": "Event deleted (placeholder)"
-        }
\ No newline at end of file
+            operation["key"]: results.get(str(operation["key"]), {"status": 0, "body": None})
+            for operation in operations
+        }
+
+
+def _parse_batch_response(body: str, content_type: str) -> Dict[str, Dict[str, Any]]:
+    """{key: {"status", "body"}} from a multipart/mixed batch response"""
+    boundary = content_type.split("boundary=", 1)[-1].split(";", 1)[0].strip().strip('"')
+    results = {}
+
+    for part in body.split(f"--{boundary}"):
+        part = part.strip()
+        if not part or part == "--":
+            continue
+
+        outer_headers, _, inner = part.replace("\r\n", "\n").partition("\n\n")
+        content_id = ""
+        for line in outer_headers.split("\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                content_id = value.strip().strip("<>")
+
+        status_line, _, rest = inner.partition("\n")
+        _, _, inner_body = rest.partition("\n\n")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            continue
+
+        try:
+            parsed = json.loads(inner_body) if inner_body.strip() else None
+        except ValueError:
+            parsed = None
+
+        # Response IDs echo the request's as "response-item-<key>"
+        results[content_id.replace("response-item-", "", 1)] = {"status": status, "body": parsed}
+
+    return results
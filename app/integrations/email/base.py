@@ -1,12 +1,13 @@
 from app.integrations.base import BaseEmailIntegration
 from typing import Dict, Any, Optional
+import aiohttp
 
 
 class EmailIntegration(BaseEmailIntegration):
     """Base email integration with common functionality"""
     
-    def __init__(self, credentials: Dict[str, Any]):
-        super().__init__(credentials)
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(credentials, http_session)
         self.from_email = credentials.get("from_email")
         
         if not self.from_email:
@@ -2,15 +2,20 @@ from app.integrations.email.base import EmailIntegration
 from typing import Dict, Any, Optional
 import asyncio
 import aiohttp
+import base64
+import hmac
 import json
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 from app.config import settings
 
 
 class SendGridIntegration(EmailIntegration):
     """SendGrid email integration"""
     
-    def __init__(self, credentials: Dict[str, Any]):
-        super().__init__(credentials)
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(credentials, http_session)
         self.api_key = credentials.get("api_key")
         
         if not self.api_key:
@@ -21,7 +26,7 @@ class SendGridIntegration(EmailIntegration):
     async def test_connection(self) -> bool:
         """Test SendGrid API connection"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -38,7 +43,7 @@ class SendGridIntegration(EmailIntegration):
     async def get_status(self) -> Dict[str, Any]:
         """Get SendGrid account status"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -95,7 +100,7 @@ class SendGridIntegration(EmailIntegration):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -149,7 +154,7 @@ class SendGridIntegration(EmailIntegration):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -178,4 +183,56 @@ class SendGridIntegration(EmailIntegration):
             return {
                 "success": False,
                 "error": f"Failed to send template email: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    async def fetch_message_status(self, external_id: str) -> Optional[Dict[str, Any]]:
+        """Current Email Activity status of a sent message (processed, delivered, not_delivered)
+        
+        Needs the Email Activity add-on; accounts without it get None.
+        """
+        async with self._http() as session:
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            # Activity IDs are the X-Message-Id returned on send plus a ".filter..." suffix
+            async with session.get(
+                f"{self.base_url}/messages",
+                headers=headers,
+                params={"query": f'msg_id LIKE "{external_id}%"', "limit": "1"}
+            ) as response:
+                if response.status in (403, 404):
+                    return None
+                response.raise_for_status()
+                data = await response.json()
+                
+                messages = data.get("messages") or []
+                if not messages:
+                    return None
+                return {"status": messages[0].get("status"), "error": None}
+    
+    def verify_event_signature(self, payload: bytes, signature: str, timestamp: str) -> bool:
+        """Check a signed Event Webhook request (ECDSA over timestamp + raw body)"""
+        verification_key = self.credentials.get("webhook_verification_key")
+        if not verification_key or not signature or not timestamp:
+            return False
+        
+        try:
+            public_key = serialization.load_der_public_key(base64.b64decode(verification_key))
+            public_key.verify(
+                base64.b64decode(signature),
+                timestamp.encode() + payload,
+                ec.ECDSA(hashes.SHA256())
+            )
+            return True
+        except (InvalidSignature, ValueError, TypeError):
+            return False
+    
+    def verify_inbound_token(self, token: str) -> bool:
+        """Inbound Parse requests are unsigned; the configured URL carries a shared token"""
+        expected = self.credentials.get("inbound_parse_token")
+        if not expected or not token:
+            return False
+        return hmac.compare_digest(expected, token)
+
@@ -0,0 +1,113 @@
+from sqlalchemy.orm import Session
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+import threading
+from app.models.integration import Integration
+from app.integrations.base import BaseIntegration
+from app.integrations.email.sendgrid import SendGridIntegration
+from app.integrations.sms.twilio import TwilioIntegration
+from app.integrations.calendar.google_calendar import GoogleCalendarIntegration
+from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.security import decrypt_credentials
+
+# (integration type, provider) -> client class
+PROVIDERS = {
+    ("email", "sendgrid"): SendGridIntegration,
+    ("sms", "twilio"): TwilioIntegration,
+    ("calendar", "google"): GoogleCalendarIntegration,
+}
+
+RegistryKey = Tuple[int, int, Optional[datetime]]
+
+
+class IntegrationRegistry:
+    """Per-process cache of constructed integration clients
+
+    Clients are keyed by (workspace_id, integration_id, updated_at), so
+    credentials are decrypted and a client built once per integration
+    version. Every credential or status change bumps updated_at, which is
+    what keeps other processes (e.g. Celery workers) from using a stale
+    client; invalidate() just drops this process's copy early. Only the
+    latest version of each integration is kept.
+    """
+
+    def __init__(self):
+        self._clients: Dict[int, Tuple[RegistryKey, BaseIntegration]] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        db: Session,
+        workspace_id: int,
+        integration_id: int,
+        updated_at: Optional[datetime]
+    ) -> BaseIntegration:
+        """Return the cached client for this integration version, building it on a miss"""
+        key = (workspace_id, integration_id, updated_at)
+        cached = self._clients.get(integration_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        integration = db.query(Integration).filter(
+            Integration.id == integration_id,
+            Integration.workspace_id == workspace_id
+        ).first()
+        if not integration:
+            raise NotFoundException("Integration not found")
+
+        return self._build(integration)
+
+    def get_active_client(self, db: Session, workspace_id: int, integration_type: str) -> BaseIntegration:
+        """Client for the workspace's active integration of a type (email, sms)
+
+        Looks up only the integration's ID and version; credentials are read
+        and decrypted only when that version isn't cached yet.
+        """
+        found = db.query(Integration.id, Integration.updated_at).filter(
+            Integration.workspace_id == workspace_id,
+            Integration.type == integration_type,
+            Integration.is_active == True
+        ).order_by(Integration.id).first()
+
+        if not found:
+            raise NotFoundException(f"No active {integration_type} integration found")
+
+        return self.get_client(db, workspace_id, found.id, found.updated_at)
+
+    def get_client_by_id(self, db: Session, integration_id: int) -> Tuple[int, BaseIntegration]:
+        """Workspace ID and client for an integration addressed only by ID (provider webhooks)
+
+        Inactive integrations resolve too, so callbacks for messages sent
+        before an integration was disabled still land.
+        """
+        found = db.query(Integration.workspace_id, Integration.updated_at).filter(
+            Integration.id == integration_id
+        ).first()
+
+        if not found:
+            raise NotFoundException("Integration not found")
+
+        return found.workspace_id, self.get_client(db, found.workspace_id, integration_id, found.updated_at)
+
+    def invalidate(self, integration_id: int):
+        """Drop this process's client for an integration that was updated or deleted"""
+        with self._lock:
+            self._clients.pop(integration_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def _build(self, integration: Integration) -> BaseIntegration:
+        provider_class = PROVIDERS.get((integration.type, integration.provider))
+        if provider_class is None:
+            raise ValidationException(f"Unsupported {integration.type} provider: {integration.provider}")
+
+        client = provider_class(decrypt_credentials(integration.credentials))
+        key = (integration.workspace_id, integration.id, integration.updated_at)
+        with self._lock:
+            self._clients[integration.id] = (key, client)
+        return client
+
+
+integration_registry = IntegrationRegistry()
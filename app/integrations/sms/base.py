@@ -1,13 +1,14 @@
 from app.integrations.base import BaseSMSIntegration
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import aiohttp
 import re
 
 
 class SMSIntegration(BaseSMSIntegration):
     """Base SMS integration with common functionality"""
     
-    def __init__(self, credentials: Dict[str, Any]):
-        super().__init__(credentials)
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(credentials, http_session)
         self.phone_number = credentials.get("phone_number")
         
         if not self.phone_number:
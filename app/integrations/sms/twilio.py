@@ -1,16 +1,18 @@
 from app.integrations.sms.base import SMSIntegration
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import asyncio
 import aiohttp
 import json
 from base64 import b64encode
+import hashlib
+import hmac
 
 
 class TwilioIntegration(SMSIntegration):
     """Twilio SMS integration"""
     
-    def __init__(self, credentials: Dict[str, Any]):
-        super().__init__(credentials)
+    def __init__(self, credentials: Dict[str, Any], http_session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(credentials, http_session)
         self.account_sid = credentials.get("account_sid")
         self.auth_token = credentials.get("auth_token")
         
@@ -28,7 +30,7 @@ class TwilioIntegration(SMSIntegration):
     async def test_connection(self) -> bool:
         """Test Twilio API connection"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": self._get_auth_header()
                 }
@@ -44,7 +46,7 @@ class TwilioIntegration(SMSIntegration):
     async def get_status(self) -> Dict[str, Any]:
         """Get Twilio account status"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": self._get_auth_header()
                 }
@@ -75,7 +77,8 @@ class TwilioIntegration(SMSIntegration):
     async def send_sms(
         self,
         to_phone: str,
-        message: str
+        message: str,
+        status_callback: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send SMS via Twilio"""
         if not self._validate_phone(to_phone):
@@ -96,9 +99,11 @@ class TwilioIntegration(SMSIntegration):
             "To": normalized_to,
             "Body": message
         }
+        if status_callback:
+            payload["StatusCallback"] = status_callback
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http() as session:
                 headers = {
                     "Authorization": self._get_auth_header(),
                     "Content-Type": "application/x-www-form-urlencoded"
@@ -142,34 +147,32 @@ class TwilioIntegration(SMSIntegration):
                 "error": f"Failed to send SMS: {str(e)}"
             }
     
-    async def get_message_status(self, message_sid: str) -> Dict[str, Any]:
-        """Get status of a sent message"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Authorization": self._get_auth_header()
-                }
+    async def fetch_message_status(self, external_id: str) -> Optional[Dict[str, Any]]:
+        """Current Twilio status of a sent message (queued, sent, delivered, undelivered, ...)"""
+        async with self._http() as session:
+            headers = {
+                "Authorization": self._get_auth_header()
+            }
+            
+            async with session.get(
+                f"{self.base_url}/Messages/{external_id}.json",
+                headers=headers
+            ) as response:
+                if response.status == 404:
+                    return None
+                response.raise_for_status()
+                data = await response.json()
                 
-                async with session.get(
-                    f"{self.base_url}/Messages/{message_sid}.json",
-                    headers=headers
-                ) as response:
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "status": data.get("status"),
-                            "error_code": data.get("error_code"),
-                            "error_message": data.get("error_message")
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Failed to get message status: {response.status}"
-                        }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Failed to get message status: {str(e)}"
-            }
\ No newline at end of file
+                error = None
+                if data.get("error_code"):
+                    error = f"Twilio error {data['error_code']}: {data.get('error_message') or ''}".rstrip(": ")
+                return {"status": data.get("status"), "error": error}
+    
+    def verify_webhook_signature(self, url: str, params: Dict[str, Any], signature: str) -> bool:
+        """Check X-Twilio-Signature: HMAC-SHA1 of the full URL plus sorted POST params"""
+        if not signature:
+            return False
+        
+        payload = url + "".join(f"{key}{params[key]}" for key in sorted(params))
+        digest = hmac.new(self.auth_token.encode(), payload.encode(), hashlib.sha1).digest()
+        return hmac.compare_digest(b64encode(digest).decode(), signature)
@@ -1,7 +1,10 @@
+import time
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.config import settings
+from app.database import engine, pool_status, replica_status
+from app.utils.read_routing import ReadRoutingMiddleware
 from app.websockets.manager import socket_app
 from app.api.v1 import (
     auth,
@@ -17,7 +20,9 @@ from app.api.v1 import (
     inventory,
     integrations,
     alerts,
-    public
+    exports,
+    public,
+    webhooks
 )
 from app.utils.exceptions import (
     UnauthorizedException,
@@ -30,6 +35,7 @@ app = FastAPI(
     title="CareOps API",
     description="Unified operations platform for service-based businesses",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None
 )
@@ -43,6 +49,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read-your-writes for replica reads (get_read_db)
+app.add_middleware(ReadRoutingMiddleware)
+
 
 # Exception handlers
 @app.exception_handler(UnauthorizedException)
@@ -88,6 +97,25 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/db")
+def database_health_check():
+    """Database reachability, this process's connection pool usage and replica lag"""
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "error": str(e), "pool": pool_status()}
+        )
+    return {
+        "status": "healthy",
+        "latency_ms": int((time.perf_counter() - started) * 1000),
+        "pool": pool_status(),
+        "replica": replica_status()
+    }
+
 # API routes
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(workspaces.router, prefix="/api/v1/workspaces", tags=["workspaces"])
@@ -102,7 +130,9 @@ app.include_router(public_forms.router, prefix="/api/public", tags=["public-form
 app.include_router(inventory.router, prefix="/api/v1/inventory", tags=["inventory"])
 app.include_router(integrations.router, prefix="/api/v1/integrations", tags=["integrations"])
 app.include_router(alerts.router, prefix="/api/v1/alerts", tags=["alerts"])
+app.include_router(exports.router, prefix="/api/v1/exports", tags=["exports"])
 app.include_router(public.router, prefix="/api/v1/public", tags=["public"])
+app.include_router(webhooks.router, prefix="/api/v1/webhooks", tags=["webhooks"])  # Provider callbacks (signed, no auth)
 
 # Mount Socket.IO
 app.mount("/socket.io", socket_app)
@@ -6,10 +6,14 @@ from app.models.message import Message, MessageType, MessageDirection
 from app.models.booking import Booking, BookingStatus # type: ignore
 from app.models.service import Service
 from app.models.form import Form, ServiceForm, FormSubmission
+from app.models.form_counter_flush import FormCounterFlush
 from app.models.inventory import InventoryItem
+from app.models.service_inventory import ServiceInventory, InventoryReservation, ReservationKind
 from app.models.integration import Integration
 from app.models.automation_rule import AutomationRule
-from app.models.alert import Alert, AlertType, AlertStatus
+from app.models.alert import Alert, AlertType, AlertStatus, AlertSeverity
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.external_busy_interval import ExternalBusyInterval
 
 __all__ = [
     "User", "UserRole",
@@ -20,8 +24,12 @@ __all__ = [
     "Booking", "BookingStatus",
     "Service",
     "Form", "ServiceForm", "FormSubmission",
+    "FormCounterFlush",
     "InventoryItem",
+    "ServiceInventory", "InventoryReservation", "ReservationKind",
     "Integration",
     "AutomationRule",
-    "Alert", "AlertType", "AlertStatus"
+    "Alert", "AlertType", "AlertStatus", "AlertSeverity",
+    "ExportJob", "ExportJobStatus",
+    "ExternalBusyInterval"
 ]
\ No newline at end of file
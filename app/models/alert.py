@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Text, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Text, Enum, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -16,8 +16,23 @@ class AlertStatus(str, enum.Enum):
     DISMISSED = "dismissed"
     RESOLVED = "resolved"
 
+class AlertSeverity(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        # At most one active alert per referenced entity and alert type
+        Index(
+            "ux_alerts_active_reference",
+            "type", "reference_type", "reference_id",
+            unique=True,
+            postgresql_where=text("status = 'ACTIVE' AND reference_id IS NOT NULL")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False)
@@ -29,6 +29,9 @@ class Booking(Base):
     reminder_sent_at = Column(DateTime, nullable=True)
     forms_sent_at = Column(DateTime, nullable=True)
     
+    # Event mirrored to the workspace's connected calendar
+    external_event_id = Column(String, nullable=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Email dedupe in bulk contact imports, and matching inbound email senders
+        Index("ix_contacts_workspace_id_lower_email", "workspace_id", text("lower(email)")),
+        # Inbound SMS senders are matched on the last ten phone digits
+        Index("ix_contacts_workspace_phone_digits", "workspace_id", text("right(regexp_replace(phone, '\\D', '', 'g'), 10)")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False)
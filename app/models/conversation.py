@@ -1,10 +1,23 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
 
+PREVIEW_LENGTH = 160
+
+def message_preview(content: str) -> str:
+    """Single-line snippet of a message for the inbox list"""
+    text = " ".join((content or "").split())
+    if len(text) <= PREVIEW_LENGTH:
+        return text
+    return text[:PREVIEW_LENGTH - 1].rstrip() + "\u2026"
+
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Serves the inbox list (one workspace and status, newest first) via a backward scan
+        Index("ix_conversations_inbox", "workspace_id", "status", "last_message_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     contact_id = Column(Integer, ForeignKey("contacts.id"), nullable=False)
@@ -14,9 +27,25 @@ class Conversation(Base):
     unread_count = Column(Integer, default=0)
     last_message_at = Column(DateTime, default=datetime.utcnow)
     
+    # Inbox preview of the latest message, kept current by record_message
+    last_message_preview = Column(String, nullable=True)
+    last_message_direction = Column(String, nullable=True)  # inbound, outbound
+    last_message_channel = Column(String, nullable=True)  # email, sms
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     contact = relationship("Contact", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan", order_by="Message.created_at")
\ No newline at end of file
+    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan", order_by="Message.created_at")
+    
+    def record_message(self, message) -> None:
+        """Update the inbox preview for a message added to this conversation"""
+        sent_at = message.created_at or datetime.utcnow()
+        if self.last_message_preview is not None and self.last_message_at and self.last_message_at > sent_at:
+            return  # An older message arriving late doesn't replace the preview
+        
+        self.last_message_at = sent_at
+        self.last_message_preview = message_preview(message.content)
+        self.last_message_direction = getattr(message.direction, "value", message.direction)
+        self.last_message_channel = getattr(message.type, "value", message.type)
@@ -0,0 +1,52 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from app.database import Base
+
+class ExportJobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ExportJob(Base):
+    """Background export written as keyset-ordered chunks"""
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    export_type = Column(String, nullable=False)  # contacts, bookings, submissions, messages
+    format = Column(String, default="csv", nullable=False)  # csv, jsonl
+    params = Column(JSON, nullable=True)  # e.g. {"form_id": 1}
+    status = Column(String, default=ExportJobStatus.PENDING, nullable=False, index=True)
+
+    # Progress; last_key is the id of the last row written, so a restarted job resumes after it
+    total_rows = Column(Integer, nullable=True)
+    rows_written = Column(Integer, default=0, nullable=False)
+    chunk_count = Column(Integer, default=0, nullable=False)
+    last_key = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    creator = relationship("User", foreign_keys=[created_by])
+
+    @property
+    def storage_prefix(self) -> str:
+        return f"workspace_{self.workspace_id}/export_{self.id}"
+
+    @property
+    def chunk_keys(self):
+        """Storage keys in download order: CSV header first, then each chunk"""
+        extension = "jsonl" if self.format == "jsonl" else "csv"
+        keys = [f"{self.storage_prefix}/header.csv"] if self.format == "csv" else []
+        keys += [f"{self.storage_prefix}/chunk_{index:06d}.{extension}" for index in range(self.chunk_count)]
+        return keys
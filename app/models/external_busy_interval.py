@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, UniqueConstraint
+from datetime import datetime
+from app.database import Base
+
+class ExternalBusyInterval(Base):
+    """Busy block mirrored from a connected external calendar
+
+    Written only by calendar sync; availability checks read it so no remote
+    call happens while a customer is booking. Times are naive UTC.
+    """
+    __tablename__ = "external_busy_intervals"
+    __table_args__ = (
+        UniqueConstraint("integration_id", "external_event_id", name="uq_external_busy_intervals_integration_event"),
+        # Overlap lookups for one workspace and day
+        Index("ix_external_busy_intervals_workspace_start", "workspace_id", "start_at", "end_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
+    integration_id = Column(Integer, ForeignKey("integrations.id", ondelete="CASCADE"), nullable=False)
+    external_event_id = Column(String, nullable=False)
+    start_at = Column(DateTime, nullable=False)
+    end_at = Column(DateTime, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime
+from datetime import datetime
+from app.database import Base
+
+class FormCounterFlush(Base):
+    """Buffered form counter batch already applied to `forms`
+
+    Recorded in the same transaction as the counter UPDATE, so a flush that
+    dies before clearing its Redis hash is not applied twice when resumed.
+    """
+    __tablename__ = "form_counter_flushes"
+
+    flush_id = Column(String, primary_key=True)
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
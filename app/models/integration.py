@@ -15,6 +15,10 @@ class Integration(Base):
     last_tested_at = Column(DateTime, nullable=True)
     test_status = Column(String, nullable=True)  # success, failed
     
+    # Calendar sync state (calendar integrations only)
+    sync_token = Column(String, nullable=True)  # Provider token for the next incremental sync
+    last_synced_at = Column(DateTime, nullable=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
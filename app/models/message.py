@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Enum, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -14,6 +14,19 @@ class MessageDirection(str, enum.Enum):
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Keyset pagination of a conversation's history on (created_at, id)
+        Index("ix_messages_conversation_created", "conversation_id", "created_at", "id"),
+        # Small index over the dispatch backlog for the queued/sending sweep
+        Index(
+            "ix_messages_dispatch_pending", "status", "id",
+            postgresql_where=text("status IN ('queued', 'sending')")
+        ),
+        # Provider callbacks are matched to messages by SendGrid/Twilio ID
+        Index("ix_messages_external_id", "external_id", postgresql_where=text("external_id IS NOT NULL")),
+        # Sent messages still awaiting a delivery outcome, for status reconciliation
+        Index("ix_messages_status_pending", "dispatched_at", postgresql_where=text("status = 'sent'")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
@@ -24,7 +37,10 @@ class Message(Base):
     is_automated = Column(Boolean, default=False)
     sent_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     external_id = Column(String, nullable=True)  # SendGrid/Twilio message ID
-    status = Column(String, default="sent")  # sent, delivered, failed
+    status = Column(String, default="sent")  # queued, sending, sent, delivered, failed
+    dispatched_at = Column(DateTime, nullable=True)  # When a dispatch worker claimed it
+    error = Column(Text, nullable=True)  # Provider or dispatch error for failed messages
+    status_checked_at = Column(DateTime, nullable=True)  # Last provider status lookup by the reconciler
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
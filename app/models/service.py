@@ -22,4 +22,5 @@ class Service(Base):
     # Relationships
     workspace = relationship("Workspace", back_populates="services")
     bookings = relationship("Booking", back_populates="service", cascade="all, delete-orphan")
-    service_forms = relationship("ServiceForm", back_populates="service", cascade="all, delete-orphan")
\ No newline at end of file
+    service_forms = relationship("ServiceForm", back_populates="service", cascade="all, delete-orphan")
+    inventory_links = relationship("ServiceInventory", back_populates="service", cascade="all, delete-orphan")
\ No newline at end of file
@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from app.database import Base
+
+class ReservationKind(str, enum.Enum):
+    RESERVE = "reserve"
+    RELEASE = "release"
+
+class ServiceInventory(Base):
+    """Inventory items consumed by each booking of a service"""
+    __tablename__ = "service_inventory"
+    __table_args__ = (
+        UniqueConstraint("service_id", "item_id", name="uq_service_inventory_service_item"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    service_id = Column(Integer, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
+    item_id = Column(Integer, ForeignKey("inventory_items.id", ondelete="CASCADE"), nullable=False)
+    quantity_per_booking = Column(Integer, nullable=False, default=1)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    service = relationship("Service", back_populates="inventory_links")
+    item = relationship("InventoryItem")
+
+class InventoryReservation(Base):
+    """Append-only ledger of stock reserved for and released from bookings
+
+    At most one reserve and one release entry exist per booking and item, which
+    makes reserving idempotent and releasing happen exactly once.
+    """
+    __tablename__ = "inventory_reservations"
+    __table_args__ = (
+        UniqueConstraint("booking_id", "item_id", "kind", name="uq_inventory_reservations_booking_item_kind"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("bookings.id", ondelete="CASCADE"), nullable=False)
+    item_id = Column(Integer, ForeignKey("inventory_items.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String, nullable=False)  # reserve, release
+    quantity = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 class ContactCreate(BaseModel):
@@ -36,4 +36,15 @@ class ContactResponse(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ContactImportError(BaseModel):
+    row: int
+    error: str
+
+class ContactImportResponse(BaseModel):
+    total_rows: int
+    created: int
+    duplicates: int  # Already in the workspace or repeated within the file
+    failed: int
+    errors: List[ContactImportError]  # First 1000 failures only
@@ -19,11 +19,18 @@ class MessageResponse(BaseModel):
     subject: Optional[str]
     content: str
     is_automated: bool
+    sent_by_user_id: Optional[int] = None
+    status: Optional[str] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
+class MessagePage(BaseModel):
+    messages: List[MessageResponse]  # Oldest first
+    has_more: bool
+    next_before: Optional[int] = None  # Pass as ?before= to fetch older messages
+
 class ConversationResponse(BaseModel):
     id: int
     contact_id: int
@@ -37,8 +44,26 @@ class ConversationResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class InboxContact(BaseModel):
+    id: int
+    full_name: str
+    email: Optional[str]
+    phone: Optional[str]
+    preferred_channel: str
+    
+    class Config:
+        from_attributes = True
+
+class ConversationInboxItem(ConversationResponse):
+    contact: InboxContact
+    last_message_preview: Optional[str]
+    last_message_direction: Optional[str]
+    last_message_channel: Optional[str]
+
 class ConversationDetail(ConversationResponse):
-    pass
+    contact: InboxContact
+    last_message_preview: Optional[str] = None
+    messages: MessagePage  # Newest page only; older pages via /messages
 
 class ConversationWithMessages(ConversationResponse):
     messages: List[MessageResponse]
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, model_validator
+from typing import Optional, Literal
+from datetime import datetime
+
+
+class ExportJobCreate(BaseModel):
+    export_type: Literal["contacts", "bookings", "submissions", "messages"]
+    format: Literal["csv", "jsonl"] = "csv"
+    form_id: Optional[int] = None  # Required for submissions
+    
+    @model_validator(mode="after")
+    def check_form_id(self):
+        if self.export_type == "submissions" and self.form_id is None:
+            raise ValueError("form_id is required for submission exports")
+        return self
+
+
+class ExportJobResponse(BaseModel):
+    id: int
+    workspace_id: int
+    export_type: str
+    format: str
+    params: Optional[dict] = None
+    status: str
+    total_rows: Optional[int] = None
+    rows_written: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
@@ -210,4 +210,8 @@ class FormPerformanceResponse(BaseModel):
     total_submissions: int
     total_views: int
     average_completion_rate: float
-    recent_submissions: List[CustomFormSubmissionResponse]
\ No newline at end of file
+    recent_submissions: List[CustomFormSubmissionResponse]
+
+# Bulk validators for list endpoints (one validation pass over the whole page)
+FormResponseList = TypeAdapter(List[FormResponse])
+CustomFormSubmissionResponseList = TypeAdapter(List[CustomFormSubmissionResponse])
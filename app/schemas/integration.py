@@ -30,6 +30,7 @@ class IntegrationCreate(IntegrationBase):
 class IntegrationUpdate(BaseModel):
     display_name: Optional[str] = Field(None, min_length=1, max_length=100)
     settings: Optional[Dict[str, Any]] = None
+    credentials: Optional[Dict[str, Any]] = None
     is_active: Optional[bool] = None
 
 
@@ -51,6 +52,12 @@ class IntegrationCreate(BaseModel):
     provider: str  # sendgrid, twilio, google
     credentials: Dict[str, Any]
 
+class IntegrationHealth(BaseModel):
+    status: str  # success, failed
+    checked_at: datetime
+    latency_ms: Optional[int] = None
+    error: Optional[str] = None
+
 class IntegrationResponse(BaseModel):
     id: int
     workspace_id: int
@@ -59,6 +66,7 @@ class IntegrationResponse(BaseModel):
     is_active: bool
     last_tested_at: Optional[datetime]
     test_status: Optional[str]
+    health: Optional[IntegrationHealth] = None  # Latest cached health check, None until checked
     created_at: datetime
     
     class Config:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -24,4 +24,17 @@ class InventoryItemResponse(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ServiceInventoryUpdate(BaseModel):
+    quantity_per_booking: Optional[int] = Field(None, ge=0)
+
+class ServiceInventoryResponse(BaseModel):
+    id: int
+    service_id: int
+    item_id: int
+    quantity_per_booking: int
+    item: InventoryItemResponse
+    
+    class Config:
+        from_attributes = True
@@ -6,6 +6,7 @@ from app.schemas.auth import UserRegister, UserLogin, Token
 from app.utils.security import get_password_hash, verify_password, create_access_token
 from app.utils.exceptions import UnauthorizedException, ValidationException
 from app.utils.validators import validate_email
+from app.services.slugs import allocate_slug, slugify
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -35,15 +36,7 @@ class AuthService:
         
         try:
             # Create workspace first
-            workspace_slug = user_data.business_name.lower().replace(" ", "-").replace("_", "-")
-            # Ensure unique slug
-            existing_workspace = db.query(Workspace).filter(Workspace.slug == workspace_slug).first()
-            counter = 1
-            original_slug = workspace_slug
-            while existing_workspace:
-                workspace_slug = f"{original_slug}-{counter}"
-                existing_workspace = db.query(Workspace).filter(Workspace.slug == workspace_slug).first()
-                counter += 1
+            workspace_slug = allocate_slug(db, Workspace.slug, slugify(user_data.business_name))
             
             workspace = Workspace(
                 name=user_data.business_name,
@@ -74,7 +67,7 @@ class AuthService:
             db.commit()
             
             # Create access token
-            access_token = create_access_token(data={"sub": str(user.id)})
+            access_token = create_access_token(data={"sub": str(user.id), "workspace_id": workspace.id})
             
             return Token(access_token=access_token, token_type="bearer")
             
@@ -97,7 +90,7 @@ class AuthService:
             raise UnauthorizedException("Invalid credentials")
         
         # Create access token
-        access_token = create_access_token(data={"sub": str(user.id)})
+        access_token = create_access_token(data={"sub": str(user.id), "workspace_id": user.workspace_id})
         
         return Token(access_token=access_token, token_type="bearer")
     
@@ -108,6 +101,6 @@ class AuthService:
             raise UnauthorizedException("User not active")
         
         # Create new access token
-        access_token = create_access_token(data={"sub": str(user.id)})
+        access_token = create_access_token(data={"sub": str(user.id), "workspace_id": user.workspace_id})
         
         return Token(access_token=access_token, token_type="bearer")
\ No newline at end of file
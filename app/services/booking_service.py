@@ -10,8 +10,16 @@ from app.schemas.booking import BookingCreate, BookingUpdate, PublicBookingCreat
 from app.schemas.service import ServiceCreate, ServiceUpdate
 from app.utils.exceptions import NotFoundException, ValidationException
 from app.services.contact_service import ContactService
+from app.services.inventory_reservations import release_for_booking
+from app.services.slugs import allocate_slug, slugify, service_id_for_slug, workspace_id_for_slug
+from app.services.calendar_sync import busy_intervals, is_busy, local_to_utc, workspace_zone
+from app.tasks.calendar_tasks import enqueue_calendar_push
+from app.utils.response_cache import response_cache, workspace_tag
 from app.automation.engine import automation_engine
 from app.websockets.manager import websocket_manager
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class BookingService:
@@ -27,24 +35,8 @@ class BookingService:
     
     async def create_service(self, db: Session, workspace_id: int, service_data: ServiceCreate) -> Service:
         """Create new service"""
-        # Generate slug from name
-        slug = service_data.name.lower().replace(" ", "-").replace("_", "-")
-        
-        # Ensure unique slug
-        existing = db.query(Service).filter(
-            Service.workspace_id == workspace_id,
-            Service.slug == slug
-        ).first()
-        
-        counter = 1
-        original_slug = slug
-        while existing:
-            slug = f"{original_slug}-{counter}"
-            existing = db.query(Service).filter(
-                Service.workspace_id == workspace_id,
-                Service.slug == slug
-            ).first()
-            counter += 1
+        # Generate unique slug from name
+        slug = allocate_slug(db, Service.slug, slugify(service_data.name), Service.workspace_id == workspace_id)
         
         service = Service(
             workspace_id=workspace_id,
@@ -77,13 +69,10 @@ class BookingService:
     
     async def get_service_by_slug(self, db: Session, slug: str, workspace_id: int) -> Service:
         """Get service by slug"""
-        service = db.query(Service).filter(
-            Service.slug == slug,
-            Service.workspace_id == workspace_id,
-            Service.is_active == True
-        ).first()
+        service_id = service_id_for_slug(db, workspace_id, slug)
+        service = db.get(Service, service_id) if service_id else None
         
-        if not service:
+        if not service or not service.is_active:
             raise NotFoundException("Service not found")
         
         return service
@@ -104,6 +93,8 @@ class BookingService:
         db.commit()
         db.refresh(service)
         
+        response_cache.purge([workspace_tag(workspace_id)])
+        
         return service
     
     async def delete_service(self, db: Session, service_id: int, workspace_id: int):
@@ -111,6 +102,8 @@ class BookingService:
         service = await self.get_service(db, service_id, workspace_id)
         service.is_active = False
         db.commit()
+        
+        response_cache.purge([workspace_tag(workspace_id)])
     
     # Booking management methods
     async def list_bookings(
@@ -177,6 +170,7 @@ class BookingService:
         db.commit()
         db.refresh(booking)
         
+        self._push_to_calendar(booking.id)
         return booking
     
     async def create_public_booking(
@@ -188,13 +182,7 @@ class BookingService:
     ) -> Booking:
         """Create booking from public booking page"""
         # Get workspace
-        workspace = db.query(Workspace).filter(
-            Workspace.slug == workspace_slug,
-            Workspace.is_active == True
-        ).first()
-        
-        if not workspace:
-            raise NotFoundException("Workspace not found")
+        workspace = self._get_public_workspace(db, workspace_slug)
         
         # Get service
         service = await self.get_service_by_slug(db, service_slug, workspace.id)
@@ -227,6 +215,8 @@ class BookingService:
         db.commit()
         db.refresh(booking)
         
+        self._push_to_calendar(booking.id)
+        
         # Trigger automation: booking_created
         await automation_engine.trigger_event("booking_created", {
             "booking_id": booking.id,
@@ -291,6 +281,7 @@ class BookingService:
         db.commit()
         db.refresh(booking)
         
+        self._push_to_calendar(booking.id)
         return booking
     
     async def cancel_booking(self, db: Session, booking_id: int, workspace_id: int):
@@ -298,7 +289,15 @@ class BookingService:
         booking = await self.get_booking(db, booking_id, workspace_id)
         booking.status = BookingStatus.CANCELLED
         booking.updated_at = datetime.utcnow()
+        
+        # Return reserved stock in the same transaction as the cancellation
+        _, alert_events = release_for_booking(db, booking)
         db.commit()
+        
+        self._push_to_calendar(booking.id)
+        
+        for event, data in alert_events:
+            await websocket_manager.emit_to_workspace(workspace_id, event, data)
     
     async def get_todays_bookings(self, db: Session, workspace_id: int) -> List[Booking]:
         """Get today's bookings"""
@@ -322,18 +321,13 @@ class BookingService:
         service_slug: str
     ) -> Dict[str, Any]:
         """Get data needed for public booking page"""
-        workspace = db.query(Workspace).filter(
-            Workspace.slug == workspace_slug,
-            Workspace.is_active == True
-        ).first()
-        
-        if not workspace:
-            raise NotFoundException("Workspace not found")
+        workspace = self._get_public_workspace(db, workspace_slug)
         
         service = await self.get_service_by_slug(db, service_slug, workspace.id)
         
         return {
             "workspace": {
+                "id": workspace.id,
                 "name": workspace.name,
                 "slug": workspace.slug
             },
@@ -375,6 +369,11 @@ class BookingService:
         
         booked_times = {booking.booking_time for booking in existing_bookings}
         
+        # Busy time mirrored from the workspace's calendar, read once for the whole day
+        zone = workspace_zone(db.query(Workspace.timezone).filter(Workspace.id == workspace_id).scalar())
+        day_start = local_to_utc(datetime.combine(booking_date, time.min), zone)
+        busy = busy_intervals(db, workspace_id, day_start, day_start + timedelta(days=1, hours=1))
+        
         # Generate available slots
         available_slots = []
         
@@ -393,7 +392,11 @@ class BookingService:
                 if slot_time not in booked_times:
                     # Check if enough time before end of availability
                     slot_end = current + timedelta(minutes=service.duration_minutes)
-                    if slot_end.time() <= end_time:
+                    slot_start_utc = local_to_utc(current, zone)
+                    slot_end_utc = local_to_utc(slot_end, zone)
+                    if slot_end.time() <= end_time and not any(
+                        start < slot_end_utc and end > slot_start_utc for start, end in busy
+                    ):
                         available_slots.append(slot_time.strftime("%H:%M"))
                 
                 current += timedelta(minutes=30)  # 30-minute intervals
@@ -422,5 +425,34 @@ class BookingService:
         if exclude_booking_id:
             query = query.filter(Booking.id != exclude_booking_id)
         
-        existing = query.first()
-        return existing is None
\ No newline at end of file
+        if query.first() is not None:
+            return False
+        
+        # Busy time on the workspace's connected calendar (mirrored locally by calendar sync)
+        service = db.query(Service.workspace_id, Service.duration_minutes, Workspace.timezone).join(
+            Workspace, Service.workspace_id == Workspace.id
+        ).filter(Service.id == service_id).first()
+        
+        if service:
+            start = local_to_utc(datetime.combine(booking_date, booking_time), workspace_zone(service.timezone))
+            if is_busy(db, service.workspace_id, start, start + timedelta(minutes=service.duration_minutes)):
+                return False
+        
+        return True
+    
+    def _get_public_workspace(self, db: Session, workspace_slug: str) -> Workspace:
+        """Active workspace for a public page slug"""
+        workspace_id = workspace_id_for_slug(db, workspace_slug)
+        workspace = db.get(Workspace, workspace_id) if workspace_id else None
+        
+        if not workspace or not workspace.is_active:
+            raise NotFoundException("Workspace not found")
+        
+        return workspace
+    
+    def _push_to_calendar(self, booking_id: int):
+        """Mirror a committed booking change to the connected calendar, if any"""
+        try:
+            enqueue_calendar_push([booking_id])
+        except Exception as e:
+            logger.warning(f"Could not enqueue calendar push for booking {booking_id}: {str(e)}")
\ No newline at end of file
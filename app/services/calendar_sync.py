@@ -0,0 +1,394 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import asyncio
+import logging
+import aiohttp
+from app.config import settings
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.models.contact import Contact
+from app.models.workspace import Workspace
+from app.models.integration import Integration
+from app.models.external_busy_interval import ExternalBusyInterval
+from app.integrations.base import BaseIntegration
+from app.integrations.calendar.google_calendar import SyncTokenExpired
+from app.integrations.registry import integration_registry
+
+logger = logging.getLogger(__name__)
+
+# Marks events pushed from bookings, so sync doesn't mirror them back as busy time
+BOOKING_PROPERTY = "careops_booking_id"
+
+ACTIVE_BOOKING_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.PENDING)
+
+UPSERT_CHUNK = 1000
+
+Interval = Tuple[datetime, datetime]
+
+
+def workspace_zone(name: Optional[str]) -> ZoneInfo:
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def local_to_utc(value: datetime, zone: ZoneInfo) -> datetime:
+    """Naive UTC for a naive local datetime in the workspace's zone"""
+    return value.replace(tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _overlapping(query, workspace_id: int, start_at: datetime, end_at: datetime):
+    # Deactivated calendars keep their rows (sync resumes from its token on
+    # reactivation) but no longer block anything
+    return query.join(Integration, Integration.id == ExternalBusyInterval.integration_id).filter(
+        ExternalBusyInterval.workspace_id == workspace_id,
+        ExternalBusyInterval.start_at < end_at,
+        ExternalBusyInterval.end_at > start_at,
+        Integration.is_active == True
+    )
+
+
+def busy_intervals(db: Session, workspace_id: int, start_at: datetime, end_at: datetime) -> List[Interval]:
+    """Mirrored busy time from active calendars overlapping [start_at, end_at) (naive UTC)"""
+    return [
+        (row.start_at, row.end_at)
+        for row in _overlapping(
+            db.query(ExternalBusyInterval.start_at, ExternalBusyInterval.end_at), workspace_id, start_at, end_at
+        ).all()
+    ]
+
+
+def is_busy(db: Session, workspace_id: int, start_at: datetime, end_at: datetime) -> bool:
+    return db.query(
+        _overlapping(db.query(ExternalBusyInterval.id), workspace_id, start_at, end_at).exists()
+    ).scalar()
+
+
+@dataclass
+class CalendarChanges:
+    """Busy-time changes fetched from one calendar"""
+    integration_id: int
+    workspace_id: int
+    busy: Dict[str, Interval] = field(default_factory=dict)
+    removed: Set[str] = field(default_factory=set)
+    sync_token: Optional[str] = None
+    full: bool = False  # Full listing: mirrored events not in busy are stale
+    error: Optional[str] = None
+
+
+def _event_time(value: Dict[str, str], zone: ZoneInfo) -> datetime:
+    if "dateTime" in value:
+        parsed = datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=ZoneInfo(value["timeZone"]) if value.get("timeZone") else zone)
+        return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    # All-day events block whole days in the workspace's zone
+    return local_to_utc(datetime.combine(date.fromisoformat(value["date"]), time.min), zone)
+
+
+def _event_interval(event: Dict[str, Any], zone: ZoneInfo) -> Optional[Interval]:
+    """Busy interval for an event, None if it doesn't block time"""
+    if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+        return None
+    if BOOKING_PROPERTY in (event.get("extendedProperties") or {}).get("private", {}):
+        return None
+    if any(attendee.get("self") and attendee.get("responseStatus") == "declined"
+           for attendee in event.get("attendees") or []):
+        return None
+    if "start" not in event or "end" not in event:
+        return None
+    return _event_time(event["start"], zone), _event_time(event["end"], zone)
+
+
+async def fetch_changes(
+    client: Any,
+    integration_id: int,
+    workspace_id: int,
+    sync_token: Optional[str],
+    zone: ZoneInfo
+) -> CalendarChanges:
+    """Page through changes since sync_token, or all upcoming events without one
+
+    An expired token falls back to a full listing. Never raises; failures
+    are reported in the result's error.
+    """
+    changes = CalendarChanges(integration_id=integration_id, workspace_id=workspace_id, full=sync_token is None)
+    time_min = (datetime.utcnow() - timedelta(days=settings.CALENDAR_SYNC_LOOKBACK_DAYS)).isoformat() + "Z"
+
+    try:
+        page_token = None
+        while True:
+            try:
+                data = await client.list_events(
+                    sync_token=sync_token, page_token=page_token, time_min=time_min
+                )
+            except SyncTokenExpired:
+                changes = CalendarChanges(integration_id=integration_id, workspace_id=workspace_id, full=True)
+                sync_token = page_token = None
+                continue
+
+            for event in data.get("items", []):
+                interval = _event_interval(event, zone)
+                if interval is None:
+                    changes.busy.pop(event["id"], None)
+                    changes.removed.add(event["id"])
+                else:
+                    changes.busy[event["id"]] = interval
+                    changes.removed.discard(event["id"])
+
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                changes.sync_token = data.get("nextSyncToken")
+                return changes
+    except Exception as e:
+        changes.error = str(e)
+        return changes
+
+
+def apply_changes(db: Session, changes: CalendarChanges):
+    """Mirror fetched changes into external_busy_intervals and store the next sync token"""
+    intervals = ExternalBusyInterval.__table__
+
+    if changes.full:
+        stale = intervals.c.integration_id == changes.integration_id
+        if changes.busy:
+            stale = and_(stale, intervals.c.external_event_id.notin_(list(changes.busy)))
+        db.execute(delete(intervals).where(stale))
+    elif changes.removed:
+        db.execute(delete(intervals).where(
+            intervals.c.integration_id == changes.integration_id,
+            intervals.c.external_event_id.in_(list(changes.removed))
+        ))
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "workspace_id": changes.workspace_id,
+            "integration_id": changes.integration_id,
+            "external_event_id": event_id,
+            "start_at": start_at,
+            "end_at": end_at,
+            "updated_at": now
+        }
+        for event_id, (start_at, end_at) in changes.busy.items()
+    ]
+    for start in range(0, len(rows), UPSERT_CHUNK):
+        statement = pg_insert(intervals).values(rows[start:start + UPSERT_CHUNK])
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[intervals.c.integration_id, intervals.c.external_event_id],
+            set_={
+                "start_at": statement.excluded.start_at,
+                "end_at": statement.excluded.end_at,
+                "updated_at": statement.excluded.updated_at
+            }
+        ))
+
+    # Past busy time no longer affects availability
+    db.execute(delete(intervals).where(
+        intervals.c.integration_id == changes.integration_id,
+        intervals.c.end_at < now - timedelta(days=settings.CALENDAR_SYNC_LOOKBACK_DAYS)
+    ))
+
+    integrations = Integration.__table__
+    db.execute(
+        integrations.update()
+        .where(integrations.c.id == changes.integration_id)
+        # Keep the version: sync state must not retire cached clients
+        .values(sync_token=changes.sync_token, last_synced_at=now, updated_at=integrations.c.updated_at)
+    )
+
+
+async def _fetch_all(targets: List[Tuple[Any, int, int, Optional[str], ZoneInfo]]) -> List[CalendarChanges]:
+    semaphore = asyncio.Semaphore(settings.CALENDAR_SYNC_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=settings.CALENDAR_SYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=settings.CALENDAR_SYNC_TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def fetch(client, integration_id, workspace_id, sync_token, zone) -> CalendarChanges:
+            if not isinstance(client, BaseIntegration):
+                return CalendarChanges(integration_id=integration_id, workspace_id=workspace_id, error=str(client))
+            async with semaphore:
+                return await fetch_changes(client.with_session(session), integration_id, workspace_id, sync_token, zone)
+
+        return await asyncio.gather(*(fetch(*target) for target in targets))
+
+
+def sync_calendars(db: Session, integration_ids: Optional[List[int]] = None) -> List[CalendarChanges]:
+    """Incrementally sync active calendar integrations (all, or the given IDs)
+
+    Remote calendars are read concurrently; each one's changes are then
+    applied and committed on its own, so one failing calendar doesn't hold
+    back the others.
+    """
+    query = db.query(
+        Integration.id, Integration.workspace_id, Integration.updated_at, Integration.sync_token, Workspace.timezone
+    ).join(Workspace, Integration.workspace_id == Workspace.id).filter(
+        Integration.type == "calendar",
+        Integration.is_active == True
+    )
+    if integration_ids is not None:
+        query = query.filter(Integration.id.in_(integration_ids))
+
+    targets = []
+    for integration_id, workspace_id, updated_at, sync_token, zone_name in query.order_by(Integration.id).all():
+        try:
+            client = integration_registry.get_client(db, workspace_id, integration_id, updated_at)
+        except Exception as e:
+            client = e
+        targets.append((client, integration_id, workspace_id, sync_token, workspace_zone(zone_name)))
+
+    if not targets:
+        return []
+
+    results = asyncio.run(_fetch_all(targets))
+    for changes in results:
+        if changes.error:
+            logger.warning(f"Calendar sync failed for integration {changes.integration_id}: {changes.error}")
+            continue
+        try:
+            apply_changes(db, changes)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            changes.error = str(e)
+            logger.error(f"Could not apply calendar changes for integration {changes.integration_id}: {str(e)}")
+
+    return results
+
+
+def push_bookings(db: Session, booking_ids: List[int]) -> Dict[str, int]:
+    """Mirror bookings to their workspace's calendar with one batch request per calendar
+
+    Active bookings are inserted or patched (re-inserted if their event was
+    deleted on the calendar), cancelled ones with an event deleted. Pushed
+    events carry the booking ID so sync skips them.
+    """
+    if not booking_ids:
+        return {"pushed": 0, "failed": 0}
+
+    rows = db.execute(
+        select(
+            Booking.id, Booking.status, Booking.booking_date, Booking.booking_time, Booking.external_event_id,
+            Service.name, Service.duration_minutes, Service.location, Contact.full_name, Workspace.timezone,
+            Integration.id, Integration.workspace_id, Integration.updated_at
+        )
+        .join(Service, Booking.service_id == Service.id)
+        .join(Contact, Booking.contact_id == Contact.id)
+        .join(Workspace, Booking.workspace_id == Workspace.id)
+        .join(Integration, and_(
+            Integration.workspace_id == Booking.workspace_id,
+            Integration.type == "calendar",
+            Integration.is_active == True
+        ))
+        .where(Booking.id.in_(booking_ids))
+        .order_by(Booking.id, Integration.id)
+    ).all()
+
+    operations: Dict[int, List[Dict[str, Any]]] = {}
+    integrations = {}
+    seen = set()
+    for (booking_id, status, booking_date, booking_time, event_id, service_name, duration, location,
+         contact_name, zone_name, integration_id, workspace_id, updated_at) in rows:
+        if booking_id in seen:
+            continue  # Several calendars: mirror to the oldest
+        seen.add(booking_id)
+        integrations[integration_id] = (workspace_id, updated_at)
+
+        if status in ACTIVE_BOOKING_STATUSES:
+            start = datetime.combine(booking_date, booking_time)
+            body = {
+                "summary": f"{service_name} with {contact_name}",
+                "start": {"dateTime": start.isoformat(), "timeZone": workspace_zone(zone_name).key},
+                "end": {
+                    "dateTime": (start + timedelta(minutes=duration)).isoformat(),
+                    "timeZone": workspace_zone(zone_name).key
+                },
+                "extendedProperties": {"private": {BOOKING_PROPERTY: str(booking_id)}}
+            }
+            if location:
+                body["location"] = location
+            operation = {"key": str(booking_id), "method": "PATCH" if event_id else "POST", "body": body}
+            if event_id:
+                operation["event_id"] = event_id
+        elif event_id:
+            operation = {"key": str(booking_id), "method": "DELETE", "event_id": event_id}
+        else:
+            continue
+        operations.setdefault(integration_id, []).append(operation)
+
+    if not operations:
+        return {"pushed": 0, "failed": 0}
+
+    clients = {}
+    for integration_id, (workspace_id, updated_at) in integrations.items():
+        try:
+            clients[integration_id] = integration_registry.get_client(db, workspace_id, integration_id, updated_at)
+        except Exception as e:
+            logger.warning(f"No calendar client for integration {integration_id}: {str(e)}")
+
+    results = asyncio.run(_push_all(clients, operations))
+
+    # Events deleted on the calendar's side are recreated in the same run
+    recreate: Dict[int, List[Dict[str, Any]]] = {}
+    for integration_id, batch in operations.items():
+        outcome = results.get(integration_id, {})
+        for operation in batch:
+            if operation["method"] == "PATCH" and outcome.get(operation["key"], {}).get("status") in (404, 410):
+                recreate.setdefault(integration_id, []).append(
+                    {"key": operation["key"], "method": "POST", "body": operation["body"]}
+                )
+
+    if recreate:
+        recreated = asyncio.run(_push_all(clients, recreate))
+        for integration_id, batch in recreate.items():
+            posts = {operation["key"]: operation for operation in batch}
+            operations[integration_id] = [posts.get(operation["key"], operation) for operation in operations[integration_id]]
+            results[integration_id].update(recreated.get(integration_id, {}))
+
+    updates = []
+    failed = 0
+    for integration_id, batch in operations.items():
+        outcome = results.get(integration_id, {})
+        for operation in batch:
+            result = outcome.get(operation["key"], {"status": 0, "body": None})
+            if operation["method"] == "DELETE" and result["status"] in (200, 204, 404, 410):
+                updates.append({"b_booking_id": int(operation["key"]), "b_event_id": None})
+            elif operation["method"] == "POST" and result["status"] in (200, 201) and result["body"]:
+                updates.append({"b_booking_id": int(operation["key"]), "b_event_id": result["body"]["id"]})
+            elif result["status"] not in (200, 201):
+                failed += 1
+
+    if updates:
+        bookings = Booking.__table__
+        db.execute(
+            bookings.update()
+            .where(bookings.c.id == bindparam("b_booking_id"))
+            .values(external_event_id=bindparam("b_event_id"), updated_at=bookings.c.updated_at),
+            updates
+        )
+        db.commit()
+
+    return {"pushed": sum(len(batch) for batch in operations.values()) - failed, "failed": failed}
+
+
+async def _push_all(clients: Dict[int, Any], operations: Dict[int, List[Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+    timeout = aiohttp.ClientTimeout(total=settings.CALENDAR_SYNC_TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async def push(integration_id: int) -> Tuple[int, Dict[str, Any]]:
+            client = clients.get(integration_id)
+            if client is None:
+                return integration_id, {}
+            try:
+                return integration_id, await client.with_session(session).batch_events(operations[integration_id])
+            except Exception as e:
+                logger.warning(f"Calendar push failed for integration {integration_id}: {str(e)}")
+                return integration_id, {}
+
+        return dict(await asyncio.gather(*(push(integration_id) for integration_id in operations)))
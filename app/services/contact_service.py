@@ -1,14 +1,67 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
-from typing import List, Optional
+from sqlalchemy import or_, func, insert, text
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import csv
+import io
+import json
 from app.models.contact import Contact
 from app.models.conversation import Conversation
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactFormSubmission
+from app.schemas.contact import (
+    ContactCreate, ContactUpdate, ContactFormSubmission,
+    ContactImportError, ContactImportResponse
+)
 from app.utils.exceptions import NotFoundException, ValidationException
 from app.utils.validators import validate_email, validate_phone
 from app.automation.engine import automation_engine
 from app.websockets.manager import websocket_manager
+from app.services.unread_counter_service import unread_counter_service
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+
+# Accepted spellings of import columns, after lowercasing and replacing spaces with _
+IMPORT_COLUMN_ALIASES = {
+    "full_name": "full_name", "name": "full_name", "fullname": "full_name",
+    "email": "email", "email_address": "email", "e-mail": "email",
+    "phone": "phone", "phone_number": "phone", "mobile": "phone",
+    "preferred_channel": "preferred_channel", "channel": "preferred_channel",
+}
+
+
+def _normalize_import_row(raw: Dict[str, Any]) -> Dict[str, str]:
+    row = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        column = IMPORT_COLUMN_ALIASES.get(str(key).strip().lower().replace(" ", "_"))
+        if column and value is not None:
+            row[column] = str(value).strip()
+    return row
+
+
+def iter_import_rows(file, filename: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Parse an uploaded CSV or JSON lines file one row at a time
+
+    Yields (row number, record), numbered as users see the file: the
+    spreadsheet row for CSV (the first row under the header is 2) and the
+    line number for JSON lines.
+    """
+    text_stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+
+    if filename.lower().endswith((".jsonl", ".ndjson")):
+        for line_number, line in enumerate(text_stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_number, record if isinstance(record, dict) else {"_error": "Invalid JSON line"}
+    else:
+        yield from enumerate(csv.DictReader(text_stream), start=2)
 
 
 class ContactService:
@@ -122,10 +175,11 @@ class ContactService:
                 db.add(message)
                 
                 # Update conversation
-                conversation.last_message_at = datetime.utcnow()
-                conversation.unread_count += 1
+                conversation.record_message(message)
+                unread_delta = unread_counter_service.record_inbound(db, conversation)
                 
                 db.commit()
+                await unread_counter_service.publish(workspace_id, unread_delta)
         
         # Trigger automation: contact_created event
         await automation_engine.trigger_event("contact_created", {
@@ -190,4 +244,164 @@ class ContactService:
         
         # Delete associated conversation and messages (CASCADE should handle this)
         db.delete(contact)
-        db.commit()
\ No newline at end of file
+        db.commit()
+    
+    async def import_contacts(
+        self,
+        db: Session,
+        workspace_id: int,
+        rows: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> ContactImportResponse:
+        """Bulk import contacts from (row number, record) pairs of iter_import_rows
+        
+        Runs in a worker thread; see _import_contacts.
+        """
+        result = await asyncio.to_thread(self._import_contacts, db, workspace_id, rows)
+        
+        await websocket_manager.emit_to_workspace(workspace_id, "contacts_imported", {
+            "created": result.created,
+            "duplicates": result.duplicates,
+            "failed": result.failed
+        })
+        
+        return result
+    
+    def _import_contacts(
+        self,
+        db: Session,
+        workspace_id: int,
+        rows: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> ContactImportResponse:
+        """Validate, dedupe and insert rows in batches of IMPORT_BATCH_SIZE
+        
+        Each batch checks existing emails with one query, inserts contacts and
+        their conversations with multi-row INSERT ... RETURNING and commits, so
+        a failure part-way keeps earlier batches. Automations are not triggered
+        for imported contacts.
+        """
+        result = ContactImportResponse(total_rows=0, created=0, duplicates=0, failed=0, errors=[])
+        seen_emails = set()
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        
+        for row_number, raw in rows:
+            result.total_rows += 1
+            
+            contact, error = self._validate_import_row(raw)
+            if error:
+                self._record_import_error(result, row_number, error)
+                continue
+            
+            if contact["email"]:
+                if contact["email"] in seen_emails:
+                    result.duplicates += 1
+                    continue
+                seen_emails.add(contact["email"])
+            
+            batch.append((row_number, contact))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                self._insert_import_batch(db, workspace_id, batch, result)
+                batch = []
+        
+        if batch:
+            self._insert_import_batch(db, workspace_id, batch, result)
+        
+        return result
+    
+    def _validate_import_row(self, raw: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if "_error" in raw:
+            return None, raw["_error"]
+        
+        row = _normalize_import_row(raw)
+        
+        full_name = row.get("full_name")
+        if not full_name:
+            return None, "Missing name"
+        
+        email = (row.get("email") or "").lower() or None
+        if email and not validate_email(email):
+            return None, f"Invalid email: {email}"
+        
+        phone = row.get("phone") or None
+        if phone and not validate_phone(phone):
+            return None, f"Invalid phone: {phone}"
+        
+        preferred_channel = (row.get("preferred_channel") or "email").lower()
+        if preferred_channel not in ("email", "sms"):
+            return None, f"Invalid preferred channel: {preferred_channel}"
+        
+        return {
+            "full_name": full_name,
+            "email": email,
+            "phone": phone,
+            "preferred_channel": preferred_channel
+        }, None
+    
+    def _insert_import_batch(
+        self,
+        db: Session,
+        workspace_id: int,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        result: ContactImportResponse
+    ):
+        now = datetime.utcnow()
+        
+        try:
+            if db.bind.dialect.name == "postgresql":
+                # Serialize imports per workspace so concurrent uploads can't both insert an email
+                db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": workspace_id})
+            
+            emails = [contact["email"] for _, contact in batch if contact["email"]]
+            existing = set()
+            if emails:
+                existing = {
+                    email for (email,) in db.query(func.lower(Contact.email)).filter(
+                        Contact.workspace_id == workspace_id,
+                        func.lower(Contact.email).in_(emails)
+                    )
+                }
+            
+            new_contacts = []
+            for _, contact in batch:
+                if contact["email"] in existing:
+                    result.duplicates += 1
+                    continue
+                new_contacts.append({
+                    **contact,
+                    "workspace_id": workspace_id,
+                    "created_at": now,
+                    "updated_at": now
+                })
+            
+            if not new_contacts:
+                db.commit()
+                return
+            
+            contact_ids = db.execute(
+                insert(Contact).returning(Contact.id), new_contacts
+            ).scalars().all()
+            
+            db.execute(insert(Conversation), [
+                {
+                    "contact_id": contact_id,
+                    "workspace_id": workspace_id,
+                    "status": "active",
+                    "automation_paused": False,
+                    "unread_count": 0,
+                    "last_message_at": now,
+                    "created_at": now,
+                    "updated_at": now
+                }
+                for contact_id in contact_ids
+            ])
+            db.commit()
+            result.created += len(contact_ids)
+        
+        except Exception as e:
+            db.rollback()
+            for row_number, _ in batch:
+                self._record_import_error(result, row_number, f"Batch failed: {getattr(e, 'orig', e)}")
+    
+    def _record_import_error(self, result: ContactImportResponse, row_number: int, error: str):
+        result.failed += 1
+        if len(result.errors) < IMPORT_MAX_ERRORS:
+            result.errors.append(ContactImportError(row=row_number, error=error))
@@ -1,13 +1,19 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
-from typing import List, Dict, Any
-from datetime import datetime
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import desc, tuple_
+from typing import List, Dict, Any, Optional
+import logging
 from app.models.conversation import Conversation
 from app.models.message import Message, MessageType, MessageDirection
 from app.models.contact import Contact
-from app.schemas.conversation import MessageSend, ConversationDetail
+from app.schemas.conversation import MessageSend, ConversationDetail, MessagePage
+from app.services.unread_counter_service import unread_counter_service
+from app.tasks.message_tasks import enqueue_dispatch
 from app.utils.exceptions import NotFoundException, ValidationException
 
+logger = logging.getLogger(__name__)
+
+MESSAGE_PAGE_SIZE = 50
+
 
 class ConversationService:
     async def list_conversations(
@@ -18,9 +24,15 @@ class ConversationService:
         limit: int = 100,
         status: str = "active"
     ) -> List[Conversation]:
-        """List conversations for workspace"""
-        query = db.query(Conversation).options(
-            joinedload(Conversation.contact)
+        """List the inbox: conversations with contact and last message preview
+
+        Renders in one query over ix_conversations_inbox; the preview columns
+        are maintained by Conversation.record_message, so no messages are read.
+        """
+        query = db.query(Conversation).join(
+            Conversation.contact
+        ).options(
+            contains_eager(Conversation.contact)
         ).filter(
             Conversation.workspace_id == workspace_id
         )
@@ -28,18 +40,22 @@ class ConversationService:
         if status != "all":
             query = query.filter(Conversation.status == status)
         
-        return query.order_by(desc(Conversation.last_message_at)).offset(skip).limit(limit).all()
+        return query.order_by(
+            desc(Conversation.last_message_at), desc(Conversation.id)
+        ).offset(skip).limit(limit).all()
     
     async def get_conversation_detail(
         self,
         db: Session,
         conversation_id: int,
-        workspace_id: int
+        workspace_id: int,
+        message_limit: int = MESSAGE_PAGE_SIZE
     ) -> ConversationDetail:
-        """Get conversation with messages"""
-        conversation = db.query(Conversation).options(
-            joinedload(Conversation.contact),
-            joinedload(Conversation.messages).joinedload(Message.sent_by_user)
+        """Get conversation with its most recent page of messages"""
+        conversation = db.query(Conversation).join(
+            Conversation.contact
+        ).options(
+            contains_eager(Conversation.contact)
         ).filter(
             Conversation.id == conversation_id,
             Conversation.workspace_id == workspace_id
@@ -49,22 +65,80 @@ class ConversationService:
             raise NotFoundException("Conversation not found")
         
         # Mark as read
-        if conversation.unread_count > 0:
-            conversation.unread_count = 0
+        unread_delta = unread_counter_service.mark_read(db, conversation)
+        if unread_delta != (0, 0):
             db.commit()
+            await unread_counter_service.publish(workspace_id, unread_delta)
         
         # Convert to response format
         return ConversationDetail(
             id=conversation.id,
+            contact_id=conversation.contact_id,
+            workspace_id=conversation.workspace_id,
             contact=conversation.contact,
             status=conversation.status,
             automation_paused=conversation.automation_paused,
             unread_count=conversation.unread_count,
             last_message_at=conversation.last_message_at,
-            messages=sorted(conversation.messages, key=lambda m: m.created_at),
+            last_message_preview=conversation.last_message_preview,
+            messages=self._message_page(db, conversation.id, None, message_limit),
             created_at=conversation.created_at
         )
     
+    async def list_messages(
+        self,
+        db: Session,
+        conversation_id: int,
+        workspace_id: int,
+        before: Optional[int] = None,
+        limit: int = MESSAGE_PAGE_SIZE
+    ) -> MessagePage:
+        """Page backwards through a conversation's history, newest page first"""
+        conversation = db.query(Conversation.id).filter(
+            Conversation.id == conversation_id,
+            Conversation.workspace_id == workspace_id
+        ).first()
+        
+        if not conversation:
+            raise NotFoundException("Conversation not found")
+        
+        return self._message_page(db, conversation_id, before, limit)
+    
+    def _message_page(
+        self,
+        db: Session,
+        conversation_id: int,
+        before: Optional[int],
+        limit: int
+    ) -> MessagePage:
+        """Keyset page on (created_at, id) over ix_messages_conversation_created
+
+        Fetches one extra row to tell whether older messages remain, so no
+        COUNT or OFFSET is needed however long the thread is.
+        """
+        query = db.query(Message).filter(Message.conversation_id == conversation_id)
+        
+        if before is not None:
+            cursor = db.query(Message.created_at, Message.id).filter(
+                Message.id == before,
+                Message.conversation_id == conversation_id
+            ).first()
+            if not cursor:
+                raise ValidationException("Invalid message cursor")
+            query = query.filter(tuple_(Message.created_at, Message.id) < tuple_(*cursor))
+        
+        rows = query.order_by(desc(Message.created_at), desc(Message.id)).limit(limit + 1).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        rows.reverse()
+        
+        return MessagePage(
+            messages=rows,
+            has_more=has_more,
+            next_before=rows[0].id if has_more else None
+        )
+    
     async def send_message(
         self,
         db: Session,
@@ -100,20 +174,22 @@ class ConversationService:
         
         db.add(message)
         db.flush()  # Get message ID
+        message_id = message.id
         
         # Update conversation
-        conversation.last_message_at = datetime.utcnow()
+        conversation.record_message(message)
         conversation.automation_paused = True  # Pause automation when staff replies
         
         db.commit()
-        db.refresh(message)
         
-        # Queue actual message sending task
-        # from app.tasks.email_tasks import send_message_task
-        # send_message_task.delay(message.id)
+        # Hand off to the dispatch pipeline; the sweep re-enqueues it if this is lost
+        try:
+            enqueue_dispatch([message_id])
+        except Exception as e:
+            logger.warning(f"Could not enqueue message {message_id}, leaving it for the dispatch sweep: {str(e)}")
         
         return {
-            "message_id": message.id,
+            "message_id": message_id,
             "status": "queued",
             "message": "Message queued for sending"
         }
@@ -139,21 +215,5 @@ class ConversationService:
         return {"message": "Automation paused for this conversation"}
     
     async def get_unread_count(self, db: Session, workspace_id: int) -> Dict[str, Any]:
-        """Get total unread message count"""
-        total_unread = db.query(
-            db.func.sum(Conversation.unread_count)
-        ).filter(
-            Conversation.workspace_id == workspace_id,
-            Conversation.status == "active"
-        ).scalar() or 0
-        
-        unread_conversations = db.query(Conversation).filter(
-            Conversation.workspace_id == workspace_id,
-            Conversation.status == "active",
-            Conversation.unread_count > 0
-        ).count()
-        
-        return {
-            "total_unread_messages": int(total_unread),
-            "unread_conversations": unread_conversations
-        }
\ No newline at end of file
+        """Get total unread message count, served from the Redis badge counters"""
+        return unread_counter_service.get(db, workspace_id)
@@ -0,0 +1,88 @@
+from sqlalchemy.orm import Session
+from typing import Iterator, List
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.form import Form
+from app.schemas.export import ExportJobCreate
+from app.services.export_storage import get_export_storage
+from app.tasks.export_tasks import run_export_job
+from app.utils.exceptions import NotFoundException, ValidationException
+
+
+class ExportJobService:
+    async def create_job(
+        self,
+        db: Session,
+        workspace_id: int,
+        user_id: int,
+        job_data: ExportJobCreate
+    ) -> ExportJob:
+        """Create an export job and queue it for a worker"""
+        params = {}
+        if job_data.export_type == "submissions":
+            form = db.query(Form.id).filter(
+                Form.id == job_data.form_id, Form.workspace_id == workspace_id
+            ).first()
+            if not form:
+                raise NotFoundException("Form not found")
+            params["form_id"] = job_data.form_id
+        
+        job = ExportJob(
+            workspace_id=workspace_id,
+            created_by=user_id,
+            export_type=job_data.export_type,
+            format=job_data.format,
+            params=params,
+            status=ExportJobStatus.PENDING.value
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        
+        run_export_job.delay(job.id)
+        return job
+    
+    async def list_jobs(self, db: Session, workspace_id: int, skip: int = 0, limit: int = 50) -> List[ExportJob]:
+        """List export jobs, newest first"""
+        return db.query(ExportJob).filter(
+            ExportJob.workspace_id == workspace_id
+        ).order_by(ExportJob.created_at.desc()).offset(skip).limit(limit).all()
+    
+    async def get_job(self, db: Session, job_id: int, workspace_id: int) -> ExportJob:
+        """Get export job by ID"""
+        job = db.query(ExportJob).filter(
+            ExportJob.id == job_id,
+            ExportJob.workspace_id == workspace_id
+        ).first()
+        
+        if not job:
+            raise NotFoundException("Export job not found")
+        
+        return job
+    
+    async def delete_job(self, db: Session, job_id: int, workspace_id: int):
+        """Delete export job and its stored output"""
+        job = await self.get_job(db, job_id, workspace_id)
+        
+        if job.status == ExportJobStatus.RUNNING.value:
+            raise ValidationException("Export is still running")
+        
+        get_export_storage().delete(job.chunk_keys)
+        db.delete(job)
+        db.commit()
+    
+    def iter_download(self, job: ExportJob) -> Iterator[bytes]:
+        """Stream a completed export by concatenating its stored chunks"""
+        if job.status != ExportJobStatus.COMPLETED.value:
+            raise ValidationException("Export is not ready")
+        
+        storage = get_export_storage()
+        keys = job.chunk_keys
+        
+        def generate():
+            for key in keys:
+                yield from storage.read(key)
+        
+        return generate()
+    
+    def download_filename(self, job: ExportJob) -> str:
+        return f"{job.export_type}_export_{job.id}.{job.format}"
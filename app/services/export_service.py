@@ -1,41 +1,383 @@
 import csv
 import io
-from sqlalchemy.orm import Session
-from app.models.submission import FormSubmission
-from typing import Optional
+import os
+import re
+import json
+import tempfile
 from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import orjson
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.form import Form, CustomFormSubmission
+from app.models.contact import Contact
+from app.models.booking import Booking
+from app.models.service import Service
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.services.form_validation import LAYOUT_TYPES
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+# Rows written to the CSV buffer before it is flushed to the client
+CSV_FLUSH_ROWS = 500
+
+BASE_COLUMNS = [
+    ("id", "ID"),
+    ("created_at", "Submitted At"),
+    ("status", "Status"),
+    ("submitter_name", "Name"),
+    ("submitter_email", "Email"),
+    ("submitter_phone", "Phone"),
+]
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+WORKSPACE_EXPORT_COLUMNS = {
+    "contacts": ["ID", "Name", "Email", "Phone", "Preferred Channel", "Created At"],
+    "bookings": ["ID", "Date", "Time", "Status", "Contact", "Contact Email", "Service", "Notes", "Created At"],
+    "messages": ["ID", "Conversation ID", "Contact", "Channel", "Direction", "Status", "Subject", "Content", "Sent At"],
+}
+
+EXPORT_TYPES = ("submissions",) + tuple(WORKSPACE_EXPORT_COLUMNS)
+
+
+def _format_datetime(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+
+def _enum_value(value: Any) -> str:
+    if value is None:
+        return ""
+    return getattr(value, "value", value)
+
+
+def _format_answer(value: Any) -> Any:
+    """Flatten one answer into a single cell value"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    return value
+
 
 class ExportService:
     def __init__(self, db: Session):
         self.db = db
 
-    def export_submissions(self, business_id: str, form_id: Optional[str] = None) -> dict:
-        """Export submissions to CSV"""
-        query = self.db.query(FormSubmission).filter(
-            FormSubmission.business_id == business_id
+    def submission_columns(self, form: Form) -> Tuple[List[str], List[str]]:
+        """Column headers and the submitted_data key for each answer column
+
+        Answer columns follow the form's field order; layout-only fields are
+        skipped and duplicate labels are disambiguated with the field id.
+        """
+        fields = [
+            field for field in (form.fields or [])
+            if field.get("id") and field.get("type") not in LAYOUT_TYPES
+        ]
+        fields.sort(key=lambda field: field.get("order", 0))
+
+        headers = [label for _, label in BASE_COLUMNS]
+        field_ids = []
+        seen = set(headers)
+
+        for field in fields:
+            label = field.get("label") or field["id"]
+            if label in seen:
+                label = f"{label} ({field['id']})"
+            seen.add(label)
+            headers.append(label)
+            field_ids.append(field["id"])
+
+        return headers, field_ids
+
+    def iter_submission_rows(
+        self,
+        form: Form,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        """Yield one flattened row per submission, in id order
+
+        Rows are read through a server-side cursor in batches of
+        EXPORT_BATCH_SIZE, so memory stays flat regardless of export size.
+        """
+        _, field_ids = self.submission_columns(form)
+
+        query = self.db.query(
+            CustomFormSubmission.id,
+            CustomFormSubmission.created_at,
+            CustomFormSubmission.status,
+            CustomFormSubmission.submitter_name,
+            CustomFormSubmission.submitter_email,
+            CustomFormSubmission.submitter_phone,
+            CustomFormSubmission.submitted_data
+        ).filter(
+            CustomFormSubmission.form_id == form.id,
+            CustomFormSubmission.workspace_id == form.workspace_id
         )
 
-        if form_id:
-            query = query.filter(FormSubmission.form_id == form_id)
-
-        submissions = query.all()
-
-        output = io.StringIO()
-        fieldnames = ['id', 'created_at', 'status', 'submitter_email', 'submitter_name', 'submitter_phone']
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for submission in submissions:
-            writer.writerow({
-                'id': submission.id,
-                'created_at': submission.created_at.isoformat(),
-                'status': submission.status,
-                'submitter_email': submission.submitter_email,
-                'submitter_name': submission.submitter_name,
-                'submitter_phone': submission.submitter_phone
-            })
-
-        return {
-            "filename": f"submissions_{datetime.now().strftime('%Y%m%d')}.csv",
-            "content": output.getvalue()
-        }
\ No newline at end of file
+        for row in self._keyset(query, CustomFormSubmission.id, after_id, limit):
+            answers = row.submitted_data or {}
+            yield [
+                row.id,
+                _format_datetime(row.created_at),
+                row.status or "",
+                row.submitter_name or "",
+                row.submitter_email or "",
+                row.submitter_phone or "",
+            ] + [_format_answer(answers.get(field_id)) for field_id in field_ids]
+
+    def export_columns(self, export_type: str, workspace_id: int, params: Dict[str, Any]) -> List[str]:
+        """Column headers for a workspace export; the first column is always the row id"""
+        if export_type == "submissions":
+            headers, _ = self.submission_columns(self._get_export_form(workspace_id, params))
+            return headers
+        return list(WORKSPACE_EXPORT_COLUMNS[export_type])
+
+    def iter_export_rows(
+        self,
+        export_type: str,
+        workspace_id: int,
+        params: Dict[str, Any],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        """Yield rows for a workspace export in id order, starting after after_id
+
+        Used by background export jobs, which read one keyset chunk per call.
+        """
+        if export_type == "submissions":
+            form = self._get_export_form(workspace_id, params)
+            yield from self.iter_submission_rows(form, after_id, limit)
+        elif export_type == "contacts":
+            yield from self._iter_contact_rows(workspace_id, after_id, limit)
+        elif export_type == "bookings":
+            yield from self._iter_booking_rows(workspace_id, after_id, limit)
+        elif export_type == "messages":
+            yield from self._iter_message_rows(workspace_id, after_id, limit)
+        else:
+            raise ValueError(f"Unknown export type: {export_type}")
+
+    def count_export_rows(self, export_type: str, workspace_id: int, params: Dict[str, Any]) -> int:
+        """Total rows for a workspace export, used for progress reporting"""
+        if export_type == "submissions":
+            form = self._get_export_form(workspace_id, params)
+            query = self.db.query(func.count(CustomFormSubmission.id)).filter(
+                CustomFormSubmission.form_id == form.id,
+                CustomFormSubmission.workspace_id == workspace_id
+            )
+        elif export_type == "contacts":
+            query = self.db.query(func.count(Contact.id)).filter(Contact.workspace_id == workspace_id)
+        elif export_type == "bookings":
+            query = self.db.query(func.count(Booking.id)).filter(Booking.workspace_id == workspace_id)
+        elif export_type == "messages":
+            query = self.db.query(func.count(Message.id)).join(
+                Conversation, Message.conversation_id == Conversation.id
+            ).filter(Conversation.workspace_id == workspace_id)
+        else:
+            raise ValueError(f"Unknown export type: {export_type}")
+
+        return query.scalar() or 0
+
+    def _get_export_form(self, workspace_id: int, params: Dict[str, Any]) -> Form:
+        form = self.db.query(Form).filter(
+            Form.id == params.get("form_id"), Form.workspace_id == workspace_id
+        ).first()
+        if not form:
+            raise ValueError("Form not found")
+        return form
+
+    def _iter_contact_rows(self, workspace_id: int, after_id: Optional[int], limit: Optional[int]) -> Iterator[List[Any]]:
+        query = self.db.query(
+            Contact.id,
+            Contact.full_name,
+            Contact.email,
+            Contact.phone,
+            Contact.preferred_channel,
+            Contact.created_at
+        ).filter(Contact.workspace_id == workspace_id)
+
+        for row in self._keyset(query, Contact.id, after_id, limit):
+            yield [
+                row.id,
+                row.full_name,
+                row.email or "",
+                row.phone or "",
+                row.preferred_channel or "",
+                _format_datetime(row.created_at),
+            ]
+
+    def _iter_booking_rows(self, workspace_id: int, after_id: Optional[int], limit: Optional[int]) -> Iterator[List[Any]]:
+        query = self.db.query(
+            Booking.id,
+            Booking.booking_date,
+            Booking.booking_time,
+            Booking.status,
+            Contact.full_name,
+            Contact.email,
+            Service.name.label("service_name"),
+            Booking.notes,
+            Booking.created_at
+        ).join(Contact, Booking.contact_id == Contact.id).join(
+            Service, Booking.service_id == Service.id
+        ).filter(Booking.workspace_id == workspace_id)
+
+        for row in self._keyset(query, Booking.id, after_id, limit):
+            yield [
+                row.id,
+                row.booking_date.isoformat() if row.booking_date else "",
+                row.booking_time.strftime("%H:%M") if row.booking_time else "",
+                _enum_value(row.status),
+                row.full_name,
+                row.email or "",
+                row.service_name,
+                row.notes or "",
+                _format_datetime(row.created_at),
+            ]
+
+    def _iter_message_rows(self, workspace_id: int, after_id: Optional[int], limit: Optional[int]) -> Iterator[List[Any]]:
+        query = self.db.query(
+            Message.id,
+            Message.conversation_id,
+            Contact.full_name,
+            Message.type,
+            Message.direction,
+            Message.status,
+            Message.subject,
+            Message.content,
+            Message.created_at
+        ).join(Conversation, Message.conversation_id == Conversation.id).join(
+            Contact, Conversation.contact_id == Contact.id
+        ).filter(Conversation.workspace_id == workspace_id)
+
+        for row in self._keyset(query, Message.id, after_id, limit):
+            yield [
+                row.id,
+                row.conversation_id,
+                row.full_name,
+                _enum_value(row.type),
+                _enum_value(row.direction),
+                row.status or "",
+                row.subject or "",
+                row.content,
+                _format_datetime(row.created_at),
+            ]
+
+    def _keyset(self, query, id_column, after_id: Optional[int], limit: Optional[int]):
+        """Order by id, resume after after_id and stream through a server-side cursor"""
+        if after_id is not None:
+            query = query.filter(id_column > after_id)
+
+        query = query.order_by(id_column)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+
+    def stream_submissions_csv(self, form: Form) -> Iterator[bytes]:
+        """CSV export as a byte stream for StreamingResponse"""
+        headers, _ = self.submission_columns(form)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(headers)
+
+        pending = 0
+        for row in self.iter_submission_rows(form):
+            writer.writerow(row)
+            pending += 1
+            if pending >= CSV_FLUSH_ROWS:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        yield buffer.getvalue().encode("utf-8")
+
+    def stream_submissions_json(self, form: Form) -> Iterator[bytes]:
+        """JSON array export as a byte stream, one object per submission"""
+        headers, _ = self.submission_columns(form)
+
+        yield b"["
+        first = True
+        for row in self.iter_submission_rows(form):
+            item = orjson.dumps(dict(zip(headers, row)))
+            yield item if first else b"," + item
+            first = False
+        yield b"]"
+
+    def write_submissions_xlsx(self, form: Form) -> str:
+        """Write the export to a temporary .xlsx file and return its path
+
+        openpyxl's write-only mode streams rows to disk, so the workbook is
+        never held in memory. The caller is responsible for removing the file.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+        headers, _ = self.submission_columns(form)
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title="Submissions")
+        sheet.append(headers)
+
+        for row in self.iter_submission_rows(form):
+            # Free-text answers may contain control characters Excel rejects
+            sheet.append([
+                ILLEGAL_CHARACTERS_RE.sub("", value) if isinstance(value, str) else value
+                for value in row
+            ])
+
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        try:
+            workbook.save(path)
+        except Exception:
+            os.remove(path)
+            raise
+        return path
+
+    def export_filename(self, form: Form, extension: str) -> str:
+        """Download filename, e.g. patient_intake_submissions_20240101.csv"""
+        slug = re.sub(r"[^a-z0-9]+", "_", (form.name or "form").lower()).strip("_") or "form"
+        return f"{slug}_submissions_{datetime.now().strftime('%Y%m%d')}.{extension}"
+
+
+def encode_rows(export_format: str, headers: List[str], rows: List[List[Any]]) -> bytes:
+    """Encode a chunk of rows as CSV (without header) or JSON lines"""
+    if export_format == "jsonl":
+        return b"".join(orjson.dumps(dict(zip(headers, row))) + b"\n" for row in rows)
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def encode_csv_header(headers: List[str]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(headers)
+    return buffer.getvalue().encode("utf-8")
+
+
+def iter_file(path: str, chunk_size: int = 64 * 1024, remove: bool = False) -> Iterator[bytes]:
+    """Read a file in chunks for StreamingResponse, optionally deleting it afterwards"""
+    try:
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        if remove:
+            os.remove(path)
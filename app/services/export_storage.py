@@ -0,0 +1,85 @@
+import os
+import logging
+from typing import Iterator, List
+import requests
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class LocalExportStorage:
+    """Export chunks on a local (or shared network) filesystem"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def write(self, key: str, data: bytes):
+        """Write object atomically, replacing any partial write from a previous attempt"""
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def read(self, key: str) -> Iterator[bytes]:
+        with open(os.path.join(self.root, key), "rb") as f:
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def delete(self, keys: List[str]):
+        for key in keys:
+            try:
+                os.remove(os.path.join(self.root, key))
+            except FileNotFoundError:
+                pass
+
+
+class SupabaseExportStorage:
+    """Export chunks in a private Supabase storage bucket"""
+
+    def __init__(self, url: str, service_key: str, bucket: str):
+        self.base_url = f"{url}/storage/v1/object"
+        self.bucket = bucket
+        self.headers = {"Authorization": f"Bearer {service_key}"}
+
+    def write(self, key: str, data: bytes):
+        # Upsert so a chunk rewritten after a worker restart replaces the old one
+        response = requests.post(
+            f"{self.base_url}/{self.bucket}/{key}",
+            headers={**self.headers, "Content-Type": "application/octet-stream", "x-upsert": "true"},
+            data=data,
+            timeout=60
+        )
+        if response.status_code != 200:
+            raise Exception(f"Supabase upload failed: {response.text}")
+
+    def read(self, key: str) -> Iterator[bytes]:
+        with requests.get(
+            f"{self.base_url}/{self.bucket}/{key}", headers=self.headers, stream=True, timeout=60
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_content(READ_CHUNK_SIZE)
+
+    def delete(self, keys: List[str]):
+        if not keys:
+            return
+        response = requests.delete(
+            f"{self.base_url}/{self.bucket}", headers=self.headers, json={"prefixes": keys}, timeout=60
+        )
+        if response.status_code != 200:
+            logger.warning(f"Supabase delete failed: {response.text}")
+
+
+def get_export_storage():
+    """Storage backend for export chunks, selected by EXPORT_STORAGE_BACKEND"""
+    if settings.EXPORT_STORAGE_BACKEND == "supabase":
+        return SupabaseExportStorage(
+            settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY, settings.EXPORT_STORAGE_BUCKET
+        )
+    return LocalExportStorage(settings.EXPORT_STORAGE_DIR)
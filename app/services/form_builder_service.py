@@ -7,13 +7,37 @@ from app.models.workspace import Workspace
 from app.schemas.form import (
     FormCreateCustom, FormCreateExternal, FormCreateDocument, 
     FormUpdate, FormResponse, FormSubmissionCreate, FormSubmissionUpdate,
-    CustomFormSubmissionResponse, PublicFormResponse, FormAnalytics
+    CustomFormSubmissionResponse, PublicFormResponse, FormAnalytics,
+    FormResponseList, CustomFormSubmissionResponseList
 )
+from app.services.form_counter_service import form_counter_service
+from app.services.form_validation import CompiledFormValidator, REQUIRED_MESSAGE
+from app.utils.cache import TTLCache
+from app.utils.response_cache import response_cache, workspace_tag
+from app.config import settings
 import uuid
 import secrets
 from datetime import datetime, timedelta
 import json
 
+# Published form definitions by share link. Per process, so other workers may
+# serve a stale definition for up to the TTL after an update.
+public_form_cache = TTLCache(ttl_seconds=settings.PUBLIC_FORM_CACHE_TTL_SECONDS)
+
+
+class CachedPublicForm:
+    """Published form definition as served to the public"""
+    
+    def __init__(
+        self, form_id: int, workspace_id: int,
+        response: PublicFormResponse, validator: CompiledFormValidator
+    ):
+        self.form_id = form_id
+        self.workspace_id = workspace_id
+        self.response = response
+        self.validator = validator
+
+
 class FormBuilderService:
     """Service for custom form builder operations"""
     
@@ -103,7 +127,30 @@ class FormBuilderService:
     
     async def get_public_form(self, db: Session, share_link: str) -> PublicFormResponse:
         """Get form by public share link (no auth required)"""
-        db_form = db.query(Form).filter(
+        entry = await self.get_public_form_entry(db, share_link)
+        self.record_view(db, entry.form_id)
+        return entry.response
+    
+    def record_view(self, db: Session, form_id: int):
+        """Count a public form view"""
+        # Views are buffered and flushed to the forms table in batches
+        form_counter_service.incr(db, form_id, "views_count")
+    
+    async def get_public_form_entry(
+        self, db: Session, share_link: str, use_cache: bool = True
+    ) -> CachedPublicForm:
+        """Get published form definition from cache, loading it on a miss
+        
+        use_cache=False always reads the form, e.g. when rendering a response
+        that is itself cached for longer than this process's copy.
+        """
+        entry = public_form_cache.get(share_link) if use_cache else None
+        if entry is not None:
+            return entry
+        
+        row = db.query(Form, Workspace.name).outerjoin(
+            Workspace, Workspace.id == Form.workspace_id
+        ).filter(
             and_(
                 Form.share_link == share_link,
                 Form.is_published == True,
@@ -111,24 +158,33 @@ class FormBuilderService:
             )
         ).first()
         
-        if not db_form:
+        if not row:
             raise HTTPException(status_code=404, detail="Form not found or not published")
         
-        # Increment view count
-        db_form.views_count += 1
-        db.commit()
-        
-        # Get workspace name for branding
-        workspace = db.query(Workspace).filter(Workspace.id == db_form.workspace_id).first()
+        db_form, workspace_name = row
         
-        return PublicFormResponse(
-            id=db_form.id,
-            name=db_form.name,
-            description=db_form.description,
-            fields=db_form.fields or [],
-            settings=db_form.settings or {},
-            workspace_name=workspace.name if workspace else None
+        entry = CachedPublicForm(
+            form_id=db_form.id,
+            workspace_id=db_form.workspace_id,
+            response=PublicFormResponse(
+                id=db_form.id,
+                name=db_form.name,
+                description=db_form.description,
+                fields=db_form.fields or [],
+                settings=db_form.settings or {},
+                workspace_name=workspace_name
+            ),
+            validator=CompiledFormValidator(db_form.fields or [])
         )
+        public_form_cache.set(share_link, entry)
+        
+        return entry
+    
+    def invalidate_public_form(self, share_link: Optional[str], workspace_id: int):
+        """Drop cached public definition and rendered pages after the form changes"""
+        if share_link:
+            public_form_cache.delete(share_link)
+        response_cache.purge([workspace_tag(workspace_id)])
     
     async def update_form(
         self, db: Session, form_id: int, workspace_id: int, form_data: FormUpdate
@@ -152,6 +208,8 @@ class FormBuilderService:
         db.commit()
         db.refresh(db_form)
         
+        self.invalidate_public_form(db_form.share_link, workspace_id)
+        
         return FormResponse.from_orm(db_form)
     
     async def publish_form(self, db: Session, form_id: int, workspace_id: int) -> FormResponse:
@@ -173,6 +231,8 @@ class FormBuilderService:
         db.commit()
         db.refresh(db_form)
         
+        self.invalidate_public_form(db_form.share_link, workspace_id)
+        
         return FormResponse.from_orm(db_form)
     
     async def duplicate_form(
@@ -219,9 +279,12 @@ class FormBuilderService:
         if not db_form:
             raise HTTPException(status_code=404, detail="Form not found")
         
+        share_link = db_form.share_link
         db.delete(db_form)
         db.commit()
         
+        self.invalidate_public_form(share_link, workspace_id)
+        
         return True
     
     async def list_forms(
@@ -250,7 +313,7 @@ class FormBuilderService:
         offset = (page - 1) * per_page
         forms = query.offset(offset).limit(per_page).all()
         
-        return [FormResponse.from_orm(form) for form in forms]
+        return FormResponseList.validate_python(forms, from_attributes=True)
     
     async def get_form_analytics(
         self, db: Session, form_id: int, workspace_id: int
@@ -281,28 +344,23 @@ class FormBuilderService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
     ) -> CustomFormSubmissionResponse:
-        """Submit form response (public endpoint)"""
-        
-        # Get form
-        db_form = db.query(Form).filter(
-            and_(
-                Form.share_link == share_link,
-                Form.is_published == True,
-                Form.is_active == True
-            )
-        ).first()
-        
-        if not db_form:
-            raise HTTPException(status_code=404, detail="Form not found")
-        
-        # Validate submission data against form fields
-        if db_form.fields:
-            self._validate_submission_data(db_form.fields, submission_data.submitted_data)
+        """Submit form response (public endpoint)
+        
+        Submission and lead are written in one transaction; the lead gets its
+        form_submission_id through the relationship at flush time. The form's
+        submissions_count is bumped through the batched counter buffer rather
+        than on the (hot) form row.
+        """
+        # Published form definition (cached), with compiled validation rules
+        entry = await self.get_public_form_entry(db, share_link)
+        errors = entry.validator.validate(submission_data.submitted_data)
+        if errors:
+            self._raise_validation_errors(errors)
         
         # Create submission
         db_submission = CustomFormSubmission(
-            form_id=db_form.id,
-            workspace_id=db_form.workspace_id,
+            form_id=entry.form_id,
+            workspace_id=entry.workspace_id,
             submitted_data=submission_data.submitted_data,
             submitter_email=submission_data.submitter_email,
             submitter_name=submission_data.submitter_name,
@@ -311,32 +369,26 @@ class FormBuilderService:
             user_agent=user_agent
         )
         
-        db.add(db_submission)
-        
-        # Update form submission count
-        db_form.submissions_count += 1
-        
         # Create lead if email provided
         if submission_data.submitter_email:
-            lead = Lead(
-                workspace_id=db_form.workspace_id,
-                form_submission_id=None,  # Will be set after submission is created
+            db_submission.lead = Lead(
+                workspace_id=entry.workspace_id,
                 name=submission_data.submitter_name or "Unknown",
                 email=submission_data.submitter_email,
                 phone=submission_data.submitter_phone,
                 source="FORM"
             )
-            db.add(lead)
         
+        db.add(db_submission)
+        db.flush()
+        
+        # Defaults are applied at flush, so the response needs no refresh query
+        response = CustomFormSubmissionResponse.from_orm(db_submission)
         db.commit()
-        db.refresh(db_submission)
         
-        # Update lead with submission ID
-        if submission_data.submitter_email:
-            lead.form_submission_id = db_submission.id
-            db.commit()
+        form_counter_service.incr(db, entry.form_id, "submissions_count")
         
-        return CustomFormSubmissionResponse.from_orm(db_submission)
+        return response
     
     async def list_submissions(
         self, db: Session, workspace_id: int,
@@ -371,7 +423,7 @@ class FormBuilderService:
         offset = (page - 1) * per_page
         submissions = query.offset(offset).limit(per_page).all()
         
-        return [CustomFormSubmissionResponse.from_orm(sub) for sub in submissions]
+        return CustomFormSubmissionResponseList.validate_python(submissions, from_attributes=True)
     
     async def get_submission(
         self, db: Session, submission_id: int, workspace_id: int
@@ -427,13 +479,13 @@ class FormBuilderService:
         # This is a placeholder - implement with your actual file storage
         return f"https://your-storage.com/uploads/{file.filename}"
     
-    def _validate_submission_data(self, fields: List[Dict], submitted_data: Dict[str, Any]):
-        """Validate submitted data against form fields"""
-        required_fields = [field['id'] for field in fields if field.get('required', False)]
-        
-        for field_id in required_fields:
-            if field_id not in submitted_data or not submitted_data[field_id]:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Required field '{field_id}' is missing"
-                )
\ No newline at end of file
+    def _raise_validation_errors(self, errors: Dict[str, str]):
+        """Reject a submission, reporting the first invalid field"""
+        field_id, message = next(iter(errors.items()))
+        
+        if message == REQUIRED_MESSAGE:
+            detail = f"Required field '{field_id}' is missing"
+        else:
+            detail = f"Invalid value for field '{field_id}': {message}"
+        
+        raise HTTPException(status_code=400, detail=detail)
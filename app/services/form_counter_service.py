@@ -0,0 +1,127 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Dict
+from datetime import datetime, timedelta
+import logging
+import uuid
+import redis
+from app.config import settings
+from app.models.form import Form
+from app.models.form_counter_flush import FormCounterFlush
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+COUNTER_COLUMNS = ("views_count", "submissions_count")
+
+# Hash field holding a processing batch's flush ID (form IDs are numeric)
+FLUSH_ID_FIELD = "flush_id"
+
+
+class FormCounterService:
+    """Buffers form counter increments in Redis and flushes them to the DB in batches
+    
+    Hot public forms would otherwise take a row lock on `forms` for every view
+    and submission.
+    Increments go to one Redis hash per counter column (form_id -> delta) and a
+    periodic task applies them with a single executemany UPDATE.
+    """
+    
+    key_prefix = "careops:form_counters"
+    lock_key = "careops:form_counters:flush_lock"
+    
+    def _key(self, column: str) -> str:
+        return f"{self.key_prefix}:{column}"
+    
+    def incr(self, db: Session, form_id: int, column: str, amount: int = 1):
+        """Buffer an increment; falls back to an atomic UPDATE if Redis is unavailable"""
+        if column not in COUNTER_COLUMNS:
+            raise ValueError(f"Unknown form counter: {column}")
+        
+        try:
+            get_redis().hincrby(self._key(column), form_id, amount)
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for form counter, writing through: {str(e)}")
+            forms = Form.__table__
+            db.execute(
+                forms.update()
+                .where(forms.c.id == form_id)
+                .values({column: forms.c[column] + amount})
+            )
+            db.commit()
+    
+    def flush(self, db: Session) -> Dict[str, int]:
+        """Apply buffered increments to the forms table, returns forms updated per column
+
+        A concurrent flush makes this a no-op. Each batch carries a flush ID
+        recorded in form_counter_flushes in the same transaction as its
+        UPDATE, so a batch left behind after its commit is dropped, not
+        applied again.
+        """
+        client = get_redis()
+        flushed = {}
+        
+        if not client.set(self.lock_key, 1, nx=True, ex=settings.FORM_COUNTER_FLUSH_LOCK_SECONDS):
+            return flushed
+        
+        try:
+            for column in COUNTER_COLUMNS:
+                flushed[column] = self._flush_column(db, client, column)
+            
+            db.execute(
+                delete(FormCounterFlush).where(
+                    FormCounterFlush.applied_at
+                    < datetime.utcnow() - timedelta(hours=settings.FORM_COUNTER_FLUSH_RETENTION_HOURS)
+                )
+            )
+            db.commit()
+        finally:
+            client.delete(self.lock_key)
+        
+        return flushed
+    
+    def _flush_column(self, db: Session, client: redis.Redis, column: str) -> int:
+        key = self._key(column)
+        processing_key = f"{key}:flushing"
+        
+        # A leftover processing hash means the previous flush died mid-way; finish it first
+        if not client.exists(processing_key):
+            try:
+                client.rename(key, processing_key)
+            except redis.ResponseError:
+                return 0  # Nothing buffered
+        
+        client.hsetnx(processing_key, FLUSH_ID_FIELD, uuid.uuid4().hex)
+        deltas = client.hgetall(processing_key)
+        flush_id = deltas.pop(FLUSH_ID_FIELD)
+        params = [
+            {"form_id": int(form_id), "delta": int(delta)}
+            for form_id, delta in deltas.items()
+            if int(delta)
+        ]
+        
+        recorded = db.execute(
+            pg_insert(FormCounterFlush.__table__)
+            .values(flush_id=flush_id, applied_at=datetime.utcnow())
+            .on_conflict_do_nothing()
+            .returning(FormCounterFlush.flush_id)
+        ).scalar()
+        
+        if recorded is None:
+            params = []  # Applied before the previous flush died
+        elif params:
+            forms = Form.__table__
+            db.execute(
+                forms.update()
+                .where(forms.c.id == bindparam("form_id"))
+                .values({column: forms.c[column] + bindparam("delta")}),
+                params
+            )
+        db.commit()
+        
+        client.delete(processing_key)
+        return len(params)
+
+
+form_counter_service = FormCounterService()
@@ -0,0 +1,172 @@
+import re
+import logging
+from datetime import date, time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.utils.validators import validate_phone
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_MESSAGE = "This field is required"
+
+EMAIL_PATTERN = re.compile(r'^[\w\.\+-]+@[\w\.-]+\.\w+$')
+
+NUMERIC_TYPES = {"number", "rating"}
+
+# Field types that only structure the form and never carry a value
+LAYOUT_TYPES = {"section"}
+
+
+def _is_empty(value: Any) -> bool:
+    """Missing answer: None, blank string, empty list/dict or an unticked checkbox"""
+    if value is None or value is False:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, dict)):
+        return not value
+    return False
+
+
+def _coerce_number(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    if isinstance(value, bool):
+        return None, "Must be a number"
+    try:
+        return float(value), None
+    except (TypeError, ValueError):
+        return None, "Must be a number"
+
+
+def _coerce_email(value: Any) -> Tuple[Any, Optional[str]]:
+    if not isinstance(value, str) or not EMAIL_PATTERN.match(value):
+        return None, "Invalid email address"
+    return value, None
+
+
+def _coerce_phone(value: Any) -> Tuple[Any, Optional[str]]:
+    if not isinstance(value, str) or not validate_phone(value):
+        return None, "Invalid phone number"
+    return value, None
+
+
+def _coerce_date(value: Any) -> Tuple[Any, Optional[str]]:
+    try:
+        return date.fromisoformat(str(value)), None
+    except ValueError:
+        return None, "Invalid date"
+
+
+def _coerce_time(value: Any) -> Tuple[Any, Optional[str]]:
+    try:
+        return time.fromisoformat(str(value)), None
+    except ValueError:
+        return None, "Invalid time"
+
+
+COERCERS: Dict[str, Callable[[Any], Tuple[Any, Optional[str]]]] = {
+    "number": _coerce_number,
+    "rating": _coerce_number,
+    "email": _coerce_email,
+    "phone": _coerce_phone,
+    "date": _coerce_date,
+    "time": _coerce_time,
+}
+
+
+class CompiledField:
+    """Validation rules for one field, with regexes compiled up front"""
+
+    def __init__(self, field: Dict[str, Any]):
+        self.id = field["id"]
+        self.type = field.get("type", "text")
+        self.required = bool(field.get("required", False))
+        self.options = set(field.get("options") or [])
+        self.coerce = COERCERS.get(self.type)
+        self.rules: List[Tuple[str, Any, str]] = []
+
+        for rule in field.get("validation") or []:
+            rule_type = rule.get("type")
+            message = rule.get("message") or "Invalid value"
+
+            if rule_type in ("min", "max"):
+                self.rules.append((rule_type, rule.get("value"), message))
+            elif rule_type == "pattern":
+                try:
+                    self.rules.append(("pattern", re.compile(rule.get("value", "")), message))
+                except re.error:
+                    logger.warning(f"Ignoring invalid pattern on form field {self.id}")
+
+    def check(self, value: Any) -> Optional[str]:
+        """Return an error message for value, or None if it is valid"""
+        if _is_empty(value):
+            return REQUIRED_MESSAGE if self.required else None
+
+        coerced = value
+        if self.coerce is not None:
+            coerced, error = self.coerce(value)
+            if error:
+                return error
+
+        if self.options:
+            chosen = value if isinstance(value, list) else [value]
+            if any(choice not in self.options for choice in chosen):
+                return "Invalid option"
+
+        for rule_type, rule_value, message in self.rules:
+            if rule_type == "pattern":
+                if not rule_value.match(str(value)):
+                    return message
+                continue
+
+            # min/max bound the number itself for numeric fields, the length otherwise
+            measured = coerced if self.type in NUMERIC_TYPES else len(str(value))
+            try:
+                if rule_type == "min" and measured < float(rule_value):
+                    return message
+                if rule_type == "max" and measured > float(rule_value):
+                    return message
+            except (TypeError, ValueError):
+                continue
+
+        return None
+
+
+class CompiledFormValidator:
+    """Form field definitions compiled once per form version
+
+    Built when a published form is loaded into the public form cache, so
+    submissions and live field validation share the same lookups and rules.
+    """
+
+    def __init__(self, fields: List[Dict[str, Any]]):
+        self.fields_by_id: Dict[str, CompiledField] = {}
+
+        for field in fields or []:
+            if not field.get("id") or field.get("type") in LAYOUT_TYPES:
+                continue
+            self.fields_by_id[field["id"]] = CompiledField(field)
+
+        self.required_ids = [field_id for field_id, field in self.fields_by_id.items() if field.required]
+
+    def validate(self, data: Dict[str, Any], partial: bool = False) -> Dict[str, str]:
+        """Validate answers, returns {field_id: message} for invalid fields
+
+        With partial=True only the submitted keys are checked (live validation);
+        otherwise missing required fields are reported too. Unknown keys are ignored.
+        """
+        errors: Dict[str, str] = {}
+
+        if not partial:
+            for field_id in self.required_ids:
+                if field_id not in data:
+                    errors[field_id] = REQUIRED_MESSAGE
+
+        for field_id, value in data.items():
+            field = self.fields_by_id.get(field_id)
+            if field is None:
+                continue
+
+            error = field.check(value)
+            if error:
+                errors[field_id] = error
+
+        return errors
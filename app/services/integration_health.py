@@ -0,0 +1,160 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+import asyncio
+import logging
+import time
+import aiohttp
+import orjson
+import redis
+from app.config import settings
+from app.models.integration import Integration
+from app.integrations.base import BaseIntegration
+from app.integrations.registry import integration_registry
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class IntegrationHealthService:
+    """Connection checks for integrations, with results cached in Redis
+
+    check_all() tests every active integration concurrently (at most
+    INTEGRATION_HEALTH_CONCURRENCY at once, each bounded by
+    INTEGRATION_HEALTH_TIMEOUT_SECONDS) through one pooled HTTP session and
+    stores each result for INTEGRATION_HEALTH_TTL_SECONDS, so listing
+    integrations never waits on a provider. Results are also written to
+    integrations.test_status/last_tested_at, which serve as the fallback
+    when the cache is empty or Redis is down.
+    """
+
+    key_prefix = "careops:integration_health"
+
+    def _key(self, integration_id: int) -> str:
+        return f"{self.key_prefix}:{integration_id}"
+
+    async def check_all(self, db: Session) -> Dict[int, Dict[str, Any]]:
+        """Test every active integration, returns the result per integration ID"""
+        integrations = db.query(Integration.id, Integration.workspace_id, Integration.updated_at).filter(
+            Integration.is_active == True
+        ).order_by(Integration.id).all()
+        return await self.check(db, integrations)
+
+    async def check_one(self, db: Session, integration: Integration) -> Dict[str, Any]:
+        results = await self.check(db, [(integration.id, integration.workspace_id, integration.updated_at)])
+        return results[integration.id]
+
+    async def check(
+        self,
+        db: Session,
+        integrations: Iterable[Tuple[int, int, Optional[datetime]]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Test (id, workspace_id, updated_at) integrations concurrently, then record the results"""
+        clients = {}
+        for integration_id, workspace_id, updated_at in integrations:
+            try:
+                clients[integration_id] = integration_registry.get_client(db, workspace_id, integration_id, updated_at)
+            except Exception as e:
+                clients[integration_id] = e  # Bad credentials or unsupported provider
+
+        if not clients:
+            return {}
+
+        results = await self._run_checks(clients)
+        self._record(db, results)
+        return results
+
+    def get_cached(self, integration_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Cached results for these integrations; missing or expired ones are left out"""
+        if not integration_ids:
+            return {}
+
+        try:
+            cached = get_redis().mget([self._key(integration_id) for integration_id in integration_ids])
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for integration health, using last recorded tests: {str(e)}")
+            return {}
+
+        return {
+            integration_id: orjson.loads(value)
+            for integration_id, value in zip(integration_ids, cached)
+            if value is not None
+        }
+
+    def invalidate(self, integration_id: int):
+        """Forget the cached result of an integration whose credentials changed or was deleted"""
+        try:
+            get_redis().delete(self._key(integration_id))
+        except redis.RedisError as e:
+            logger.warning(f"Could not clear integration health: {str(e)}")
+
+    async def _run_checks(self, clients: Dict[int, Any]) -> Dict[int, Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(settings.INTEGRATION_HEALTH_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=settings.INTEGRATION_HEALTH_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=settings.INTEGRATION_HEALTH_TIMEOUT_SECONDS)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def run(integration_id: int, client: Any) -> Tuple[int, Dict[str, Any]]:
+                if not isinstance(client, BaseIntegration):
+                    return integration_id, self._result(False, None, str(client))
+
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        success = await asyncio.wait_for(
+                            client.with_session(session).test_connection(),
+                            timeout=settings.INTEGRATION_HEALTH_TIMEOUT_SECONDS
+                        )
+                        error = None if success else "Connection test failed"
+                    except asyncio.TimeoutError:
+                        success, error = False, "Connection test timed out"
+                    except Exception as e:
+                        success, error = False, str(e)
+                    latency_ms = int((time.perf_counter() - started) * 1000)
+
+                return integration_id, self._result(success, latency_ms, error)
+
+            checked = await asyncio.gather(*(run(integration_id, client) for integration_id, client in clients.items()))
+        return dict(checked)
+
+    def _result(self, success: bool, latency_ms: Optional[int], error: Optional[str]) -> Dict[str, Any]:
+        return {
+            "status": "success" if success else "failed",
+            "checked_at": datetime.utcnow().isoformat(),
+            "latency_ms": latency_ms,
+            "error": error
+        }
+
+    def _record(self, db: Session, results: Dict[int, Dict[str, Any]]):
+        integrations = Integration.__table__
+        db.execute(
+            integrations.update()
+            .where(integrations.c.id == bindparam("b_id"))
+            .values(
+                test_status=bindparam("b_status"),
+                last_tested_at=bindparam("b_checked_at"),
+                # Keep the version: a health check must not retire cached clients
+                updated_at=integrations.c.updated_at
+            ),
+            [
+                {
+                    "b_id": integration_id,
+                    "b_status": result["status"],
+                    "b_checked_at": datetime.fromisoformat(result["checked_at"])
+                }
+                for integration_id, result in results.items()
+            ]
+        )
+        db.commit()
+
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for integration_id, result in results.items():
+                pipe.set(self._key(integration_id), orjson.dumps(result), ex=settings.INTEGRATION_HEALTH_TTL_SECONDS)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not cache integration health: {str(e)}")
+
+
+integration_health_service = IntegrationHealthService()
@@ -2,17 +2,37 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from datetime import datetime
 from app.models.integration import Integration
-from app.schemas.integration import IntegrationCreate, IntegrationUpdate
+from app.schemas.integration import IntegrationCreate, IntegrationUpdate, IntegrationResponse, IntegrationHealth
+from app.integrations.registry import integration_registry
+from app.services.integration_health import integration_health_service
 from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.security import encrypt_credentials
 import json
 
 
 class IntegrationService:
-    async def list_integrations(self, db: Session, workspace_id: int) -> List[Integration]:
-        """List all integrations for workspace"""
-        return db.query(Integration).filter(
+    async def list_integrations(self, db: Session, workspace_id: int) -> List[IntegrationResponse]:
+        """List all integrations for workspace with their cached health check results"""
+        integrations = db.query(Integration).filter(
             Integration.workspace_id == workspace_id
         ).order_by(Integration.type, Integration.provider).all()
+        
+        health = integration_health_service.get_cached([integration.id for integration in integrations])
+        
+        responses = []
+        for integration in integrations:
+            response = IntegrationResponse.model_validate(integration)
+            if integration.id in health:
+                response.health = IntegrationHealth(**health[integration.id])
+            elif integration.test_status and integration.last_tested_at:
+                # Cache expired or unavailable: fall back to the last recorded test
+                response.health = IntegrationHealth(
+                    status=integration.test_status,
+                    checked_at=integration.last_tested_at
+                )
+            responses.append(response)
+        
+        return responses
     
     async def create_integration(
         self, 
@@ -45,12 +65,11 @@ class IntegrationService:
         if existing:
             raise ValidationException(f"{integration_data.provider} {integration_data.type} integration already exists")
         
-        # TODO: Encrypt credentials before storing
         integration = Integration(
             workspace_id=workspace_id,
             type=integration_data.type,
             provider=integration_data.provider,
-            credentials=integration_data.credentials,
+            credentials=encrypt_credentials(integration_data.credentials),
             is_active=True
         )
         
@@ -84,16 +103,18 @@ class IntegrationService:
         
         # Update credentials if provided
         if integration_data.credentials:
-            # TODO: Encrypt new credentials
-            integration.credentials = integration_data.credentials
+            integration.credentials = encrypt_credentials(integration_data.credentials)
         
         if integration_data.is_active is not None:
             integration.is_active = integration_data.is_active
         
+        # A new updated_at also retires cached clients in other processes
         integration.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(integration)
         
+        integration_registry.invalidate(integration.id)
+        integration_health_service.invalidate(integration.id)
         return integration
     
     async def delete_integration(self, db: Session, integration_id: int, workspace_id: int):
@@ -101,6 +122,9 @@ class IntegrationService:
         integration = await self.get_integration(db, integration_id, workspace_id)
         db.delete(integration)
         db.commit()
+        
+        integration_registry.invalidate(integration_id)
+        integration_health_service.invalidate(integration_id)
     
     async def test_integration(
         self, 
@@ -108,40 +132,17 @@ class IntegrationService:
         integration_id: int, 
         workspace_id: int
     ) -> Dict[str, Any]:
-        """Test integration connection"""
+        """Test integration connection now, refreshing its cached health"""
         integration = await self.get_integration(db, integration_id, workspace_id)
-        
-        try:
-            if integration.type == "email":
-                success = await self._test_email_integration(integration)
-            elif integration.type == "sms":
-                success = await self._test_sms_integration(integration)
-            elif integration.type == "calendar":
-                success = await self._test_calendar_integration(integration)
-            else:
-                raise ValidationException(f"Testing not implemented for {integration.type}")
-            
-            # Update test status
-            integration.test_status = "success" if success else "failed"
-            integration.last_tested_at = datetime.utcnow()
-            db.commit()
-            
-            return {
-                "success": success,
-                "message": "Integration test successful" if success else "Integration test failed",
-                "tested_at": integration.last_tested_at
-            }
-            
-        except Exception as e:
-            integration.test_status = "failed"
-            integration.last_tested_at = datetime.utcnow()
-            db.commit()
-            
-            return {
-                "success": False,
-                "message": f"Integration test failed: {str(e)}",
-                "tested_at": integration.last_tested_at
-            }
+        result = await integration_health_service.check_one(db, integration)
+        
+        success = result["status"] == "success"
+        return {
+            "success": success,
+            "message": "Integration test successful" if success else f"Integration test failed: {result['error']}",
+            "tested_at": result["checked_at"],
+            "latency_ms": result["latency_ms"]
+        }
     
     async def get_email_integration(self, db: Session, workspace_id: int) -> Integration:
         """Get active email integration for workspace"""
@@ -168,58 +169,3 @@ class IntegrationService:
             raise NotFoundException("No active SMS integration found")
         
         return integration
-    
-    async def _test_email_integration(self, integration: Integration) -> bool:
-        """Test email integration"""
-        try:
-            if integration.provider == "sendgrid":
-                # TODO: Test SendGrid connection
-                api_key = integration.credentials.get("api_key")
-                from_email = integration.credentials.get("from_email")
-                
-                if not api_key or not from_email:
-                    return False
-                
-                # Simulate successful test for now
-                return True
-            
-            elif integration.provider == "mailgun":
-                # TODO: Test Mailgun connection
-                return True
-            
-            return False
-            
-        except Exception:
-            return False
-    
-    async def _test_sms_integration(self, integration: Integration) -> bool:
-        """Test SMS integration"""
-        try:
-            if integration.provider == "twilio":
-                # TODO: Test Twilio connection
-                account_sid = integration.credentials.get("account_sid")
-                auth_token = integration.credentials.get("auth_token")
-                phone_number = integration.credentials.get("phone_number")
-                
-                if not all([account_sid, auth_token, phone_number]):
-                    return False
-                
-                # Simulate successful test for now
-                return True
-            
-            return False
-            
-        except Exception:
-            return False
-    
-    async def _test_calendar_integration(self, integration: Integration) -> bool:
-        """Test calendar integration"""
-        try:
-            if integration.provider == "google":
-                # TODO: Test Google Calendar connection
-                return True
-            
-            return False
-            
-        except Exception:
-            return False
\ No newline at end of file
@@ -0,0 +1,176 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, exists, literal, case, cast, func, String, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from app.models.inventory import InventoryItem
+from app.models.alert import Alert, AlertType, AlertStatus, AlertSeverity
+
+# (event, payload) pairs to emit to the item's workspace once the transaction commits
+AlertEvent = Tuple[str, Dict[str, Any]]
+
+
+def is_low_stock(quantity: Optional[int], threshold: Optional[int]) -> bool:
+    return (quantity or 0) <= (threshold or 0)
+
+
+def _active_alert_filter(item_id):
+    return (
+        Alert.type == AlertType.INVENTORY_LOW,
+        Alert.reference_type == "inventory_item",
+        Alert.reference_id == item_id,
+        Alert.status == AlertStatus.ACTIVE
+    )
+
+
+def _alert_text(item: InventoryItem) -> Dict[str, str]:
+    if (item.quantity or 0) <= 0:
+        return {
+            "severity": AlertSeverity.CRITICAL.value,
+            "title": f"Out of Stock: {item.name}",
+            "message": f"{item.name} is completely out of stock!"
+        }
+    return {
+        "severity": AlertSeverity.HIGH.value,
+        "title": f"Low Stock: {item.name}",
+        "message": f"{item.name} is running low. Current stock: {item.quantity} {item.unit or 'units'}"
+    }
+
+
+def alert_payload(alert: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSocket payload for an inventory_low alert RETURNING row"""
+    return {
+        "id": alert["id"],
+        "type": AlertType.INVENTORY_LOW.value,
+        "severity": alert["severity"],
+        "title": alert["title"],
+        "message": alert["message"],
+        "link": alert["link"],
+        "reference_type": alert["reference_type"],
+        "reference_id": alert["reference_id"],
+        "created_at": alert["created_at"].isoformat() if alert["created_at"] else None
+    }
+
+
+def stock_level_changed(db: Session, item: InventoryItem, was_low: bool) -> List[AlertEvent]:
+    """Bring the item's inventory_low alert in line with its new stock level
+
+    Call after changing quantity or threshold, inside the same transaction, so
+    the alert commits atomically with the stock change:
+    - crossing into low stock opens an alert (a no-op if one is already active)
+    - moving while low refreshes the active alert, escalating to critical at zero
+    - crossing back above the threshold resolves it
+    """
+    now = datetime.utcnow()
+    returning = (
+        Alert.id, Alert.severity, Alert.title, Alert.message, Alert.link,
+        Alert.reference_type, Alert.reference_id, Alert.created_at
+    )
+
+    if not is_low_stock(item.quantity, item.low_stock_threshold):
+        if not was_low:
+            return []
+        return _resolve_active_alert(db, item.id, now)
+
+    if was_low:
+        updated = db.execute(
+            Alert.__table__.update()
+            .where(*_active_alert_filter(item.id))
+            .values(updated_at=now, **_alert_text(item))
+            .returning(*returning)
+        ).mappings().all()
+        return [("alert_updated", alert_payload(dict(row))) for row in updated]
+
+    created = db.execute(
+        pg_insert(Alert).values(
+            workspace_id=item.workspace_id,
+            type=AlertType.INVENTORY_LOW,
+            status=AlertStatus.ACTIVE,
+            link=f"/inventory/{item.id}",
+            reference_type="inventory_item",
+            reference_id=item.id,
+            created_at=now,
+            updated_at=now,
+            **_alert_text(item)
+        ).on_conflict_do_nothing().returning(*returning)
+    ).mappings().first()
+
+    return [("new_alert", alert_payload(dict(created)))] if created else []
+
+
+def item_deleted(db: Session, item_id: int) -> List[AlertEvent]:
+    """Resolve the item's active inventory_low alert, inside the delete's transaction"""
+    return _resolve_active_alert(db, item_id, datetime.utcnow())
+
+
+def _resolve_active_alert(db: Session, item_id: int, now: datetime) -> List[AlertEvent]:
+    resolved = db.execute(
+        Alert.__table__.update()
+        .where(*_active_alert_filter(item_id))
+        .values(status=AlertStatus.RESOLVED, resolved_at=now, updated_at=now)
+        .returning(Alert.id)
+    ).scalars().all()
+    return [("alert_resolved", {"id": alert_id, "reference_id": item_id}) for alert_id in resolved]
+
+
+def low_stock_alert_insert(now: datetime):
+    """INSERT ... SELECT creating inventory_low alerts for low items without one
+
+    Anti-joins low-stock items against active alerts; the partial unique index
+    on active alerts turns races with concurrent writers into no-ops.
+    """
+    out_of_stock = InventoryItem.quantity <= 0
+    item_label = func.coalesce(InventoryItem.unit, "units")
+
+    missing_alerts = select(
+        InventoryItem.workspace_id,
+        literal(AlertType.INVENTORY_LOW, Alert.type.type),
+        literal(AlertStatus.ACTIVE, Alert.status.type),
+        case((out_of_stock, AlertSeverity.CRITICAL.value), else_=AlertSeverity.HIGH.value),
+        case(
+            (out_of_stock, "Out of Stock: " + InventoryItem.name),
+            else_="Low Stock: " + InventoryItem.name
+        ),
+        case(
+            (out_of_stock, InventoryItem.name + " is completely out of stock!"),
+            else_=InventoryItem.name + " is running low. Current stock: "
+            + cast(InventoryItem.quantity, String) + " " + item_label
+        ),
+        "/inventory/" + cast(InventoryItem.id, String),
+        literal("inventory_item"),
+        InventoryItem.id,
+        literal(now, DateTime),
+        literal(now, DateTime)
+    ).where(
+        InventoryItem.quantity <= InventoryItem.low_stock_threshold,
+        ~exists().where(*_active_alert_filter(InventoryItem.id))
+    )
+
+    return pg_insert(Alert).from_select(
+        [
+            Alert.workspace_id, Alert.type, Alert.status, Alert.severity, Alert.title,
+            Alert.message, Alert.link, Alert.reference_type, Alert.reference_id,
+            Alert.created_at, Alert.updated_at
+        ],
+        missing_alerts
+    ).on_conflict_do_nothing().returning(
+        Alert.id, Alert.workspace_id, Alert.severity, Alert.title, Alert.message,
+        Alert.link, Alert.reference_type, Alert.reference_id, Alert.created_at
+    )
+
+
+def stale_alert_resolve(now: datetime):
+    """UPDATE resolving active inventory_low alerts whose item is no longer low or was deleted"""
+    still_low = exists().where(
+        InventoryItem.id == Alert.reference_id,
+        InventoryItem.quantity <= InventoryItem.low_stock_threshold
+    )
+
+    return Alert.__table__.update().where(
+        Alert.type == AlertType.INVENTORY_LOW,
+        Alert.reference_type == "inventory_item",
+        Alert.status == AlertStatus.ACTIVE,
+        ~still_low
+    ).values(
+        status=AlertStatus.RESOLVED, resolved_at=now, updated_at=now
+    ).returning(Alert.id, Alert.workspace_id, Alert.reference_id)
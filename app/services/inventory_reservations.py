@@ -0,0 +1,135 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, literal, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List, Tuple
+from datetime import datetime
+from app.models.booking import Booking
+from app.models.inventory import InventoryItem
+from app.models.service_inventory import ServiceInventory, InventoryReservation, ReservationKind
+from app.services.inventory_alerts import AlertEvent, is_low_stock, stock_level_changed
+
+LEDGER_KEY = ["booking_id", "item_id", "kind"]
+
+
+def _adjust_stock(db: Session, workspace_id: int, item_id: int, delta: int, now: datetime):
+    """Atomically add delta to an item's quantity, refusing to go below zero
+
+    Returns the updated InventoryItem, or None if stock was insufficient.
+    """
+    stmt = update(InventoryItem).where(
+        InventoryItem.id == item_id,
+        InventoryItem.workspace_id == workspace_id
+    )
+    if delta < 0:
+        stmt = stmt.where(InventoryItem.quantity >= -delta)
+
+    return db.scalars(
+        stmt.values(quantity=InventoryItem.quantity + delta, updated_at=now).returning(InventoryItem),
+        execution_options={"populate_existing": True}
+    ).first()
+
+
+def reserve_for_booking(db: Session, booking: Booking) -> Tuple[Dict[str, Any], List[AlertEvent]]:
+    """Reserve the service's inventory for a booking; the caller commits
+
+    Each item gets a ledger entry and a conditional decrement inside one
+    savepoint, so an item with too little stock is skipped without leaving an
+    entry behind. Items already reserved for this booking are left alone,
+    which makes retries safe.
+    """
+    now = datetime.utcnow()
+    links = db.query(ServiceInventory.item_id, ServiceInventory.quantity_per_booking).filter(
+        ServiceInventory.service_id == booking.service_id,
+        ServiceInventory.quantity_per_booking > 0
+    ).order_by(ServiceInventory.item_id).all()  # Fixed lock order across concurrent bookings
+
+    result = {"reserved": [], "already_reserved": [], "insufficient": []}
+    events: List[AlertEvent] = []
+
+    for item_id, quantity in links:
+        savepoint = db.begin_nested()
+
+        entry = db.execute(
+            pg_insert(InventoryReservation).values(
+                workspace_id=booking.workspace_id,
+                booking_id=booking.id,
+                item_id=item_id,
+                kind=ReservationKind.RESERVE.value,
+                quantity=quantity,
+                created_at=now
+            ).on_conflict_do_nothing(index_elements=LEDGER_KEY).returning(InventoryReservation.id)
+        ).first()
+
+        if entry is None:
+            savepoint.rollback()
+            result["already_reserved"].append(item_id)
+            continue
+
+        item = _adjust_stock(db, booking.workspace_id, item_id, -quantity, now)
+        if item is None:
+            savepoint.rollback()
+            result["insufficient"].append(item_id)
+            continue
+
+        savepoint.commit()
+        result["reserved"].append({
+            "item_id": item.id,
+            "name": item.name,
+            "quantity_reserved": quantity,
+            "remaining_stock": item.quantity
+        })
+        events += stock_level_changed(
+            db, item, was_low=is_low_stock(item.quantity + quantity, item.low_stock_threshold)
+        )
+
+    return result, events
+
+
+def release_for_booking(db: Session, booking: Booking) -> Tuple[Dict[str, Any], List[AlertEvent]]:
+    """Return a booking's reserved stock exactly once; the caller commits
+
+    A single INSERT ... SELECT copies the booking's reserve entries as release
+    entries; the unique ledger key means only the first release returns rows,
+    and only those rows are added back to stock.
+    """
+    now = datetime.utcnow()
+
+    reserved = select(
+        InventoryReservation.workspace_id,
+        InventoryReservation.booking_id,
+        InventoryReservation.item_id,
+        literal(ReservationKind.RELEASE.value),
+        InventoryReservation.quantity,
+        literal(now, DateTime)
+    ).where(
+        InventoryReservation.booking_id == booking.id,
+        InventoryReservation.kind == ReservationKind.RESERVE.value
+    )
+
+    released = db.execute(
+        pg_insert(InventoryReservation).from_select(
+            ["workspace_id", "booking_id", "item_id", "kind", "quantity", "created_at"], reserved
+        ).on_conflict_do_nothing(index_elements=LEDGER_KEY).returning(
+            InventoryReservation.item_id, InventoryReservation.quantity
+        )
+    ).all()
+
+    result = {"released": []}
+    events: List[AlertEvent] = []
+
+    for item_id, quantity in sorted(released):
+        item = _adjust_stock(db, booking.workspace_id, item_id, quantity, now)
+        if item is None:
+            continue
+
+        result["released"].append({
+            "item_id": item.id,
+            "name": item.name,
+            "quantity_released": quantity,
+            "new_stock": item.quantity
+        })
+        events += stock_level_changed(
+            db, item, was_low=is_low_stock(item.quantity - quantity, item.low_stock_threshold)
+        )
+
+    return result, events
@@ -1,9 +1,15 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Dict, Any
 from datetime import datetime
+from app.models.booking import Booking
 from app.models.inventory import InventoryItem
-from app.schemas.inventory import InventoryItemCreate, InventoryItemUpdate
+from app.models.service import Service
+from app.models.service_inventory import ServiceInventory
+from app.schemas.inventory import InventoryItemCreate, InventoryItemUpdate, ServiceInventoryUpdate
+from app.services.inventory_alerts import is_low_stock, item_deleted, stock_level_changed
+from app.services.inventory_reservations import reserve_for_booking, release_for_booking
 from app.utils.exceptions import NotFoundException
+from app.websockets.manager import websocket_manager
 
 
 class InventoryService:
@@ -30,9 +36,14 @@ class InventoryService:
         )
         
         db.add(item)
+        db.flush()
+        
+        # A new item already at or below its threshold counts as crossing it
+        alert_events = stock_level_changed(db, item, was_low=False)
         db.commit()
         db.refresh(item)
         
+        await self._emit_alert_events(item.workspace_id, alert_events)
         return item
     
     async def get_item(self, db: Session, item_id: int, workspace_id: int) -> InventoryItem:
@@ -57,28 +68,35 @@ class InventoryService:
         """Update inventory item"""
         item = await self.get_item(db, item_id, workspace_id)
         
-        # Store old quantity for comparison
-        old_quantity = item.quantity
+        was_low = is_low_stock(item.quantity, item.low_stock_threshold)
+        old_level = (item.quantity, item.low_stock_threshold)
         
         # Update fields
         for field, value in item_data.dict(exclude_unset=True).items():
             setattr(item, field, value)
         
         item.updated_at = datetime.utcnow()
+        db.flush()
+        
+        # Open, refresh or resolve the low stock alert in the same transaction
+        alert_events = []
+        if old_level != (item.quantity, item.low_stock_threshold):
+            alert_events = stock_level_changed(db, item, was_low)
+        
         db.commit()
         db.refresh(item)
         
-        # Check if we need to create/resolve low stock alert
-        if old_quantity != item.quantity:
-            await self._check_stock_level(db, item)
-        
+        await self._emit_alert_events(workspace_id, alert_events)
         return item
     
     async def delete_item(self, db: Session, item_id: int, workspace_id: int):
         """Delete inventory item"""
         item = await self.get_item(db, item_id, workspace_id)
+        alert_events = item_deleted(db, item.id)
         db.delete(item)
         db.commit()
+        
+        await self._emit_alert_events(workspace_id, alert_events)
     
     async def get_low_stock_alerts(self, db: Session, workspace_id: int) -> Dict[str, Any]:
         """Get items with low stock"""
@@ -92,58 +110,103 @@ class InventoryService:
             "count": len(low_stock_items)
         }
     
-    async def reserve_inventory(self, db: Session, service_id: int, quantity: int = 1):
-        """Reserve inventory for a booking"""
-        # TODO: Implement inventory reservation logic
-        # This would be called when a booking is confirmed
-        pass
-    
-    async def release_inventory(self, db: Session, service_id: int, quantity: int = 1):
-        """Release reserved inventory (e.g., when booking is cancelled)"""
-        # TODO: Implement inventory release logic
-        pass
+    async def list_service_items(self, db: Session, service_id: int, workspace_id: int) -> List[ServiceInventory]:
+        """List the inventory items each booking of a service consumes"""
+        await self._get_service(db, service_id, workspace_id)
+        
+        return db.query(ServiceInventory).options(
+            joinedload(ServiceInventory.item)
+        ).filter(
+            ServiceInventory.service_id == service_id
+        ).order_by(ServiceInventory.item_id).all()
     
-    async def _check_stock_level(self, db: Session, item: InventoryItem):
-        """Check stock level and create/resolve alerts"""
-        from app.models.alert import Alert, AlertStatus, AlertSeverity
-        
-        # Check if item is now low stock
-        if item.quantity <= item.low_stock_threshold:
-            # Check if alert already exists
-            existing_alert = db.query(Alert).filter(
-                Alert.workspace_id == item.workspace_id,
-                Alert.type == "inventory_low",
-                Alert.reference_type == "inventory_item",
-                Alert.reference_id == item.id,
-                Alert.status == AlertStatus.ACTIVE
-            ).first()
-            
-            if not existing_alert:
-                # Create new alert
-                alert = Alert(
-                    workspace_id=item.workspace_id,
-                    type="inventory_low",
-                    status=AlertStatus.ACTIVE,
-                    severity=AlertSeverity.HIGH if item.quantity == 0 else AlertSeverity.MEDIUM,
-                    title=f"Low Stock: {item.name}",
-                    message=f"{item.name} is running low. Current stock: {item.quantity} {item.unit}",
-                    reference_type="inventory_item",
-                    reference_id=item.id,
-                    link=f"/inventory/{item.id}"
-                )
-                db.add(alert)
+    async def set_service_item(
+        self, 
+        db: Session, 
+        service_id: int, 
+        item_id: int, 
+        workspace_id: int, 
+        link_data: ServiceInventoryUpdate
+    ) -> ServiceInventory:
+        """Map an inventory item to a service, or change how much a booking uses"""
+        await self._get_service(db, service_id, workspace_id)
+        item = await self.get_item(db, item_id, workspace_id)
+        
+        quantity = link_data.quantity_per_booking
+        if quantity is None:
+            quantity = item.usage_per_booking
+        
+        link = db.query(ServiceInventory).filter(
+            ServiceInventory.service_id == service_id,
+            ServiceInventory.item_id == item_id
+        ).first()
+        
+        if link:
+            link.quantity_per_booking = quantity
         else:
-            # Item is no longer low stock, resolve any active alerts
-            active_alerts = db.query(Alert).filter(
-                Alert.workspace_id == item.workspace_id,
-                Alert.type == "inventory_low",
-                Alert.reference_type == "inventory_item",
-                Alert.reference_id == item.id,
-                Alert.status == AlertStatus.ACTIVE
-            ).all()
-            
-            for alert in active_alerts:
-                alert.status = AlertStatus.RESOLVED
-                alert.resolved_at = datetime.utcnow()
-        
-        db.commit()
\ No newline at end of file
+            link = ServiceInventory(service_id=service_id, item_id=item_id, quantity_per_booking=quantity)
+            db.add(link)
+        
+        db.commit()
+        db.refresh(link)
+        return link
+    
+    async def remove_service_item(self, db: Session, service_id: int, item_id: int, workspace_id: int):
+        """Stop reserving an inventory item for a service's bookings"""
+        await self._get_service(db, service_id, workspace_id)
+        
+        deleted = db.query(ServiceInventory).filter(
+            ServiceInventory.service_id == service_id,
+            ServiceInventory.item_id == item_id
+        ).delete(synchronize_session=False)
+        
+        if not deleted:
+            raise NotFoundException("Inventory item is not used by this service")
+        db.commit()
+    
+    async def reserve_inventory(self, db: Session, booking_id: int, workspace_id: int) -> Dict[str, Any]:
+        """Reserve the service's inventory for a booking; safe to call more than once"""
+        booking = await self._get_booking(db, booking_id, workspace_id)
+        
+        result, alert_events = reserve_for_booking(db, booking)
+        db.commit()
+        
+        await self._emit_alert_events(workspace_id, alert_events)
+        return result
+    
+    async def release_inventory(self, db: Session, booking_id: int, workspace_id: int) -> Dict[str, Any]:
+        """Return a booking's reserved inventory (e.g., when booking is cancelled)"""
+        booking = await self._get_booking(db, booking_id, workspace_id)
+        
+        result, alert_events = release_for_booking(db, booking)
+        db.commit()
+        
+        await self._emit_alert_events(workspace_id, alert_events)
+        return result
+    
+    async def _get_service(self, db: Session, service_id: int, workspace_id: int) -> Service:
+        service = db.query(Service).filter(
+            Service.id == service_id,
+            Service.workspace_id == workspace_id
+        ).first()
+        
+        if not service:
+            raise NotFoundException("Service not found")
+        
+        return service
+    
+    async def _get_booking(self, db: Session, booking_id: int, workspace_id: int) -> Booking:
+        booking = db.query(Booking).filter(
+            Booking.id == booking_id,
+            Booking.workspace_id == workspace_id
+        ).first()
+        
+        if not booking:
+            raise NotFoundException("Booking not found")
+        
+        return booking
+    
+    async def _emit_alert_events(self, workspace_id: int, events):
+        """Emit alert changes collected during a committed stock change"""
+        for event, data in events:
+            await websocket_manager.emit_to_workspace(workspace_id, event, data)
@@ -0,0 +1,223 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, case, select, update
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
+import html
+import logging
+import aiohttp
+from app.config import settings
+from app.models.message import Message, MessageType, MessageDirection
+from app.models.conversation import Conversation
+from app.models.contact import Contact
+from app.models.workspace import Workspace
+from app.models.integration import Integration
+from app.integrations.base import BaseIntegration
+from app.integrations.registry import integration_registry
+from app.services.webhook_ingest import twilio_status_callback_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchRow:
+    """Everything needed to send one message, loaded in a single query"""
+    message_id: int
+    workspace_id: int
+    channel: str  # email, sms
+    subject: Optional[str]
+    content: str
+    workspace_name: str
+    email: Optional[str]
+    phone: Optional[str]
+    integration_id: Optional[int]
+    integration_updated_at: Optional[datetime]
+
+
+def claim_messages(db: Session, message_ids: List[int]) -> List[int]:
+    """Move queued outbound messages to sending; IDs already claimed elsewhere are skipped"""
+    if not message_ids:
+        return []
+
+    claimed = db.execute(
+        update(Message)
+        .where(
+            Message.id.in_(message_ids),
+            Message.status == "queued",
+            Message.direction == MessageDirection.OUTBOUND
+        )
+        .values(status="sending", dispatched_at=datetime.utcnow(), error=None)
+        .returning(Message.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    db.commit()
+    return sorted(claimed)
+
+
+def load_dispatch_rows(db: Session, message_ids: List[int]) -> List[DispatchRow]:
+    """Load messages with their contact, workspace name and active integration"""
+    integration_type = case((Message.type == MessageType.EMAIL, "email"), else_="sms")
+
+    rows = db.execute(
+        select(
+            Message.id, Conversation.workspace_id, Message.type, Message.subject, Message.content,
+            Workspace.name, Contact.email, Contact.phone,
+            Integration.id, Integration.updated_at
+        )
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .join(Contact, Conversation.contact_id == Contact.id)
+        .join(Workspace, Conversation.workspace_id == Workspace.id)
+        .outerjoin(Integration, and_(
+            Integration.workspace_id == Conversation.workspace_id,
+            Integration.type == integration_type,
+            Integration.is_active == True
+        ))
+        .where(Message.id.in_(message_ids))
+        .order_by(Message.id, Integration.id)
+    ).all()
+
+    loaded = {}
+    for row in rows:
+        if row[0] in loaded:
+            continue  # Several active integrations of one type: use the oldest
+        loaded[row[0]] = DispatchRow(
+            message_id=row[0],
+            workspace_id=row[1],
+            channel=row[2].value,
+            subject=row[3],
+            content=row[4],
+            workspace_name=row[5],
+            email=row[6],
+            phone=row[7],
+            integration_id=row[8],
+            integration_updated_at=row[9]
+        )
+    return list(loaded.values())
+
+
+def resolve_clients(db: Session, rows: List[DispatchRow]) -> Dict[int, Any]:
+    """Registry client per integration in the batch, or the error that prevented building it"""
+    clients = {}
+    for row in rows:
+        if row.integration_id is None or row.integration_id in clients:
+            continue
+        try:
+            clients[row.integration_id] = integration_registry.get_client(
+                db, row.workspace_id, row.integration_id, row.integration_updated_at
+            )
+        except Exception as e:
+            clients[row.integration_id] = e
+    return clients
+
+
+async def send_rows(rows: List[DispatchRow], clients: Dict[int, Any]) -> List[Dict[str, Any]]:
+    """Send a batch concurrently through one pooled HTTP session
+
+    Cached registry clients are bound to the session, so every request in the
+    batch shares its connection pool. Returns one result per row, never
+    raises for a single message's failure.
+    """
+    semaphore = asyncio.Semaphore(settings.DISPATCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=settings.DISPATCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=settings.DISPATCH_TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        bound = {
+            integration_id: client.with_session(session)
+            for integration_id, client in clients.items()
+            if isinstance(client, BaseIntegration)
+        }
+
+        async def send(row: DispatchRow) -> Dict[str, Any]:
+            result = {"message_id": row.message_id, "workspace_id": row.workspace_id}
+
+            if row.integration_id is None:
+                return {**result, "status": "failed", "error": f"No {row.channel} integration configured"}
+            if row.channel == "email" and not row.email:
+                return {**result, "status": "failed", "error": "No email address"}
+            if row.channel == "sms" and not row.phone:
+                return {**result, "status": "failed", "error": "No phone number"}
+
+            client = bound.get(row.integration_id)
+            if client is None:
+                return {**result, "status": "failed", "error": str(clients[row.integration_id])}
+
+            try:
+                async with semaphore:
+                    if row.channel == "email":
+                        sent = await client.send_email(
+                            to_email=row.email,
+                            subject=row.subject or "Message from " + row.workspace_name,
+                            html_content=_email_html(row.content),
+                            text_content=row.content
+                        )
+                    else:
+                        sent = await client.send_sms(
+                            to_phone=row.phone,
+                            message=row.content,
+                            status_callback=twilio_status_callback_url(row.integration_id)
+                        )
+            except Exception as e:
+                return {**result, "status": "failed", "error": str(e)}
+
+            if not sent.get("success"):
+                return {**result, "status": "failed", "error": sent.get("error")}
+            return {
+                **result,
+                "status": "sent",
+                "external_id": sent.get("message_id") or sent.get("message_sid")
+            }
+
+        return await asyncio.gather(*(send(row) for row in rows))
+
+
+def record_results(db: Session, results: List[Dict[str, Any]]):
+    """Write send outcomes with one executemany UPDATE"""
+    if not results:
+        return
+
+    messages = Message.__table__
+    db.execute(
+        messages.update()
+        .where(messages.c.id == bindparam("b_message_id"), messages.c.status == "sending")
+        .values(
+            status=bindparam("b_status"),
+            external_id=bindparam("b_external_id"),
+            error=bindparam("b_error")
+        ),
+        [
+            {
+                "b_message_id": result["message_id"],
+                "b_status": result["status"],
+                "b_external_id": result.get("external_id"),
+                "b_error": result.get("error")
+            }
+            for result in results
+        ]
+    )
+    db.commit()
+
+
+def dispatch(db: Session, message_ids: List[int]) -> List[Dict[str, Any]]:
+    """Claim, load, send and record a batch of outbound messages"""
+    claimed = claim_messages(db, message_ids)
+    if not claimed:
+        return []
+
+    rows = load_dispatch_rows(db, claimed)
+    results = asyncio.run(send_rows(rows, resolve_clients(db, rows))) if rows else []
+
+    # Claimed but not loadable (e.g. deleted in between)
+    missing = set(claimed) - {row.message_id for row in rows}
+    results += [
+        {"message_id": message_id, "workspace_id": None, "status": "failed", "error": "Message not found"}
+        for message_id in sorted(missing)
+    ]
+
+    record_results(db, results)
+    return results
+
+
+def _email_html(content: str) -> str:
+    return "<p>" + html.escape(content).replace("\n", "<br>") + "</p>"
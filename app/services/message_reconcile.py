@@ -0,0 +1,158 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import String, Text, and_, bindparam, case, func, or_, select
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import asyncio
+import aiohttp
+from app.config import settings
+from app.models.message import Message, MessageType, MessageDirection
+from app.models.conversation import Conversation
+from app.models.integration import Integration
+from app.integrations.base import BaseIntegration
+from app.services.message_dispatch import resolve_clients
+from app.services.webhook_ingest import TWILIO_STATUSES
+
+# Provider lookup status -> final message status; anything else means still in flight
+FINAL_STATUSES = {
+    "sms": {status: mapped for status, mapped in TWILIO_STATUSES.items() if mapped != "sent"},
+    "email": {"delivered": "delivered", "not_delivered": "failed"},
+}
+
+
+@dataclass
+class StatusRow:
+    """A sent message whose delivery outcome is still unknown"""
+    message_id: int
+    workspace_id: int
+    channel: str  # email, sms
+    external_id: str
+    integration_id: Optional[int]
+    integration_updated_at: Optional[datetime]
+
+
+def load_pending_rows(db: Session, after_id: int, limit: int) -> List[StatusRow]:
+    """Next page (by message ID) of sent messages due for a provider lookup
+
+    Messages are polled from STATUS_RECONCILE_AFTER_SECONDS after sending,
+    when a delivery callback would normally have arrived, at most every
+    STATUS_RECONCILE_INTERVAL_SECONDS and for STATUS_RECONCILE_MAX_AGE_HOURS.
+    """
+    now = datetime.utcnow()
+    integration_type = case((Message.type == MessageType.EMAIL, "email"), else_="sms")
+
+    rows = db.execute(
+        select(
+            Message.id, Conversation.workspace_id, Message.type, Message.external_id,
+            Integration.id, Integration.updated_at
+        )
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .outerjoin(Integration, and_(
+            Integration.workspace_id == Conversation.workspace_id,
+            Integration.type == integration_type,
+            Integration.is_active == True
+        ))
+        .where(
+            Message.status == "sent",
+            Message.direction == MessageDirection.OUTBOUND,
+            Message.external_id.isnot(None),
+            Message.dispatched_at >= now - timedelta(hours=settings.STATUS_RECONCILE_MAX_AGE_HOURS),
+            Message.dispatched_at < now - timedelta(seconds=settings.STATUS_RECONCILE_AFTER_SECONDS),
+            or_(
+                Message.status_checked_at.is_(None),
+                Message.status_checked_at < now - timedelta(seconds=settings.STATUS_RECONCILE_INTERVAL_SECONDS)
+            ),
+            Message.id > after_id
+        )
+        .order_by(Message.id, Integration.id)
+        .limit(limit)
+    ).all()
+
+    loaded = {}
+    for row in rows:
+        if row[0] in loaded:
+            continue  # Several active integrations of one type: use the oldest, as dispatch does
+        loaded[row[0]] = StatusRow(
+            message_id=row[0],
+            workspace_id=row[1],
+            channel=row[2].value,
+            external_id=row[3],
+            integration_id=row[4],
+            integration_updated_at=row[5]
+        )
+    return list(loaded.values())
+
+
+async def fetch_statuses(rows: List[StatusRow], clients: Dict[int, Any]) -> List[Dict[str, Any]]:
+    """Look up a page of messages concurrently through one pooled HTTP session
+
+    Returns one result per row; status is the new final status, or None
+    while the message is still in flight or the lookup failed.
+    """
+    semaphore = asyncio.Semaphore(settings.DISPATCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=settings.DISPATCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=settings.DISPATCH_TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        bound = {
+            integration_id: client.with_session(session)
+            for integration_id, client in clients.items()
+            if isinstance(client, BaseIntegration)
+        }
+
+        async def fetch(row: StatusRow) -> Dict[str, Any]:
+            result = {"message_id": row.message_id, "workspace_id": row.workspace_id, "status": None, "error": None}
+
+            client = bound.get(row.integration_id)
+            if client is None:
+                return result
+
+            try:
+                async with semaphore:
+                    found = await client.fetch_message_status(row.external_id)
+            except Exception as e:
+                return {**result, "lookup_error": str(e)}
+
+            status = FINAL_STATUSES[row.channel].get((found or {}).get("status"))
+            if status is None:
+                return result
+            return {**result, "status": status, "error": found.get("error") if status == "failed" else None}
+
+        return await asyncio.gather(*(fetch(row) for row in rows))
+
+
+def record_statuses(db: Session, results: List[Dict[str, Any]]):
+    """Write lookup outcomes with one executemany UPDATE, stamping every checked message
+
+    Only messages still in sent are touched, so a delivery callback applied
+    in the meantime wins.
+    """
+    if not results:
+        return
+
+    messages = Message.__table__
+    db.execute(
+        messages.update()
+        .where(messages.c.id == bindparam("b_message_id"), messages.c.status == "sent")
+        .values(
+            status=func.coalesce(bindparam("b_status", type_=String), messages.c.status),
+            error=func.coalesce(bindparam("b_error", type_=Text), messages.c.error),
+            status_checked_at=datetime.utcnow()
+        ),
+        [
+            {"b_message_id": result["message_id"], "b_status": result["status"], "b_error": result["error"]}
+            for result in results
+        ]
+    )
+    db.commit()
+
+
+def reconcile_page(db: Session, after_id: int = 0) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+    """Look up and record one page, returns (last message ID or None when done, results)"""
+    rows = load_pending_rows(db, after_id, settings.STATUS_RECONCILE_PAGE_SIZE)
+    if not rows:
+        return None, []
+
+    results = asyncio.run(fetch_statuses(rows, resolve_clients(db, rows)))
+    record_statuses(db, results)
+    return rows[-1].message_id, results
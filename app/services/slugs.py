@@ -0,0 +1,61 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from typing import Any, Optional
+from app.config import settings
+from app.models.workspace import Workspace
+from app.models.service import Service
+from app.utils.cache import TTLCache
+
+# Slugs never change once assigned, so slug -> ID mappings only go stale when
+# a row is deleted; callers load rows by ID and check them (e.g. is_active).
+# Unknown slugs are not cached, so new workspaces/services resolve immediately.
+slug_cache = TTLCache(ttl_seconds=settings.SLUG_CACHE_TTL_SECONDS)
+
+
+def slugify(name: str) -> str:
+    return name.lower().replace(" ", "-").replace("_", "-")
+
+
+def allocate_slug(db: Session, column: Any, base: str, *criteria: Any) -> str:
+    """First free slug among base, base-1, base-2, ... found with a single query
+
+    criteria scope the uniqueness (e.g. Service.workspace_id == 1).
+    """
+    escaped = base.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    taken = {
+        slug for (slug,) in db.query(column).filter(
+            *criteria,
+            or_(column == base, column.like(f"{escaped}-%", escape="\\"))
+        )
+    }
+
+    if base not in taken:
+        return base
+
+    counter = 1
+    while f"{base}-{counter}" in taken:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+def workspace_id_for_slug(db: Session, slug: str) -> Optional[int]:
+    key = ("workspace", slug)
+    workspace_id = slug_cache.get(key)
+    if workspace_id is None:
+        workspace_id = db.query(Workspace.id).filter(Workspace.slug == slug).limit(1).scalar()
+        if workspace_id is not None:
+            slug_cache.set(key, workspace_id)
+    return workspace_id
+
+
+def service_id_for_slug(db: Session, workspace_id: int, slug: str) -> Optional[int]:
+    key = ("service", workspace_id, slug)
+    service_id = slug_cache.get(key)
+    if service_id is None:
+        service_id = db.query(Service.id).filter(
+            Service.workspace_id == workspace_id,
+            Service.slug == slug
+        ).order_by(Service.id).limit(1).scalar()
+        if service_id is not None:
+            slug_cache.set(key, service_id)
+    return service_id
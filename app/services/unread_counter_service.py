@@ -0,0 +1,194 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, case, update
+from typing import Dict, Iterable, Optional, Tuple
+import logging
+import redis
+from app.models.conversation import Conversation
+from app.utils.redis_client import get_redis
+from app.websockets.manager import websocket_manager, emit_from_worker
+
+logger = logging.getLogger(__name__)
+
+# (messages delta, conversations delta) to apply to a workspace once the write commits
+UnreadDelta = Tuple[int, int]
+
+# Only adjust counters that are already seeded; a missing hash is rebuilt from the DB
+_INCR_IF_SEEDED = """
+if redis.call('exists', KEYS[1]) == 0 then
+    return nil
+end
+return {
+    redis.call('hincrby', KEYS[1], 'messages', ARGV[1]),
+    redis.call('hincrby', KEYS[1], 'conversations', ARGV[2])
+}
+"""
+
+
+class UnreadCounterService:
+    """Per-workspace unread badge counters kept in Redis
+
+    conversations.unread_count stays the source of truth. Message inserts and
+    read events return a delta that callers apply after committing, so badge
+    reads are a single HGETALL. A counter hash missing from Redis is seeded
+    from the DB on first read, and reconcile() periodically rewrites all of
+    them to repair drift from lost increments.
+    """
+
+    key_prefix = "careops:unread"
+
+    def __init__(self):
+        self._incr_script = None
+
+    def _key(self, workspace_id: int) -> str:
+        return f"{self.key_prefix}:{workspace_id}"
+
+    def record_inbound(self, db: Session, conversation: Conversation) -> UnreadDelta:
+        """Count an inbound message as unread, atomically in the caller's transaction"""
+        unread = db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation.id)
+            .values(unread_count=func.coalesce(Conversation.unread_count, 0) + 1)
+            .returning(Conversation.unread_count)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+        set_committed_value(conversation, "unread_count", unread)
+
+        if conversation.status != "active":
+            return (0, 0)
+        return (1, 1 if unread == 1 else 0)
+
+    def mark_read(self, db: Session, conversation: Conversation) -> UnreadDelta:
+        """Clear a conversation's unread count, counting each message as read only once"""
+        seen = conversation.unread_count or 0
+        if seen == 0:
+            return (0, 0)
+
+        cleared = db.query(Conversation).filter(
+            Conversation.id == conversation.id,
+            Conversation.unread_count == seen
+        ).update({Conversation.unread_count: 0}, synchronize_session=False)
+        set_committed_value(conversation, "unread_count", 0)
+
+        if not cleared or conversation.status != "active":
+            return (0, 0)
+        return (-seen, -1)
+
+    def apply(self, workspace_id: int, delta: UnreadDelta) -> Optional[Dict[str, int]]:
+        """Apply a committed delta, returns the new counts or None if not seeded or unavailable"""
+        if delta == (0, 0):
+            return None
+
+        try:
+            if self._incr_script is None:
+                self._incr_script = get_redis().register_script(_INCR_IF_SEEDED)
+            counts = self._incr_script(keys=[self._key(workspace_id)], args=list(delta))
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for unread counters, reconcile will catch up: {str(e)}")
+            return None
+
+        if counts is None:
+            return None
+        return {
+            "total_unread_messages": max(int(counts[0]), 0),
+            "unread_conversations": max(int(counts[1]), 0)
+        }
+
+    async def publish(self, workspace_id: int, delta: UnreadDelta):
+        """Apply a committed delta and push the new badge counts to the workspace"""
+        counts = self.apply(workspace_id, delta)
+        if counts is not None:
+            await websocket_manager.emit_to_workspace(workspace_id, "unread_count", counts)
+
+    def publish_from_worker(self, workspace_id: int, delta: UnreadDelta):
+        """Like publish, for Celery tasks"""
+        counts = self.apply(workspace_id, delta)
+        if counts is not None:
+            emit_from_worker(workspace_id, "unread_count", counts)
+
+    def get(self, db: Session, workspace_id: int) -> Dict[str, int]:
+        """Read a workspace's badge counts, seeding them from the DB on a miss"""
+        try:
+            cached = get_redis().hgetall(self._key(workspace_id))
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for unread counters, reading from DB: {str(e)}")
+            return self._count(db, workspace_id)
+
+        if cached:
+            return {
+                "total_unread_messages": max(int(cached.get("messages", 0)), 0),
+                "unread_conversations": max(int(cached.get("conversations", 0)), 0)
+            }
+
+        counts = self._count(db, workspace_id)
+        self._store({workspace_id: counts})
+        return counts
+
+    def reconcile(self, db: Session, workspace_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, int]]:
+        """Recount seeded workspaces from the DB, returns those whose counters had drifted"""
+        client = get_redis()
+
+        if workspace_ids is None:
+            prefix = f"{self.key_prefix}:"
+            workspace_ids = [
+                int(key[len(prefix):]) for key in client.scan_iter(match=f"{prefix}*", count=1000)
+            ]
+        workspace_ids = list(workspace_ids)
+        if not workspace_ids:
+            return {}
+
+        pipe = client.pipeline(transaction=False)
+        for workspace_id in workspace_ids:
+            pipe.hgetall(self._key(workspace_id))
+        cached = dict(zip(workspace_ids, pipe.execute()))
+
+        actual = self._count_many(db, workspace_ids)
+        drifted = {}
+        for workspace_id in workspace_ids:
+            counts = actual.get(workspace_id, {"total_unread_messages": 0, "unread_conversations": 0})
+            current = cached[workspace_id]
+            if (
+                int(current.get("messages", 0)) != counts["total_unread_messages"]
+                or int(current.get("conversations", 0)) != counts["unread_conversations"]
+            ):
+                drifted[workspace_id] = counts
+
+        self._store(drifted)
+        return drifted
+
+    def _store(self, counts: Dict[int, Dict[str, int]]):
+        if not counts:
+            return
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for workspace_id, values in counts.items():
+                pipe.hset(self._key(workspace_id), mapping={
+                    "messages": values["total_unread_messages"],
+                    "conversations": values["unread_conversations"]
+                })
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not store unread counters: {str(e)}")
+
+    def _count(self, db: Session, workspace_id: int) -> Dict[str, int]:
+        return self._count_many(db, [workspace_id]).get(
+            workspace_id, {"total_unread_messages": 0, "unread_conversations": 0}
+        )
+
+    def _count_many(self, db: Session, workspace_ids) -> Dict[int, Dict[str, int]]:
+        rows = db.query(
+            Conversation.workspace_id,
+            func.coalesce(func.sum(Conversation.unread_count), 0),
+            func.count(case((Conversation.unread_count > 0, 1)))
+        ).filter(
+            Conversation.workspace_id.in_(workspace_ids),
+            Conversation.status == "active"
+        ).group_by(Conversation.workspace_id).all()
+
+        return {
+            workspace_id: {"total_unread_messages": int(messages), "unread_conversations": int(conversations)}
+            for workspace_id, messages, conversations in rows
+        }
+
+
+unread_counter_service = UnreadCounterService()
@@ -0,0 +1,484 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, Integer, String, case, column, func, insert, or_, tuple_, values
+from collections import defaultdict
+from datetime import datetime
+from email.parser import HeaderParser
+from email.utils import parseaddr
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import re
+import orjson
+import redis
+from app.config import settings
+from app.models.message import Message, MessageType, MessageDirection
+from app.models.conversation import Conversation, message_preview
+from app.models.contact import Contact
+from app.services.unread_counter_service import unread_counter_service
+from app.utils.redis_client import get_redis
+from app.websockets.manager import emit_batch_from_worker
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PREFIX = "/api/v1/webhooks"
+
+# Provider delivery states mapped onto Message.status; anything else is ignored
+TWILIO_STATUSES = {
+    "sent": "sent",
+    "delivered": "delivered",
+    "read": "delivered",
+    "undelivered": "failed",
+    "failed": "failed",
+}
+SENDGRID_STATUSES = {
+    "processed": "sent",
+    "delivered": "delivered",
+    "dropped": "failed",
+    "bounce": "failed",
+}
+
+# Callbacks arrive out of order; a message only ever moves forward
+STATUS_RANK = {"queued": 0, "sending": 0, "sent": 1, "delivered": 2, "failed": 2}
+
+# Last ten digits, so +1 (555) 010-0000 and 5550100000 match the same contact
+PHONE_DIGITS = 10
+
+
+def twilio_status_callback_url(integration_id: int) -> str:
+    return f"{settings.BACKEND_URL.rstrip('/')}{WEBHOOK_PREFIX}/twilio/{integration_id}/status"
+
+
+def twilio_status_event(workspace_id: int, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Status event from a Twilio message status callback"""
+    status = TWILIO_STATUSES.get(params.get("MessageStatus"))
+    if status is None or not params.get("MessageSid"):
+        return None
+
+    error = None
+    if status == "failed" and params.get("ErrorCode"):
+        error = f"Twilio error {params['ErrorCode']}"
+    return {
+        "kind": "status",
+        "workspace_id": workspace_id,
+        "external_id": params["MessageSid"],
+        "status": status,
+        "error": error
+    }
+
+
+def twilio_inbound_event(workspace_id: int, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Inbound event from a Twilio incoming SMS webhook"""
+    if not params.get("From"):
+        return None
+    return {
+        "kind": "inbound",
+        "workspace_id": workspace_id,
+        "channel": "sms",
+        "external_id": params.get("MessageSid"),
+        "sender": params["From"],
+        "name": None,
+        "subject": None,
+        "content": params.get("Body") or "",
+        "received_at": datetime.utcnow().isoformat()
+    }
+
+
+def sendgrid_status_events(workspace_id: int, payload: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Status events from a SendGrid Event Webhook batch"""
+    events = []
+    for item in payload:
+        status = SENDGRID_STATUSES.get(item.get("event"))
+        # sg_message_id is the X-Message-Id returned on send plus a ".filter..." suffix
+        external_id = (item.get("sg_message_id") or "").split(".")[0]
+        if status is None or not external_id:
+            continue
+
+        events.append({
+            "kind": "status",
+            "workspace_id": workspace_id,
+            "external_id": external_id,
+            "status": status,
+            "error": item.get("reason") if status == "failed" else None
+        })
+    return events
+
+
+def sendgrid_inbound_event(workspace_id: int, form: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Inbound event from a SendGrid Inbound Parse post"""
+    name, address = parseaddr(form.get("from") or "")
+    if not address:
+        return None
+
+    headers = HeaderParser().parsestr(form.get("headers") or "")
+    return {
+        "kind": "inbound",
+        "workspace_id": workspace_id,
+        "channel": "email",
+        "external_id": (headers.get("Message-ID") or "").strip() or None,
+        "sender": address,
+        "name": name or None,
+        "subject": form.get("subject"),
+        "content": form.get("text") or form.get("html") or "",
+        "received_at": datetime.utcnow().isoformat()
+    }
+
+
+def _sender_key(event: Dict[str, Any]) -> Tuple[int, str, str]:
+    if event["channel"] == "sms":
+        return event["workspace_id"], "sms", re.sub(r"\D", "", event["sender"])[-PHONE_DIGITS:]
+    return event["workspace_id"], "email", event["sender"].strip().lower()
+
+
+class WebhookIngestService:
+    """Buffers provider callbacks in Redis and applies them in batches
+
+    Webhook endpoints only verify and RPUSH a compact event, so providers get
+    their acknowledgement without waiting on the database. A drain task
+    takes the whole list at once (RENAME, like the form counter flush) and
+    applies it WEBHOOK_BATCH_SIZE events per transaction: status callbacks
+    as one UPDATE ... FROM (VALUES ...), inbound messages as a handful of
+    set-based lookups and inserts regardless of batch size.
+    """
+
+    events_key = "careops:webhooks:events"
+    processing_key = "careops:webhooks:processing"
+    failed_key = "careops:webhooks:failed"
+    scheduled_key = "careops:webhooks:scheduled"
+    lock_key = "careops:webhooks:draining"
+
+    def enqueue(self, events: List[Dict[str, Any]]) -> bool:
+        """Buffer events, returns True if the caller should schedule a drain
+
+        Raises redis.RedisError when the events could not be stored, so the
+        endpoint can answer with an error and the provider retries.
+        """
+        if not events:
+            return False
+
+        client = get_redis()
+        client.rpush(self.events_key, *(orjson.dumps(event) for event in events))
+        return bool(client.set(self.scheduled_key, 1, nx=True, ex=settings.WEBHOOK_FLUSH_DELAY_SECONDS + 5))
+
+    def drain(self, db: Session) -> Dict[str, int]:
+        """Apply every buffered event; a concurrent drain makes this a no-op"""
+        client = get_redis()
+        totals = {"events": 0, "statuses": 0, "messages": 0, "failed": 0}
+
+        if not client.set(self.lock_key, 1, nx=True, ex=settings.WEBHOOK_DRAIN_LOCK_SECONDS):
+            return totals
+
+        try:
+            while True:
+                # Events arriving from here on schedule another drain
+                client.delete(self.scheduled_key)
+
+                # A leftover processing list means the previous drain died mid-way; finish it first
+                if not client.exists(self.processing_key):
+                    try:
+                        client.rename(self.events_key, self.processing_key)
+                    except redis.ResponseError:
+                        break  # Nothing buffered
+
+                self._drain_processing(db, client, totals)
+        finally:
+            client.delete(self.lock_key)
+
+        return totals
+
+    def _drain_processing(self, db: Session, client: redis.Redis, totals: Dict[str, int]):
+        batch_size = settings.WEBHOOK_BATCH_SIZE
+
+        while True:
+            raw = client.lrange(self.processing_key, 0, batch_size - 1)
+            if not raw:
+                break
+
+            try:
+                applied = self.process_batch(db, [orjson.loads(item) for item in raw])
+                totals["statuses"] += applied["statuses"]
+                totals["messages"] += applied["messages"]
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Could not apply {len(raw)} webhook events, moved to {self.failed_key}: {str(e)}")
+                client.rpush(self.failed_key, *raw)
+                totals["failed"] += len(raw)
+
+            client.ltrim(self.processing_key, len(raw), -1)
+            totals["events"] += len(raw)
+
+        client.delete(self.processing_key)
+
+    def process_batch(self, db: Session, events: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Apply one batch in a single transaction, then notify workspaces"""
+        statuses = self._apply_statuses(db, [event for event in events if event["kind"] == "status"])
+        messages, contacts, unread = self._ingest_inbound(db, [event for event in events if event["kind"] == "inbound"])
+        db.commit()
+
+        for workspace_id, items in statuses.items():
+            emit_batch_from_worker(workspace_id, "message_status", items)
+        for workspace_id, items in contacts.items():
+            emit_batch_from_worker(workspace_id, "new_contact", items)
+        for workspace_id, items in messages.items():
+            emit_batch_from_worker(workspace_id, "new_message", items)
+        for workspace_id, delta in unread.items():
+            unread_counter_service.publish_from_worker(workspace_id, delta)
+
+        return {
+            "statuses": sum(len(items) for items in statuses.values()),
+            "messages": sum(len(items) for items in messages.values())
+        }
+
+    def _apply_statuses(self, db: Session, events: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Advance outbound messages by external ID, returns the changes per workspace"""
+        latest = {}
+        for event in events:
+            key = (event["workspace_id"], event["external_id"])
+            if key not in latest or STATUS_RANK[event["status"]] >= STATUS_RANK[latest[key]["status"]]:
+                latest[key] = event
+        if not latest:
+            return {}
+
+        incoming = values(
+            column("workspace_id", Integer),
+            column("external_id", String),
+            column("status", String),
+            column("rank", Integer),
+            column("error", String),
+            name="incoming"
+        ).data([
+            (event["workspace_id"], event["external_id"], event["status"], STATUS_RANK[event["status"]], event["error"])
+            for event in latest.values()
+        ])
+        messages = Message.__table__
+        conversations = Conversation.__table__
+        current_rank = case(
+            (messages.c.status == "sent", 1),
+            (messages.c.status.in_(("delivered", "failed")), 2),
+            else_=0
+        )
+
+        updated = db.execute(
+            messages.update()
+            .where(
+                messages.c.external_id == incoming.c.external_id,
+                messages.c.direction == MessageDirection.OUTBOUND,
+                messages.c.conversation_id == conversations.c.id,
+                conversations.c.workspace_id == incoming.c.workspace_id,
+                current_rank < incoming.c.rank
+            )
+            .values(status=incoming.c.status, error=func.coalesce(incoming.c.error, messages.c.error))
+            .returning(messages.c.id, conversations.c.workspace_id, messages.c.status, messages.c.error)
+        ).all()
+
+        by_workspace = defaultdict(list)
+        for message_id, workspace_id, status, error in updated:
+            by_workspace[workspace_id].append({"id": message_id, "status": status, "error": error})
+        return by_workspace
+
+    def _ingest_inbound(self, db: Session, events: List[Dict[str, Any]]):
+        """Store inbound messages, returns (messages, new contacts, unread deltas) per workspace"""
+        events = self._skip_duplicates(db, events)
+        if not events:
+            return {}, {}, {}
+
+        conversations, contacts = self._resolve_conversations(db, events)
+
+        rows = [
+            {
+                "conversation_id": conversations[_sender_key(event)],
+                "type": MessageType(event["channel"]),
+                "direction": MessageDirection.INBOUND,
+                "subject": event["subject"],
+                "content": event["content"],
+                "is_automated": False,
+                "external_id": event["external_id"],
+                "status": "received",
+                "created_at": datetime.fromisoformat(event["received_at"])
+            }
+            for event in events
+        ]
+        message_ids = db.scalars(insert(Message).returning(Message.id, sort_by_parameter_order=True), rows).all()
+
+        # Per conversation: message count and the newest message for the inbox preview
+        received = {}
+        for row in rows:
+            count, newest = received.get(row["conversation_id"], (0, row))
+            if row["created_at"] >= newest["created_at"]:
+                newest = row
+            received[row["conversation_id"]] = (count + 1, newest)
+
+        incoming = values(
+            column("id", Integer),
+            column("n", Integer),
+            column("at", DateTime),
+            column("preview", String),
+            column("channel", String),
+            name="incoming"
+        ).data([
+            (conversation_id, count, newest["created_at"], message_preview(newest["content"]), newest["type"].value)
+            for conversation_id, (count, newest) in received.items()
+        ])
+        conversations = Conversation.__table__
+        newer = or_(
+            conversations.c.last_message_preview.is_(None),
+            conversations.c.last_message_at.is_(None),
+            conversations.c.last_message_at <= incoming.c.at
+        )
+
+        updated = db.execute(
+            conversations.update()
+            .where(conversations.c.id == incoming.c.id)
+            .values(
+                unread_count=func.coalesce(conversations.c.unread_count, 0) + incoming.c.n,
+                last_message_at=case((newer, incoming.c.at), else_=conversations.c.last_message_at),
+                last_message_preview=case((newer, incoming.c.preview), else_=conversations.c.last_message_preview),
+                last_message_direction=case((newer, "inbound"), else_=conversations.c.last_message_direction),
+                last_message_channel=case((newer, incoming.c.channel), else_=conversations.c.last_message_channel),
+                updated_at=datetime.utcnow()
+            )
+            .returning(conversations.c.id, conversations.c.workspace_id, conversations.c.contact_id,
+                       conversations.c.status, conversations.c.unread_count, incoming.c.n)
+        ).all()
+
+        workspace_of = {}
+        contact_of = {}
+        unread = defaultdict(lambda: (0, 0))
+        for conversation_id, workspace_id, contact_id, status, unread_count, count in updated:
+            workspace_of[conversation_id] = workspace_id
+            contact_of[conversation_id] = contact_id
+            if status == "active":
+                messages, newly_unread = unread[workspace_id]
+                unread[workspace_id] = (messages + count, newly_unread + (1 if unread_count == count else 0))
+
+        messages = defaultdict(list)
+        for message_id, row in zip(message_ids, rows):
+            conversation_id = row["conversation_id"]
+            messages[workspace_of[conversation_id]].append({
+                "id": message_id,
+                "conversation_id": conversation_id,
+                "contact_id": contact_of[conversation_id],
+                "type": row["type"].value,
+                "direction": "inbound",
+                "subject": row["subject"],
+                "preview": message_preview(row["content"]),
+                "created_at": row["created_at"].isoformat()
+            })
+
+        return messages, contacts, unread
+
+    def _skip_duplicates(self, db: Session, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop provider retries: repeated external IDs in the batch or already stored"""
+        unique = {}
+        anonymous = []
+        for event in events:
+            if event["external_id"]:
+                unique.setdefault((event["workspace_id"], event["external_id"]), event)
+            else:
+                anonymous.append(event)
+
+        if unique:
+            stored = db.query(Conversation.workspace_id, Message.external_id).join(
+                Conversation, Message.conversation_id == Conversation.id
+            ).filter(
+                Message.external_id.in_({external_id for _, external_id in unique}),
+                Message.direction == MessageDirection.INBOUND
+            ).all()
+            for workspace_id, external_id in stored:
+                unique.pop((workspace_id, external_id), None)
+
+        return list(unique.values()) + anonymous
+
+    def _resolve_conversations(self, db: Session, events: List[Dict[str, Any]]):
+        """Conversation ID per sender key, creating contacts and conversations for new senders
+
+        Returns ({sender key: conversation ID}, {workspace ID: new contact payloads}).
+        """
+        senders = {}
+        for event in events:
+            senders.setdefault(_sender_key(event), event)
+
+        phone_digits = func.right(func.regexp_replace(Contact.phone, r"\D", "", "g"), PHONE_DIGITS)
+        email_key = func.lower(Contact.email)
+        phone_keys = [(workspace_id, value) for workspace_id, channel, value in senders if channel == "sms"]
+        email_keys = [(workspace_id, value) for workspace_id, channel, value in senders if channel == "email"]
+
+        conditions = []
+        if phone_keys:
+            conditions.append(tuple_(Contact.workspace_id, phone_digits).in_(phone_keys))
+        if email_keys:
+            conditions.append(tuple_(Contact.workspace_id, email_key).in_(email_keys))
+
+        # Oldest contact wins when several share a phone number or address
+        contact_ids = {}
+        for contact_id, workspace_id, phone, email in db.query(
+            Contact.id, Contact.workspace_id, phone_digits, email_key
+        ).filter(or_(*conditions)).order_by(Contact.id):
+            for key in ((workspace_id, "sms", phone), (workspace_id, "email", email)):
+                if key in senders:
+                    contact_ids.setdefault(key, contact_id)
+
+        new_senders = [key for key in senders if key not in contact_ids]
+        new_contacts = defaultdict(list)
+        if new_senders:
+            now = datetime.utcnow()
+            contact_rows = [
+                {
+                    "workspace_id": key[0],
+                    "full_name": senders[key]["name"] or senders[key]["sender"],
+                    "email": senders[key]["sender"] if key[1] == "email" else None,
+                    "phone": senders[key]["sender"] if key[1] == "sms" else None,
+                    "preferred_channel": key[1],
+                    "created_at": now
+                }
+                for key in new_senders
+            ]
+            created = db.scalars(
+                insert(Contact).returning(Contact.id, sort_by_parameter_order=True), contact_rows
+            ).all()
+            for key, contact_id, row in zip(new_senders, created, contact_rows):
+                contact_ids[key] = contact_id
+                new_contacts[key[0]].append({
+                    "id": contact_id,
+                    "full_name": row["full_name"],
+                    "email": row["email"],
+                    "phone": row["phone"],
+                    "created_at": now.isoformat()
+                })
+
+        # Reply into the contact's active conversation, else its most recent one
+        conversation_of_contact = {}
+        for conversation_id, contact_id in db.query(Conversation.id, Conversation.contact_id).filter(
+            Conversation.contact_id.in_(set(contact_ids.values()))
+        ).order_by(
+            Conversation.contact_id,
+            (Conversation.status == "active").desc(),
+            Conversation.last_message_at.desc().nulls_last(),
+            Conversation.id.desc()
+        ):
+            conversation_of_contact.setdefault(contact_id, conversation_id)
+
+        without_conversation = sorted({
+            (key[0], contact_id) for key, contact_id in contact_ids.items()
+            if contact_id not in conversation_of_contact
+        })
+        if without_conversation:
+            created = db.scalars(
+                insert(Conversation).returning(Conversation.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "workspace_id": workspace_id,
+                        "contact_id": contact_id,
+                        "status": "active",
+                        "automation_paused": False,
+                        "unread_count": 0
+                    }
+                    for workspace_id, contact_id in without_conversation
+                ]
+            ).all()
+            for (_, contact_id), conversation_id in zip(without_conversation, created):
+                conversation_of_contact[contact_id] = conversation_id
+
+        conversations = {key: conversation_of_contact[contact_id] for key, contact_id in contact_ids.items()}
+        return conversations, new_contacts
+
+
+webhook_ingest_service = WebhookIngestService()
@@ -12,12 +12,15 @@ from app.models.inventory import InventoryItem
 from app.models.alert import Alert, AlertStatus
 from app.schemas.workspace import WorkspaceUpdate
 from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.response_cache import response_cache, workspace_tag
+from app.services.slugs import workspace_id_for_slug
 
 
 class WorkspaceService:
     async def get_workspace_by_slug(self, db: Session, slug: str) -> Workspace:
         """Get workspace by slug"""
-        workspace = db.query(Workspace).filter(Workspace.slug == slug).first()
+        workspace_id = workspace_id_for_slug(db, slug)
+        workspace = db.get(Workspace, workspace_id) if workspace_id else None
         if not workspace:
             raise NotFoundException("Workspace not found")
         return workspace
@@ -36,6 +39,8 @@ class WorkspaceService:
         db.commit()
         db.refresh(workspace)
         
+        response_cache.purge([workspace_tag(workspace_id)])
+        
         return workspace
     
     async def activate_workspace(self, db: Session, workspace_id: int) -> Dict[str, Any]:
@@ -0,0 +1,53 @@
+from app.tasks.celery_app import celery_app
+from app.database import get_db
+from app.services import calendar_sync
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_calendar_push(booking_ids: List[int]):
+    """Queue bookings to be mirrored to their workspace's calendar"""
+    push_booking_events.delay(list(booking_ids))
+
+
+@celery_app.task
+def sync_calendars(integration_ids: Optional[List[int]] = None):
+    """Mirror busy time from connected calendars into external_busy_intervals"""
+    db = next(get_db())
+
+    try:
+        results = calendar_sync.sync_calendars(db, integration_ids)
+
+        failed = sum(1 for changes in results if changes.error)
+        changed = sum(len(changes.busy) + len(changes.removed) for changes in results if not changes.error)
+        if changed or failed:
+            logger.info(f"Synced {len(results)} calendars: {changed} events changed, {failed} failed")
+        return {"status": "success", "calendars": len(results), "events": changed, "failed": failed}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in sync_calendars: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def push_booking_events(booking_ids: List[int]):
+    """Create, update or delete the calendar events for these bookings"""
+    db = next(get_db())
+
+    try:
+        result = calendar_sync.push_bookings(db, booking_ids)
+        if result["failed"]:
+            logger.warning(f"Calendar push: {result['failed']} of {len(booking_ids)} bookings failed")
+        return {"status": "success", **result}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in push_booking_events: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
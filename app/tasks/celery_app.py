@@ -12,7 +12,12 @@ celery_app = Celery(
         "app.tasks.booking_tasks",
         "app.tasks.form_tasks",
         "app.tasks.inventory_tasks",
-        "app.tasks.automation_tasks"
+        "app.tasks.automation_tasks",
+        "app.tasks.export_tasks",
+        "app.tasks.conversation_tasks",
+        "app.tasks.message_tasks",
+        "app.tasks.integration_tasks",
+        "app.tasks.calendar_tasks"
     ]
 )
 
@@ -38,6 +43,11 @@ celery_app.conf.task_routes = {
     'app.tasks.form_tasks.*': {'queue': 'forms'},
     'app.tasks.inventory_tasks.*': {'queue': 'inventory'},
     'app.tasks.automation_tasks.*': {'queue': 'automation'},
+    'app.tasks.export_tasks.*': {'queue': 'exports'},
+    'app.tasks.conversation_tasks.*': {'queue': 'conversations'},
+    'app.tasks.message_tasks.*': {'queue': 'messages'},
+    'app.tasks.integration_tasks.*': {'queue': 'integrations'},
+    'app.tasks.calendar_tasks.*': {'queue': 'calendar'},
 }
 
 # Beat schedule for periodic tasks
@@ -46,9 +56,45 @@ celery_app.conf.beat_schedule = {
         'task': 'app.tasks.form_tasks.check_overdue_forms',
         'schedule': 60.0 * 60,  # Every hour
     },
-    'check-low-inventory': {
+    'flush-form-counters': {
+        'task': 'app.tasks.form_tasks.flush_form_counters',
+        'schedule': 60.0,  # Every minute
+    },
+    'requeue-stale-exports': {
+        'task': 'app.tasks.export_tasks.requeue_stale_exports',
+        'schedule': 60.0 * 5,  # Every 5 minutes
+    },
+    'purge-expired-exports': {
+        'task': 'app.tasks.export_tasks.purge_expired_exports',
+        'schedule': 60.0 * 60,  # Every hour
+    },
+    'sweep-message-dispatch': {
+        'task': 'app.tasks.message_tasks.sweep_message_dispatch',
+        'schedule': 60.0,  # Every minute
+    },
+    'process-webhook-events': {
+        'task': 'app.tasks.message_tasks.process_webhook_events',
+        'schedule': 60.0,  # Every minute; endpoints schedule a drain as callbacks arrive
+    },
+    'reconcile-message-statuses': {
+        'task': 'app.tasks.message_tasks.reconcile_message_statuses',
+        'schedule': 60.0 * 5,  # Every 5 minutes; callbacks deliver most statuses
+    },
+    'check-integration-health': {
+        'task': 'app.tasks.integration_tasks.check_integration_health',
+        'schedule': 60.0 * 5,  # Every 5 minutes; results are cached for the integrations list
+    },
+    'sync-calendars': {
+        'task': 'app.tasks.calendar_tasks.sync_calendars',
+        'schedule': 60.0 * 5,  # Every 5 minutes; incremental, so quiet calendars cost one request
+    },
+    'reconcile-unread-counters': {
+        'task': 'app.tasks.conversation_tasks.reconcile_unread_counters',
+        'schedule': 60.0 * 10,  # Every 10 minutes; counters are updated as messages arrive
+    },
+    'reconcile-low-inventory': {
         'task': 'app.tasks.inventory_tasks.check_low_inventory',
-        'schedule': 60.0 * 60 * 6,  # Every 6 hours
+        'schedule': 60.0 * 60 * 24,  # Daily; alerts are raised when stock changes
     },
     'send-daily-reminders': {
         'task': 'app.tasks.booking_tasks.send_daily_reminders',
@@ -0,0 +1,35 @@
+from app.tasks.celery_app import celery_app
+from app.database import get_db
+from app.services.unread_counter_service import unread_counter_service
+from app.websockets.manager import emit_from_worker
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True)
+def reconcile_unread_counters(self):
+    """Rewrite Redis unread badge counters that drifted from conversations.unread_count
+
+    Increments are applied after commit and can be lost if Redis or the web
+    process fails in between; this pass recounts every seeded workspace in one
+    grouped query and pushes corrected badges to connected clients.
+    """
+    db = next(get_db())
+    
+    try:
+        drifted = unread_counter_service.reconcile(db)
+        
+        for workspace_id, counts in drifted.items():
+            emit_from_worker(workspace_id, "unread_count", counts)
+        
+        if drifted:
+            logger.warning(f"Corrected unread counters for {len(drifted)} workspaces")
+        return {"status": "success", "corrected": len(drifted)}
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in reconcile_unread_counters: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
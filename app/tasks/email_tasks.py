@@ -1,12 +1,9 @@
 from celery import current_app
 from app.tasks.celery_app import celery_app
+from app.tasks.message_tasks import dispatch_messages
 from app.database import get_db
-from app.models.message import Message
-from app.models.contact import Contact
-from app.models.workspace import Workspace
-from app.integrations.email.sendgrid import SendGridIntegration
-from app.services.integration_service import IntegrationService
-from datetime import datetime
+from app.integrations.registry import integration_registry
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,100 +11,28 @@ logger = logging.getLogger(__name__)
 
 @celery_app.task(bind=True)
 def send_email_task(self, message_id: int):
-    """Send email message"""
-    db = next(get_db())
-    integration_service = IntegrationService()
-    
-    try:
-        # Get message
-        message = db.query(Message).filter(Message.id == message_id).first()
-        if not message:
-            logger.error(f"Message {message_id} not found")
-            return {"status": "failed", "error": "Message not found"}
-        
-        # Get contact and workspace
-        contact = db.query(Contact).filter(Contact.id == message.conversation.contact_id).first()
-        workspace = db.query(Workspace).filter(Contact.workspace_id == contact.workspace_id).first()
-        
-        if not contact.email:
-            logger.error(f"Contact {contact.id} has no email address")
-            message.status = "failed"
-            db.commit()
-            return {"status": "failed", "error": "No email address"}
-        
-        # Get email integration
-        try:
-            email_integration = await integration_service.get_email_integration(db, workspace.id)
-        except Exception as e:
-            logger.error(f"No email integration found for workspace {workspace.id}: {str(e)}")
-            message.status = "failed"
-            db.commit()
-            return {"status": "failed", "error": "No email integration configured"}
-        
-        # Create integration instance
-        if email_integration.provider == "sendgrid":
-            email_client = SendGridIntegration(email_integration.credentials)
-        else:
-            logger.error(f"Unsupported email provider: {email_integration.provider}")
-            message.status = "failed"
-            db.commit()
-            return {"status": "failed", "error": "Unsupported email provider"}
-        
-        # Send email
-        result = await email_client.send_email(
-            to_email=contact.email,
-            subject=message.subject or "Message from " + workspace.name,
-            html_content=f"<p>{message.content}</p>",
-            text_content=message.content
-        )
-        
-        if result["success"]:
-            message.status = "sent"
-            message.external_id = result.get("message_id")
-            logger.info(f"Email sent successfully: {message_id}")
-        else:
-            message.status = "failed"
-            logger.error(f"Failed to send email: {result.get('error')}")
-        
-        db.commit()
-        return result
-        
-    except Exception as e:
-        logger.error(f"Error in send_email_task: {str(e)}")
-        if 'message' in locals():
-            message.status = "failed"
-            db.commit()
-        return {"status": "failed", "error": str(e)}
-    finally:
-        db.close()
+    """Send email message (single-message entry point to the dispatch pipeline)"""
+    return dispatch_messages(message_ids=[message_id])
 
 
 @celery_app.task(bind=True)
 def send_template_email_task(self, workspace_id: int, to_email: str, template_type: str, template_data: dict):
     """Send templated email"""
     db = next(get_db())
-    integration_service = IntegrationService()
     
     try:
-        # Get email integration
-        email_integration = await integration_service.get_email_integration(db, workspace_id)
-        
-        # Create integration instance
-        if email_integration.provider == "sendgrid":
-            email_client = SendGridIntegration(email_integration.credentials)
-        else:
-            logger.error(f"Unsupported email provider: {email_integration.provider}")
-            return {"status": "failed", "error": "Unsupported email provider"}
+        # Cached client for the workspace's active email integration
+        email_client = integration_registry.get_active_client(db, workspace_id, "email")
         
         # Get template content based on type
         subject, html_content = _get_email_template(template_type, template_data)
         
         # Send email
-        result = await email_client.send_email(
+        result = asyncio.run(email_client.send_email(
             to_email=to_email,
             subject=subject,
             html_content=html_content
-        )
+        ))
         
         logger.info(f"Template email '{template_type}' sent to {to_email}: {result['success']}")
         return result
@@ -0,0 +1,197 @@
+from app.tasks.celery_app import celery_app
+from app.database import get_db
+from app.config import settings
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.services.export_service import ExportService, encode_rows, encode_csv_header
+from app.services.export_storage import get_export_storage
+from app.websockets.manager import emit_from_worker
+from sqlalchemy import and_, or_, func
+from datetime import datetime, timedelta
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=3)
+def run_export_job(self, job_id: int):
+    """Write an export job's rows to storage, one keyset chunk at a time
+
+    Each chunk is written before its progress is committed, so a job resumed
+    after a worker restart rewrites at most the chunk that was in flight.
+    Long exports hand off to a fresh task before hitting the Celery time limit.
+    """
+    db = next(get_db())
+    job = None
+
+    try:
+        job = _claim_job(db, job_id)
+        if job is None:
+            logger.info(f"Export job {job_id} is not runnable, skipping")
+            return {"status": "skipped"}
+
+        storage = get_export_storage()
+        service = ExportService(db)
+        params = job.params or {}
+        headers = service.export_columns(job.export_type, job.workspace_id, params)
+
+        if job.last_key is None:
+            if job.format == "csv":
+                storage.write(f"{job.storage_prefix}/header.csv", encode_csv_header(headers))
+            job.total_rows = service.count_export_rows(job.export_type, job.workspace_id, params)
+            db.commit()
+
+        deadline = time.monotonic() + settings.EXPORT_TASK_BUDGET_SECONDS
+        extension = "jsonl" if job.format == "jsonl" else "csv"
+
+        while True:
+            rows = list(service.iter_export_rows(
+                job.export_type, job.workspace_id, params,
+                after_id=job.last_key, limit=settings.EXPORT_CHUNK_ROWS
+            ))
+            if not rows:
+                break
+
+            storage.write(
+                f"{job.storage_prefix}/chunk_{job.chunk_count:06d}.{extension}",
+                encode_rows(job.format, headers, rows)
+            )
+
+            job.chunk_count += 1
+            job.last_key = rows[-1][0]
+            job.rows_written += len(rows)
+            job.heartbeat_at = datetime.utcnow()
+            db.commit()
+            _emit_progress(job)
+
+            if len(rows) < settings.EXPORT_CHUNK_ROWS:
+                break
+
+            if time.monotonic() > deadline:
+                job.status = ExportJobStatus.PENDING.value
+                db.commit()
+                run_export_job.delay(job.id)
+                logger.info(f"Export job {job.id} continuing after {job.rows_written} rows")
+                return {"status": "continued", "rows_written": job.rows_written}
+
+        now = datetime.utcnow()
+        job.status = ExportJobStatus.COMPLETED.value
+        job.completed_at = now
+        job.expires_at = now + timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+        db.commit()
+        _emit_progress(job)
+
+        logger.info(f"Export job {job.id} completed with {job.rows_written} rows")
+        return {"status": "success", "rows_written": job.rows_written}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in run_export_job {job_id}: {str(e)}")
+
+        if job is None:
+            return {"status": "failed", "error": str(e)}
+
+        # Bad parameters won't get better; anything else is retried from last_key
+        if not isinstance(e, ValueError) and self.request.retries < self.max_retries:
+            job.status = ExportJobStatus.PENDING.value
+            db.commit()
+            raise self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+
+        now = datetime.utcnow()
+        job.status = ExportJobStatus.FAILED.value
+        job.error = str(e)
+        job.completed_at = now
+        job.expires_at = now + timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+        db.commit()
+        _emit_progress(job)
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def requeue_stale_exports():
+    """Re-enqueue export jobs whose worker died or whose task message was lost"""
+    db = next(get_db())
+
+    try:
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.EXPORT_STALE_AFTER_SECONDS)
+
+        job_ids = [row.id for row in db.query(ExportJob.id).filter(
+            ExportJob.status.in_([ExportJobStatus.PENDING.value, ExportJobStatus.RUNNING.value]),
+            func.coalesce(ExportJob.heartbeat_at, ExportJob.created_at) < stale_before
+        ).all()]
+
+        for job_id in job_ids:
+            run_export_job.delay(job_id)
+
+        if job_ids:
+            logger.warning(f"Requeued {len(job_ids)} stale export jobs")
+        return {"status": "success", "requeued": len(job_ids)}
+
+    except Exception as e:
+        logger.error(f"Error in requeue_stale_exports: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def purge_expired_exports():
+    """Delete stored chunks and job records past their retention window"""
+    db = next(get_db())
+
+    try:
+        storage = get_export_storage()
+        jobs = db.query(ExportJob).filter(ExportJob.expires_at < datetime.utcnow()).all()
+
+        for job in jobs:
+            storage.delete(job.chunk_keys)
+            db.delete(job)
+        db.commit()
+
+        return {"status": "success", "purged": len(jobs)}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in purge_expired_exports: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+def _claim_job(db, job_id: int):
+    """Mark job running if it is pending or its previous worker went silent
+
+    The conditional UPDATE makes duplicate deliveries of the same job a no-op.
+    """
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.EXPORT_STALE_AFTER_SECONDS)
+
+    claimed = db.query(ExportJob).filter(
+        ExportJob.id == job_id,
+        or_(
+            ExportJob.status == ExportJobStatus.PENDING.value,
+            and_(ExportJob.status == ExportJobStatus.RUNNING.value, ExportJob.heartbeat_at < stale_before)
+        )
+    ).update({
+        ExportJob.status: ExportJobStatus.RUNNING.value,
+        ExportJob.heartbeat_at: now,
+        ExportJob.started_at: func.coalesce(ExportJob.started_at, now)
+    }, synchronize_session=False)
+    db.commit()
+
+    if not claimed:
+        return None
+    return db.query(ExportJob).filter(ExportJob.id == job_id).first()
+
+
+def _emit_progress(job: ExportJob):
+    emit_from_worker(job.workspace_id, "export_progress", {
+        "id": job.id,
+        "status": job.status,
+        "export_type": job.export_type,
+        "rows_written": job.rows_written,
+        "total_rows": job.total_rows,
+        "error": job.error
+    })
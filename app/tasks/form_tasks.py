@@ -6,6 +6,7 @@ from app.models.booking import Booking
 from app.models.alert import Alert, AlertStatus, AlertSeverity
 from app.tasks.email_tasks import send_template_email_task
 from app.tasks.sms_tasks import send_template_sms_task
+from app.services.form_counter_service import form_counter_service
 from datetime import datetime, date
 import logging
 
@@ -207,4 +208,22 @@ def send_form_reminder(self, submission_id: int):
         logger.error(f"Error in send_form_reminder: {str(e)}")
         return {"status": "failed", "error": str(e)}
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@celery_app.task(bind=True)
+def flush_form_counters(self):
+    """Apply buffered form view counts to the forms table"""
+    db = next(get_db())
+    
+    try:
+        flushed = form_counter_service.flush(db)
+        logger.info(f"Flushed form counters: {flushed}")
+        return {"status": "success", "flushed": flushed}
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in flush_form_counters: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
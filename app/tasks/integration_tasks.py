@@ -0,0 +1,28 @@
+from app.tasks.celery_app import celery_app
+from app.database import get_db
+from app.services.integration_health import integration_health_service
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def check_integration_health():
+    """Test all active integrations concurrently and cache the results"""
+    db = next(get_db())
+
+    try:
+        results = asyncio.run(integration_health_service.check_all(db))
+
+        failed = [integration_id for integration_id, result in results.items() if result["status"] != "success"]
+        if failed:
+            logger.warning(f"Integration health check: {len(failed)} of {len(results)} failing ({failed})")
+        return {"status": "success", "checked": len(results), "failed": len(failed)}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in check_integration_health: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
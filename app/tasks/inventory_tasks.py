@@ -1,8 +1,11 @@
 from celery import current_app
 from app.tasks.celery_app import celery_app
 from app.database import get_db
-from app.models.inventory import InventoryItem
-from app.models.alert import Alert, AlertStatus, AlertSeverity
+from app.models.booking import Booking
+from app.services.inventory_alerts import low_stock_alert_insert, stale_alert_resolve, alert_payload
+from app.services.inventory_reservations import reserve_for_booking, release_for_booking
+from app.websockets.manager import emit_from_worker, emit_batch_from_worker
+from collections import defaultdict
 from datetime import datetime
 import logging
 
@@ -11,70 +14,41 @@ logger = logging.getLogger(__name__)
 
 @celery_app.task(bind=True)
 def check_low_inventory(self):
-    """Check for low inventory items and create alerts"""
+    """Reconcile inventory_low alerts with current stock levels
+
+    Alerts are opened and resolved at write time (see stock_level_changed);
+    this daily pass only repairs drift, e.g. quantities changed outside the
+    app: one INSERT ... SELECT for low items without an active alert and one
+    UPDATE resolving alerts whose item recovered or was deleted.
+    """
     db = next(get_db())
     
     try:
-        # Find low inventory items
-        low_stock_items = db.query(InventoryItem).filter(
-            InventoryItem.quantity <= InventoryItem.low_stock_threshold
-        ).all()
+        now = datetime.utcnow()
+        created = db.execute(low_stock_alert_insert(now)).mappings().all()
+        resolved = db.execute(stale_alert_resolve(now)).mappings().all()
+        db.commit()
         
-        alerts_created = 0
+        events = defaultdict(list)
+        for alert in created:
+            events[(alert["workspace_id"], "new_alert")].append(alert_payload(alert))
+        for alert in resolved:
+            events[(alert["workspace_id"], "alert_resolved")].append(
+                {"id": alert["id"], "reference_id": alert["reference_id"]}
+            )
         
-        for item in low_stock_items:
-            try:
-                # Check if alert already exists
-                existing_alert = db.query(Alert).filter(
-                    Alert.workspace_id == item.workspace_id,
-                    Alert.type == "inventory_low",
-                    Alert.reference_type == "inventory_item",
-                    Alert.reference_id == item.id,
-                    Alert.status == AlertStatus.ACTIVE
-                ).first()
-                
-                if not existing_alert:
-                    # Determine severity based on stock level
-                    if item.quantity == 0:
-                        severity = AlertSeverity.CRITICAL
-                        title = f"Out of Stock: {item.name}"
-                        message = f"{item.name} is completely out of stock!"
-                    else:
-                        severity = AlertSeverity.HIGH
-                        title = f"Low Stock: {item.name}"
-                        message = f"{item.name} is running low. Current stock: {item.quantity} {item.unit}"
-                    
-                    # Create alert
-                    alert = Alert(
-                        workspace_id=item.workspace_id,
-                        type="inventory_low",
-                        status=AlertStatus.ACTIVE,
-                        severity=severity,
-                        title=title,
-                        message=message,
-                        reference_type="inventory_item",
-                        reference_id=item.id,
-                        link=f"/inventory/{item.id}"
-                    )
-                    db.add(alert)
-                    alerts_created += 1
-                    
-                    logger.info(f"Created low stock alert for inventory item {item.id}: {item.name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to process inventory item {item.id}: {str(e)}")
-                continue
+        for (workspace_id, event), items in events.items():
+            emit_batch_from_worker(workspace_id, event, items)
         
-        db.commit()
-        
-        logger.info(f"Processed {len(low_stock_items)} low stock items, created {alerts_created} alerts")
+        logger.info(f"Inventory alert reconciliation created {len(created)} and resolved {len(resolved)} alerts")
         return {
             "status": "success",
-            "low_stock_items": len(low_stock_items),
-            "alerts_created": alerts_created
+            "alerts_created": len(created),
+            "alerts_resolved": len(resolved)
         }
         
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in check_low_inventory: {str(e)}")
         return {"status": "failed", "error": str(e)}
     finally:
@@ -83,59 +57,37 @@ def check_low_inventory(self):
 
 @celery_app.task(bind=True)
 def reserve_inventory_for_booking(self, booking_id: int):
-    """Reserve inventory items for a booking"""
+    """Reserve inventory items for a booking
+
+    Safe to retry: items already reserved for the booking are skipped, and
+    items without enough stock are reported rather than driven negative.
+    """
     db = next(get_db())
     
     try:
-        from app.models.booking import Booking
-        from app.models.service import Service
-        from app.models.service_inventory import ServiceInventory  # If implementing this feature
-        
         booking = db.query(Booking).filter(Booking.id == booking_id).first()
         if not booking:
             logger.error(f"Booking {booking_id} not found")
             return {"status": "failed", "error": "Booking not found"}
         
-        service = booking.service
-        
-        # Note: This would require a ServiceInventory relationship table
-        # to map which inventory items are used by each service
-        # For now, we'll implement a basic version
-        
-        # Get inventory items that might need to be reserved
-        # This is a simplified implementation
-        inventory_items = db.query(InventoryItem).filter(
-            InventoryItem.workspace_id == booking.workspace_id,
-            InventoryItem.usage_per_booking > 0
-        ).all()
-        
-        reserved_items = []
-        
-        for item in inventory_items:
-            if item.quantity >= item.usage_per_booking:
-                # Reserve the item
-                item.quantity -= item.usage_per_booking
-                reserved_items.append({
-                    "item_id": item.id,
-                    "name": item.name,
-                    "quantity_reserved": item.usage_per_booking,
-                    "remaining_stock": item.quantity
-                })
-                
-                # Check if item is now low stock
-                if item.quantity <= item.low_stock_threshold:
-                    check_low_inventory.delay()
-        
+        result, alert_events = reserve_for_booking(db, booking)
         db.commit()
+        _emit_alert_events(booking.workspace_id, alert_events)
+        
+        if result["insufficient"]:
+            logger.warning(f"Insufficient stock for booking {booking_id}: items {result['insufficient']}")
         
-        logger.info(f"Reserved inventory for booking {booking_id}: {len(reserved_items)} items")
+        logger.info(f"Reserved inventory for booking {booking_id}: {len(result['reserved'])} items")
         return {
             "status": "success",
             "booking_id": booking_id,
-            "reserved_items": reserved_items
+            "reserved_items": result["reserved"],
+            "already_reserved": result["already_reserved"],
+            "insufficient_items": result["insufficient"]
         }
         
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in reserve_inventory_for_booking: {str(e)}")
         return {"status": "failed", "error": str(e)}
     finally:
@@ -144,46 +96,38 @@ def reserve_inventory_for_booking(self, booking_id: int):
 
 @celery_app.task(bind=True)
 def release_inventory_for_booking(self, booking_id: int):
-    """Release reserved inventory when booking is cancelled"""
+    """Release reserved inventory when booking is cancelled
+
+    Only stock recorded as reserved for the booking is returned, and only once.
+    """
     db = next(get_db())
     
     try:
-        from app.models.booking import Booking
-        
         booking = db.query(Booking).filter(Booking.id == booking_id).first()
         if not booking:
             logger.error(f"Booking {booking_id} not found")
             return {"status": "failed", "error": "Booking not found"}
         
-        # Get inventory items that were reserved for this service
-        inventory_items = db.query(InventoryItem).filter(
-            InventoryItem.workspace_id == booking.workspace_id,
-            InventoryItem.usage_per_booking > 0
-        ).all()
-        
-        released_items = []
-        
-        for item in inventory_items:
-            # Release the reserved quantity
-            item.quantity += item.usage_per_booking
-            released_items.append({
-                "item_id": item.id,
-                "name": item.name,
-                "quantity_released": item.usage_per_booking,
-                "new_stock": item.quantity
-            })
-        
+        result, alert_events = release_for_booking(db, booking)
         db.commit()
+        _emit_alert_events(booking.workspace_id, alert_events)
         
-        logger.info(f"Released inventory for cancelled booking {booking_id}: {len(released_items)} items")
+        logger.info(f"Released inventory for cancelled booking {booking_id}: {len(result['released'])} items")
         return {
             "status": "success",
             "booking_id": booking_id,
-            "released_items": released_items
+            "released_items": result["released"]
         }
         
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in release_inventory_for_booking: {str(e)}")
         return {"status": "failed", "error": str(e)}
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def _emit_alert_events(workspace_id: int, events):
+    """Emit alert changes collected during a committed stock change"""
+    for event, data in events:
+        emit_from_worker(workspace_id, event, data)
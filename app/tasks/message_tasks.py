@@ -0,0 +1,166 @@
+from app.tasks.celery_app import celery_app
+from app.database import get_db
+from app.config import settings
+from app.models.message import Message, MessageDirection
+from app.services.message_dispatch import dispatch
+from app.services.message_reconcile import reconcile_page
+from app.services.webhook_ingest import webhook_ingest_service
+from app.websockets.manager import emit_batch_from_worker
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_dispatch(message_ids: List[int]):
+    """Queue outbound messages for delivery in batches of DISPATCH_BATCH_SIZE"""
+    batch_size = settings.DISPATCH_BATCH_SIZE
+    for start in range(0, len(message_ids), batch_size):
+        dispatch_messages.delay(list(message_ids[start:start + batch_size]))
+
+
+@celery_app.task(bind=True)
+def dispatch_messages(self, message_ids: List[int]):
+    """Send a batch of queued outbound messages
+
+    Messages are claimed (queued -> sending) before sending, so a duplicate
+    delivery of the task or a concurrent sweep never sends a message twice.
+    """
+    db = next(get_db())
+
+    try:
+        results = dispatch(db, message_ids)
+        _emit_status_updates(results)
+
+        sent = sum(1 for result in results if result["status"] == "sent")
+        logger.info(f"Dispatched {len(results)} messages: {sent} sent, {len(results) - sent} failed")
+        return {"status": "success", "sent": sent, "failed": len(results) - sent}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in dispatch_messages: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def sweep_message_dispatch():
+    """Re-enqueue queued messages whose task was lost and fail interrupted sends
+
+    A message left in sending may or may not have reached the provider, so it
+    is marked failed for staff to resend rather than being sent again.
+    """
+    db = next(get_db())
+
+    try:
+        now = datetime.utcnow()
+
+        interrupted = db.query(Message).filter(
+            Message.status == "sending",
+            Message.dispatched_at < now - timedelta(seconds=settings.DISPATCH_STALE_AFTER_SECONDS)
+        ).update({
+            Message.status: "failed",
+            Message.error: "Dispatch interrupted; delivery unknown"
+        }, synchronize_session=False)
+        db.commit()
+
+        queued_ids = [row.id for row in db.query(Message.id).filter(
+            Message.status == "queued",
+            Message.direction == MessageDirection.OUTBOUND,
+            Message.created_at < now - timedelta(seconds=settings.DISPATCH_REQUEUE_AFTER_SECONDS)
+        ).order_by(Message.id).all()]
+
+        enqueue_dispatch(queued_ids)
+
+        if interrupted or queued_ids:
+            logger.warning(f"Dispatch sweep requeued {len(queued_ids)} and failed {interrupted} messages")
+        return {"status": "success", "requeued": len(queued_ids), "interrupted": interrupted}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in sweep_message_dispatch: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def reconcile_message_statuses():
+    """Poll providers for sent messages whose delivery callback never arrived
+
+    Pages through due messages, looking each page up concurrently, until done
+    or STATUS_RECONCILE_BUDGET_SECONDS is spent; the next run continues.
+    """
+    db = next(get_db())
+
+    try:
+        deadline = time.monotonic() + settings.STATUS_RECONCILE_BUDGET_SECONDS
+        after_id = 0
+        checked = updated = errors = 0
+
+        while time.monotonic() < deadline:
+            after_id, results = reconcile_page(db, after_id)
+            if after_id is None:
+                break
+
+            changed = [result for result in results if result["status"] is not None]
+            _emit_status_updates(changed)
+
+            checked += len(results)
+            updated += len(changed)
+            errors += sum(1 for result in results if "lookup_error" in result)
+
+        if checked:
+            logger.info(f"Reconciled {checked} sent messages: {updated} updated, {errors} lookups failed")
+        return {"status": "success", "checked": checked, "updated": updated, "errors": errors}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in reconcile_message_statuses: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task
+def process_webhook_events():
+    """Apply buffered provider callbacks (delivery statuses and inbound messages)
+
+    Scheduled by the webhook endpoints a moment after the first callback of a
+    burst, and every minute by beat as a safety net.
+    """
+    db = next(get_db())
+
+    try:
+        totals = webhook_ingest_service.drain(db)
+        if totals["events"]:
+            logger.info(
+                f"Processed {totals['events']} webhook events: {totals['statuses']} status updates, "
+                f"{totals['messages']} inbound messages, {totals['failed']} failed"
+            )
+        return {"status": "success", **totals}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in process_webhook_events: {str(e)}")
+        return {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+
+def _emit_status_updates(results):
+    by_workspace = defaultdict(list)
+    for result in results:
+        if result["workspace_id"] is not None:
+            by_workspace[result["workspace_id"]].append({
+                "id": result["message_id"],
+                "status": result["status"],
+                "error": result.get("error")
+            })
+
+    for workspace_id, items in by_workspace.items():
+        emit_batch_from_worker(workspace_id, "message_status", items)
@@ -0,0 +1,70 @@
+from contextvars import ContextVar
+from typing import Optional
+import hashlib
+import logging
+import redis
+from app.config import settings
+from app.utils.redis_client import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+_primary_required: ContextVar[bool] = ContextVar("primary_required", default=False)
+
+
+def primary_required() -> bool:
+    """Whether the current request must read from the primary (read-your-writes)"""
+    return _primary_required.get()
+
+
+class ReadRoutingMiddleware:
+    """Pins a client's reads to the primary for a while after it writes
+
+    A write request (POST/PUT/PATCH/DELETE) marks its client in Redis for
+    DATABASE_REPLICA_STICKY_SECONDS, and that client's reads skip the
+    replica until the mark expires, so it never reads data older than its
+    own change. Clients are told apart by their Authorization header;
+    anonymous reads always use the replica. Redis is called with the asyncio
+    client so a slow Redis delays only the request waiting on it; if Redis
+    is down reads go to the primary. Does nothing when no replica is configured.
+    """
+
+    key_prefix = "careops:db_sticky"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.DATABASE_REPLICA_URL:
+            await self.app(scope, receive, send)
+            return
+
+        token = _primary_required.set(await self._needs_primary(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _primary_required.reset(token)
+
+    async def _needs_primary(self, scope) -> bool:
+        client = _client_key(scope)
+        if client is None:
+            return False
+
+        key = f"{self.key_prefix}:{client}"
+        try:
+            if scope["method"] in WRITE_METHODS:
+                # Marked up front, so reads racing the response already see it
+                await get_async_redis().set(key, 1, ex=settings.DATABASE_REPLICA_STICKY_SECONDS)
+                return True
+            return bool(await get_async_redis().exists(key))
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for read routing, reading from primary: {str(e)}")
+            return True
+
+
+def _client_key(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            return hashlib.sha1(value).hexdigest()
+    return None
@@ -0,0 +1,33 @@
+import redis
+import redis.asyncio
+from typing import Optional
+from app.config import settings
+
+_client: Optional[redis.Redis] = None
+_async_client: Optional[redis.asyncio.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Get the shared Redis client (connections are pooled per process)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _client
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    """Get the shared asyncio Redis client, for calls made on the event loop"""
+    global _async_client
+    if _async_client is None:
+        _async_client = redis.asyncio.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _async_client
@@ -0,0 +1,166 @@
+from fastapi import Request, Response
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+import hashlib
+import logging
+import threading
+import orjson
+import redis
+from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def workspace_tag(workspace_id: int) -> str:
+    """Cache tag covering every public response rendered from a workspace's data"""
+    return f"workspace:{workspace_id}"
+
+
+class CachedResponse:
+    """Rendered public response body with its ETag and purge tags
+
+    meta carries what the endpoint still needs on a hit (e.g. the form ID
+    whose views are counted) without reloading the row.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        tags: List[str],
+        meta: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None
+    ):
+        self.body = body
+        self.media_type = media_type
+        self.tags = tags
+        self.meta = meta or {}
+        self.etag = etag or f'"{hashlib.sha1(body).hexdigest()}"'
+
+    @classmethod
+    def json(cls, content: Any, tags: List[str], **meta) -> "CachedResponse":
+        return cls(orjson.dumps(content), "application/json", tags, meta)
+
+    @classmethod
+    def html(cls, content: str, tags: List[str], **meta) -> "CachedResponse":
+        return cls(content.encode(), "text/html", tags, meta)
+
+    def dumps(self) -> bytes:
+        return orjson.dumps({
+            "body": self.body.decode(),
+            "media_type": self.media_type,
+            "tags": self.tags,
+            "meta": self.meta,
+            "etag": self.etag
+        })
+
+    @classmethod
+    def loads(cls, raw: str) -> "CachedResponse":
+        data = orjson.loads(raw)
+        return cls(data["body"].encode(), data["media_type"], data["tags"], data["meta"], data["etag"])
+
+
+class ResponseCache:
+    """Two-tier cache of rendered public GET responses, purged by tag
+
+    Entries live in Redis for RESPONSE_CACHE_TTL_SECONDS, shared by all
+    processes, with a per-process copy for RESPONSE_CACHE_LOCAL_TTL_SECONDS
+    in front of it. Each entry is tagged (e.g. with its workspace) and
+    purge() drops every entry under a tag; other processes may serve their
+    local copy for up to the local TTL afterwards. Without Redis only the
+    local tier is used.
+    """
+
+    key_prefix = "careops:response"
+
+    def __init__(self):
+        self._local = TTLCache(ttl_seconds=settings.RESPONSE_CACHE_LOCAL_TTL_SECONDS)
+        self._local_tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.key_prefix}:tag:{tag}"
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """Cached response for key, rendering and storing it with load() on a miss
+
+        Errors raised by load() (e.g. 404s) are not cached.
+        """
+        entry = self._local.get(key)
+        if entry is not None:
+            return entry
+
+        try:
+            raw = get_redis().get(self._key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for response cache: {str(e)}")
+            raw = None
+
+        if raw is not None:
+            entry = CachedResponse.loads(raw)
+        else:
+            entry = await load()
+            self._store_shared(key, entry)
+
+        self._store_local(key, entry)
+        return entry
+
+    def respond(self, request: Request, entry: CachedResponse) -> Response:
+        """200 with the cached body, or an empty 304 when the client's copy is current"""
+        headers = {"ETag": entry.etag, "Cache-Control": settings.RESPONSE_CACHE_CONTROL}
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+    def purge(self, tags: Iterable[str]):
+        """Drop every cached response carrying any of these tags"""
+        tags = list(tags)
+
+        with self._lock:
+            for tag in tags:
+                for key in self._local_tags.pop(tag, ()):
+                    self._local.delete(key)
+
+        try:
+            client = get_redis()
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            pipe = client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            keys = {self._key(key) for members in pipe.execute() for key in members}
+            client.delete(*keys, *tag_keys)
+        except redis.RedisError as e:
+            logger.warning(f"Could not purge cached responses for {tags}: {str(e)}")
+
+    def _store_local(self, key: str, entry: CachedResponse):
+        self._local.set(key, entry)
+        with self._lock:
+            for tag in entry.tags:
+                self._local_tags.setdefault(tag, set()).add(key)
+
+    def _store_shared(self, key: str, entry: CachedResponse):
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.set(self._key(key), entry.dumps(), ex=settings.RESPONSE_CACHE_TTL_SECONDS)
+            for tag in entry.tags:
+                pipe.sadd(self._tag_key(tag), key)
+                # Tag sets outlive their entries; purging a key that expired is harmless
+                pipe.expire(self._tag_key(tag), settings.RESPONSE_CACHE_TTL_SECONDS * 2)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not cache response {key}: {str(e)}")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # Weak comparison, as If-None-Match requires
+    return "*" in candidates or etag in (value[2:] if value.startswith("W/") else value for value in candidates)
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,11 @@
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def validated_model_response(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
+    """Render an already-validated model with orjson
+    
+    Returning a Response bypasses FastAPI's response_model validation, which is
+    redundant for models built from database rows by the service layer.
+    """
+    return ORJSONResponse(content=model.model_dump(), status_code=status_code)
@@ -1,11 +1,17 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from cryptography.fernet import Fernet
+import base64
+import hashlib
+import json
 from app.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
+_credentials_fernet: Optional[Fernet] = None
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -35,4 +41,27 @@ def decode_access_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+def _get_credentials_fernet() -> Fernet:
+    global _credentials_fernet
+    if _credentials_fernet is None:
+        key = settings.CREDENTIALS_ENCRYPTION_KEY
+        if not key:
+            # Derived key so existing deployments work without new configuration
+            key = base64.urlsafe_b64encode(hashlib.sha256(settings.SECRET_KEY.encode()).digest()).decode()
+        _credentials_fernet = Fernet(key)
+    return _credentials_fernet
+
+def encrypt_credentials(credentials: Dict[str, Any]) -> Dict[str, str]:
+    """Encrypt integration credentials for storage"""
+    token = _get_credentials_fernet().encrypt(json.dumps(credentials).encode())
+    return {"ciphertext": token.decode()}
+
+def decrypt_credentials(stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Decrypt stored integration credentials; rows saved before encryption are returned as-is"""
+    if not stored:
+        return {}
+    if set(stored) != {"ciphertext"}:
+        return dict(stored)
+    return json.loads(_get_credentials_fernet().decrypt(stored["ciphertext"].encode()))
@@ -1,24 +1,42 @@
 import socketio
+import asyncio
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.database import get_db
+from app.utils.cache import TTLCache
 from app.utils.security import decode_access_token
 from app.models.user import User
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
-# Create Socket.IO server
+# Create Socket.IO server; with the Redis message queue, emits from other
+# processes (API replicas, Celery workers) reach this server's clients too
 sio = socketio.AsyncServer(
     async_mode='asgi',
     cors_allowed_origins="*",
-    logger=True,
-    engineio_logger=True
+    client_manager=socketio.AsyncRedisManager(settings.REDIS_URL) if settings.WS_REDIS_MESSAGE_QUEUE else None,
+    logger=settings.WS_SERVER_LOGGING,
+    engineio_logger=settings.WS_SERVER_LOGGING
 )
 
+# Write-only Redis client used to emit from Celery workers
+_worker_emitter: Optional[socketio.RedisManager] = None
+
 # Store connected users by workspace
-connected_users: Dict[int, set] = {}
+connected_users: Dict[int, Set[str]] = {}
+
+# Reverse index: sid -> (workspace_id, user_id)
+connected_sids: Dict[str, Tuple[int, int]] = {}
+
+# Presence: workspace_id -> {user_id: open connection count}
+workspace_presence: Dict[int, Dict[int, int]] = {}
+
+# user_id -> workspace_id for tokens issued without a workspace claim
+user_workspace_cache = TTLCache(ttl_seconds=settings.WS_USER_CACHE_TTL_SECONDS)
 
 
 class WebSocketManager:
@@ -26,32 +44,143 @@ class WebSocketManager:
     
     def __init__(self):
         self.sio = sio
+        # Per-room emission buffers, flushed as one frame per window
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_keys: Dict[str, Dict[Tuple[str, Any], int]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._last_flush: Dict[str, float] = {}
     
     async def connect_user(self, sid: str, workspace_id: int, user_id: int):
         """Add user to workspace room"""
-        if workspace_id not in connected_users:
-            connected_users[workspace_id] = set()
-        connected_users[workspace_id].add(sid)
+        connected_users.setdefault(workspace_id, set()).add(sid)
+        connected_sids[sid] = (workspace_id, user_id)
+        
+        presence = workspace_presence.setdefault(workspace_id, {})
+        presence[user_id] = presence.get(user_id, 0) + 1
         
         # Join workspace room
         await self.sio.enter_room(sid, f"workspace_{workspace_id}")
         
-        logger.info(f"User {user_id} connected to workspace {workspace_id}")
+        logger.debug(f"User {user_id} connected to workspace {workspace_id}")
     
     async def disconnect_user(self, sid: str):
         """Remove user from all rooms"""
-        for workspace_id, sids in connected_users.items():
-            if sid in sids:
-                sids.discard(sid)
-                await self.sio.leave_room(sid, f"workspace_{workspace_id}")
-                logger.info(f"User disconnected from workspace {workspace_id}")
-                break
-    
-    async def emit_to_workspace(self, workspace_id: int, event: str, data: Any):
-        """Emit event to all users in workspace"""
+        entry = connected_sids.pop(sid, None)
+        if entry is None:
+            return
+        
+        workspace_id, user_id = entry
+        
+        sids = connected_users.get(workspace_id)
+        if sids is not None:
+            sids.discard(sid)
+            if not sids:
+                del connected_users[workspace_id]
+        
+        presence = workspace_presence.get(workspace_id)
+        if presence is not None:
+            remaining = presence.get(user_id, 0) - 1
+            if remaining > 0:
+                presence[user_id] = remaining
+            else:
+                presence.pop(user_id, None)
+            if not presence:
+                del workspace_presence[workspace_id]
+        
+        await self.sio.leave_room(sid, f"workspace_{workspace_id}")
+        logger.debug(f"User {user_id} disconnected from workspace {workspace_id}")
+    
+    def get_online_user_ids(self, workspace_id: int) -> Set[int]:
+        """Get IDs of users with at least one open connection in workspace"""
+        return set(workspace_presence.get(workspace_id, {}))
+    
+    def is_user_online(self, workspace_id: int, user_id: int) -> bool:
+        """Check if user has an open connection in workspace"""
+        return user_id in workspace_presence.get(workspace_id, {})
+    
+    async def emit_to_workspace(self, workspace_id: int, event: str, data: Any, immediate: bool = False):
+        """Emit event to all users in workspace
+        
+        Events are buffered per room and flushed after a short window. A flush
+        with a single event is emitted as-is; several events go out together as
+        one `events` frame: [{"event": ..., "data": ...}, ...]. Repeated events
+        for the same entity id within a window are coalesced to the latest one.
+        """
         room = f"workspace_{workspace_id}"
-        await self.sio.emit(event, data, room=room)
-        logger.info(f"Emitted {event} to workspace {workspace_id}")
+        
+        if immediate:
+            await self.sio.emit(event, data, room=room)
+            logger.debug(f"Emitted {event} to workspace {workspace_id}")
+            return
+        
+        self._buffer_event(room, event, data)
+        
+        if room not in self._flush_tasks:
+            self._flush_tasks[room] = asyncio.create_task(self._flush_after(room, self._next_flush_delay(room)))
+    
+    def _buffer_event(self, room: str, event: str, data: Any):
+        """Add event to room buffer, coalescing updates to the same entity"""
+        pending = self._pending.setdefault(room, [])
+        keys = self._pending_keys.setdefault(room, {})
+        
+        entity_id = data.get("id") if isinstance(data, dict) else None
+        if entity_id is not None:
+            key = (event, entity_id)
+            index = keys.get(key)
+            if index is not None:
+                pending[index] = {"event": event, "data": data}
+                return
+            keys[key] = len(pending)
+        
+        pending.append({"event": event, "data": data})
+        
+        if len(pending) > settings.WS_MAX_PENDING_EVENTS:
+            overflow = len(pending) - settings.WS_MAX_PENDING_EVENTS
+            del pending[:overflow]
+            self._pending_keys[room] = {
+                (item["event"], item["data"].get("id")): i
+                for i, item in enumerate(pending)
+                if isinstance(item["data"], dict) and item["data"].get("id") is not None
+            }
+            logger.warning(f"Dropped {overflow} buffered events for {room}")
+    
+    def _next_flush_delay(self, room: str) -> float:
+        """Seconds until room may flush, honouring the window and the rate cap"""
+        window = settings.WS_EMIT_WINDOW_MS / 1000
+        min_interval = 1 / max(settings.WS_MAX_FLUSHES_PER_SECOND, 1)
+        since_last = time.monotonic() - self._last_flush.get(room, 0.0)
+        return max(window, min_interval - since_last)
+    
+    async def _flush_after(self, room: str, delay: float):
+        """Wait for the window to close, then flush the room buffer"""
+        try:
+            await asyncio.sleep(delay)
+            await self._flush(room)
+        except Exception as e:
+            logger.error(f"Error flushing events for {room}: {str(e)}")
+        finally:
+            self._flush_tasks.pop(room, None)
+            # Events buffered while flushing get their own window
+            if self._pending.get(room):
+                self._flush_tasks[room] = asyncio.create_task(self._flush_after(room, self._next_flush_delay(room)))
+    
+    async def _flush(self, room: str):
+        """Emit buffered events for room"""
+        events = self._pending.pop(room, [])
+        self._pending_keys.pop(room, None)
+        self._last_flush[room] = time.monotonic()
+        
+        if not events:
+            return
+        
+        if len(events) == 1:
+            await self.sio.emit(events[0]["event"], events[0]["data"], room=room)
+        else:
+            frame_size = settings.WS_MAX_EVENTS_PER_FRAME
+            for start in range(0, len(events), frame_size):
+                await self.sio.emit("events", events[start:start + frame_size], room=room)
+        
+        logger.debug(f"Flushed {len(events)} events to {room}")
     
     async def emit_new_contact(self, workspace_id: int, contact_data: Dict[str, Any]):
         """Emit new contact event"""
@@ -82,6 +211,39 @@ class WebSocketManager:
 websocket_manager = WebSocketManager()
 
 
+def emit_from_worker(workspace_id: int, event: str, data: Any):
+    """Emit event to a workspace room from outside the web process (e.g. a Celery task)
+
+    Goes through the Redis message queue, so it is delivered unbuffered and
+    only when WS_REDIS_MESSAGE_QUEUE is enabled on the web servers.
+    """
+    global _worker_emitter
+    if _worker_emitter is None:
+        _worker_emitter = socketio.RedisManager(settings.REDIS_URL, write_only=True)
+    
+    try:
+        _worker_emitter.emit(event, data, room=f"workspace_{workspace_id}")
+    except Exception as e:
+        logger.error(f"Error emitting {event} from worker: {str(e)}")
+
+
+def emit_batch_from_worker(workspace_id: int, event: str, items: List[Any]):
+    """Emit many events of one kind from a worker, framed like buffered emits
+
+    A single item is emitted as-is; more go out as `events` frames of up to
+    WS_MAX_EVENTS_PER_FRAME entries: [{"event": ..., "data": ...}, ...].
+    """
+    if len(items) == 1:
+        emit_from_worker(workspace_id, event, items[0])
+        return
+    
+    frame_size = settings.WS_MAX_EVENTS_PER_FRAME
+    for start in range(0, len(items), frame_size):
+        emit_from_worker(workspace_id, "events", [
+            {"event": event, "data": item} for item in items[start:start + frame_size]
+        ])
+
+
 @sio.event
 async def connect(sid, environ, auth):
     """Handle client connection"""
@@ -104,34 +266,50 @@ async def connect(sid, environ, auth):
             logger.error(f"No user ID in token for {sid}")
             return False
         
-        # Get user from database
-        db = next(get_db())
-        try:
-            user = db.query(User).filter(User.id == int(user_id)).first()
-            if not user or not user.is_active:
-                logger.error(f"User not found or inactive for {sid}")
-                return False
-            
-            # Connect user to their workspace
-            await websocket_manager.connect_user(sid, user.workspace_id, user.id)
-            
-            logger.info(f"WebSocket connection established for user {user.id}")
-            return True
-            
-        finally:
-            db.close()
+        # Workspace comes from the token claims; only older tokens need a lookup
+        workspace_id = payload.get("workspace_id")
+        if workspace_id is None:
+            workspace_id = await asyncio.to_thread(_lookup_user_workspace, int(user_id))
+        
+        if not workspace_id:
+            logger.error(f"User not found, inactive or without workspace for {sid}")
+            return False
+        
+        # Connect user to their workspace
+        await websocket_manager.connect_user(sid, int(workspace_id), int(user_id))
+        
+        logger.debug(f"WebSocket connection established for user {user_id}")
+        return True
     
     except Exception as e:
         logger.error(f"Error connecting WebSocket: {str(e)}")
         return False
 
 
+def _lookup_user_workspace(user_id: int) -> Optional[int]:
+    """Resolve workspace for a user, cached to keep reconnect storms off the database"""
+    cached = user_workspace_cache.get(user_id)
+    if cached is not None:
+        return cached or None
+    
+    db = next(get_db())
+    try:
+        user = db.query(User.workspace_id, User.is_active).filter(User.id == user_id).first()
+        workspace_id = user.workspace_id if user and user.is_active else None
+    finally:
+        db.close()
+    
+    # Cache misses too (as 0) so invalid users don't hit the database on every retry
+    user_workspace_cache.set(user_id, workspace_id or 0)
+    return workspace_id
+
+
 @sio.event
 async def disconnect(sid):
     """Handle client disconnection"""
     try:
         await websocket_manager.disconnect_user(sid)
-        logger.info(f"WebSocket disconnected: {sid}")
+        logger.debug(f"WebSocket disconnected: {sid}")
     except Exception as e:
         logger.error(f"Error disconnecting WebSocket: {str(e)}")
 
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading a long conversation's message history
+
+Seeds one conversation with N messages in the configured database, then
+compares the previous detail path (joined eager load of every message and
+sender, Python sort, serialize everything) with the keyset pages served by
+GET /conversations/{id}/messages: the newest page and a page deep in history.
+The seeded contact, conversation and messages are removed afterwards.
+
+Usage:
+    python scripts/bench_message_history.py [--messages N] [--page-size N] [--rounds N]
+
+Examples:
+    python scripts/bench_message_history.py
+    python scripts/bench_message_history.py --messages 100000 --page-size 100
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import joinedload
+from app.database import get_db
+from app.models.workspace import Workspace
+from app.models.contact import Contact
+from app.models.conversation import Conversation
+from app.models.message import Message, MessageType, MessageDirection
+from app.schemas.conversation import MessageResponse
+from app.services.conversation_service import ConversationService
+
+SEED_BATCH = 5000
+
+
+def seed_conversation(db, workspace_id: int, messages: int) -> int:
+    """Create a contact and conversation with `messages` messages, one minute apart"""
+    contact = Contact(workspace_id=workspace_id, full_name="History Benchmark", preferred_channel="email")
+    db.add(contact)
+    db.flush()
+
+    conversation = Conversation(contact_id=contact.id, workspace_id=workspace_id, status="archived")
+    db.add(conversation)
+    db.flush()
+
+    start = datetime.utcnow() - timedelta(minutes=messages)
+    for offset in range(0, messages, SEED_BATCH):
+        db.execute(insert(Message), [
+            {
+                "conversation_id": conversation.id,
+                "type": MessageType.EMAIL,
+                "direction": MessageDirection.INBOUND if i % 2 else MessageDirection.OUTBOUND,
+                "content": f"Message {i}: following up about the treatment plan and next appointment.",
+                "is_automated": False,
+                "status": "sent",
+                "created_at": start + timedelta(minutes=i)
+            }
+            for i in range(offset, min(offset + SEED_BATCH, messages))
+        ])
+    db.commit()
+    db.execute(text("ANALYZE messages"))
+    return conversation.id
+
+
+def previous_path(db, conversation_id: int) -> int:
+    """Every message and sender through joined eager loading, re-sorted in Python"""
+    db.expire_all()
+    conversation = db.query(Conversation).options(
+        joinedload(Conversation.contact),
+        joinedload(Conversation.messages).joinedload(Message.sent_by_user)
+    ).filter(Conversation.id == conversation_id).first()
+    messages = sorted(conversation.messages, key=lambda m: m.created_at)
+    return sum(len(MessageResponse.model_validate(m).model_dump_json()) for m in messages)
+
+
+def page_path(db, conversation_id: int, page_size: int, before=None) -> int:
+    """One keyset page, serialized like the endpoint response"""
+    db.expire_all()
+    page = ConversationService()._message_page(db, conversation_id, before, page_size)
+    return len(page.model_dump_json())
+
+
+def bench(name: str, fn, rounds: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        size = fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{name:<32} {elapsed * 1000:10.2f} ms/request  {size / 1024:10.1f} KiB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark conversation message history loading')
+    parser.add_argument('--messages', type=int, default=50000, help='Messages in the conversation (default: 50000)')
+    parser.add_argument('--page-size', type=int, default=50, help='Messages per page (default: 50)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed iterations (default: 5)')
+    args = parser.parse_args()
+
+    db = next(get_db())
+    conversation_id = None
+
+    try:
+        workspace = db.query(Workspace).first()
+        if not workspace:
+            print("No workspace found; run scripts/seed_db.py first")
+            return
+
+        conversation_id = seed_conversation(db, workspace.id, args.messages)
+        deep_cursor = db.query(Message.id).filter(
+            Message.conversation_id == conversation_id
+        ).order_by(Message.created_at, Message.id).offset(args.messages // 10).limit(1).scalar()
+
+        print(f"{args.messages} messages, page size {args.page_size}, {args.rounds} rounds\n")
+
+        baseline = bench("previous (load everything)", lambda: previous_path(db, conversation_id), args.rounds)
+        newest = bench("keyset newest page", lambda: page_path(db, conversation_id, args.page_size), args.rounds)
+        deep = bench(
+            "keyset page 90% back",
+            lambda: page_path(db, conversation_id, args.page_size, deep_cursor),
+            args.rounds
+        )
+
+        print(f"\nspeedup: {baseline / newest:.0f}x (newest page), {baseline / deep:.0f}x (deep page)")
+
+    finally:
+        if conversation_id is not None:
+            db.rollback()
+            contact_id = db.query(Conversation.contact_id).filter(Conversation.id == conversation_id).scalar()
+            db.query(Message).filter(Message.conversation_id == conversation_id).delete(synchronize_session=False)
+            db.query(Conversation).filter(Conversation.id == conversation_id).delete(synchronize_session=False)
+            db.query(Contact).filter(Contact.id == contact_id).delete(synchronize_session=False)
+            db.commit()
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
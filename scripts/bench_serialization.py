@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for serializing a page of form submissions
+
+Compares the previous path (per-item from_orm, response_model re-validation,
+jsonable_encoder + json.dumps) with the bulk TypeAdapter path used by the
+list endpoints (one validation pass, no re-validation, orjson rendering).
+
+Usage:
+    python scripts/bench_serialization.py [--items N] [--fields N] [--rounds N]
+
+Examples:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --items 100 --fields 40 --rounds 500
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from app.schemas.form import (
+    CustomFormSubmissionResponse, FormSubmissionListResponse, CustomFormSubmissionResponseList
+)
+
+
+def make_rows(items: int, fields: int):
+    """Build ORM-like submission rows with a large submitted_data blob"""
+    now = datetime.utcnow()
+    rows = []
+    for i in range(items):
+        submitted_data = {
+            f"field_{f}": f"Answer {f} for submission {i} " * 4 for f in range(fields)
+        }
+        submitted_data["symptoms"] = ["Fever", "Cough", "Headache"]
+        rows.append(SimpleNamespace(
+            id=i + 1,
+            form_id=1,
+            workspace_id=1,
+            submitted_data=submitted_data,
+            submitter_email=f"patient{i}@example.com",
+            submitter_name=f"Patient {i}",
+            submitter_phone="+15555550100",
+            status="NEW",
+            is_read=False,
+            notes=None,
+            assigned_to=None,
+            converted_to_booking_id=None,
+            created_at=now,
+            updated_at=now,
+            form_name=None,
+            assigned_user_name=None
+        ))
+    return rows
+
+
+def previous_path(rows) -> bytes:
+    """Per-item validation, response_model re-validation, stdlib JSON"""
+    submissions = [CustomFormSubmissionResponse.from_orm(row) for row in rows]
+    response = FormSubmissionListResponse(submissions=submissions, total=len(rows), page=1, per_page=len(rows))
+    # FastAPI validates the returned object against response_model again
+    validated = FormSubmissionListResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+
+def dump_json_path(rows) -> bytes:
+    """One bulk validation pass, no re-validation, pydantic-core JSON"""
+    submissions = CustomFormSubmissionResponseList.validate_python(rows, from_attributes=True)
+    response = FormSubmissionListResponse.model_construct(
+        submissions=submissions, total=len(rows), page=1, per_page=len(rows)
+    )
+    return response.model_dump_json().encode("utf-8")
+
+
+def orjson_path(rows) -> bytes:
+    """One bulk validation pass, no re-validation, orjson (validated_model_response)"""
+    submissions = CustomFormSubmissionResponseList.validate_python(rows, from_attributes=True)
+    response = FormSubmissionListResponse.model_construct(
+        submissions=submissions, total=len(rows), page=1, per_page=len(rows)
+    )
+    return orjson.dumps(response.model_dump())
+
+
+def bench(name: str, fn, rows, rounds: int) -> float:
+    fn(rows)  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = fn(rows)
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{name:<28} {elapsed * 1000:8.3f} ms/page  {len(body) / 1024:8.1f} KiB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark submissions page serialization')
+    parser.add_argument('--items', type=int, default=100, help='Submissions per page (default: 100)')
+    parser.add_argument('--fields', type=int, default=25, help='Answers per submission (default: 25)')
+    parser.add_argument('--rounds', type=int, default=200, help='Timed iterations (default: 200)')
+    args = parser.parse_args()
+
+    rows = make_rows(args.items, args.fields)
+    print(f"{args.items} submissions x {args.fields} fields, {args.rounds} rounds\n")
+
+    baseline = bench("previous (from_orm + json)", previous_path, rows, args.rounds)
+    dump_json = bench("bulk adapter + dump_json", dump_json_path, rows, args.rounds)
+    fast = bench("bulk adapter + orjson", orjson_path, rows, args.rounds)
+
+    print(f"\nspeedup: {baseline / fast:.1f}x (orjson), {baseline / dump_json:.1f}x (dump_json)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+In-memory fake of the Google Calendar API subset used by calendar sync
+
+Serves the OAuth token endpoint, calendar metadata, event listing with
+incremental sync tokens and paging, event insert/patch/delete and the
+multipart batch endpoint. Deleted events are kept as cancelled tombstones,
+like Google, so incremental syncs see removals. Point the app at it with:
+
+    GOOGLE_OAUTH_TOKEN_URL=http://127.0.0.1:8765/token
+    GOOGLE_CALENDAR_API_URL=http://127.0.0.1:8765/calendar/v3
+    GOOGLE_CALENDAR_BATCH_URL=http://127.0.0.1:8765/batch/calendar/v3
+
+and create a calendar integration with credentials {"refresh_token": "any"}.
+POST /_admin/expire-sync-tokens makes the next incremental sync get 410 Gone.
+
+Usage:
+    python scripts/fake_google_calendar.py [--host HOST] [--port PORT] [--page-size N]
+
+Examples:
+    python scripts/fake_google_calendar.py
+    python scripts/fake_google_calendar.py --port 9000 --page-size 2
+"""
+
+import json
+import uuid
+import argparse
+from datetime import datetime
+from aiohttp import web
+
+API_PREFIX = "/calendar/v3"
+
+
+class FakeCalendar:
+    def __init__(self, page_size: int):
+        self.page_size = page_size
+        self.events = {}  # id -> event, including cancelled tombstones
+        self.revision = 0
+        self.min_valid_revision = 0  # Sync tokens older than this are expired
+
+    def _touch(self, event):
+        self.revision += 1
+        event["_revision"] = self.revision
+        event["updated"] = datetime.utcnow().isoformat() + "Z"
+
+    def insert(self, body):
+        event = {**body, "id": uuid.uuid4().hex, "status": body.get("status", "confirmed")}
+        self._touch(event)
+        self.events[event["id"]] = event
+        return 200, _public(event)
+
+    def patch(self, event_id, body):
+        event = self.events.get(event_id)
+        if event is None or event["status"] == "cancelled":
+            return 404, {"error": {"code": 404, "message": "Not Found"}}
+        event.update(body)
+        self._touch(event)
+        return 200, _public(event)
+
+    def delete(self, event_id):
+        event = self.events.get(event_id)
+        if event is None or event["status"] == "cancelled":
+            return 410, {"error": {"code": 410, "message": "Resource has been deleted"}}
+        event["status"] = "cancelled"
+        self._touch(event)
+        return 204, None
+
+    def list(self, params):
+        sync_token = params.get("syncToken")
+        if sync_token:
+            since = int(sync_token.split("-")[1])
+            if since < self.min_valid_revision:
+                return 410, {"error": {"code": 410, "message": "Sync token is no longer valid"}}
+            matching = [event for event in self.events.values() if event["_revision"] > since]
+        else:
+            matching = [event for event in self.events.values() if event["status"] != "cancelled"]
+        matching.sort(key=lambda event: event["_revision"])
+
+        offset = int(params.get("pageToken") or 0)
+        page = matching[offset:offset + self.page_size]
+        data = {"items": [_public(event) for event in page]}
+        if offset + self.page_size < len(matching):
+            data["nextPageToken"] = str(offset + self.page_size)
+        else:
+            data["nextSyncToken"] = f"rev-{self.revision}"
+        return 200, data
+
+    def dispatch(self, method, path, body):
+        """Route one events call (also used for batch parts)"""
+        parts = path.split("?")[0].rstrip("/").split("/")
+        # .../calendars/{calendar}/events[/{event_id}]
+        event_id = parts[-1] if parts[-2] == "events" else None
+        if method == "POST" and event_id is None:
+            return self.insert(body or {})
+        if method == "PATCH" and event_id:
+            return self.patch(event_id, body or {})
+        if method == "DELETE" and event_id:
+            return self.delete(event_id)
+        return 400, {"error": {"code": 400, "message": f"Unsupported {method} {path}"}}
+
+
+def _public(event):
+    return {key: value for key, value in event.items() if not key.startswith("_")}
+
+
+def _json(status, data):
+    if data is None:
+        return web.Response(status=status)
+    return web.json_response(data, status=status)
+
+
+def build_app(calendar: FakeCalendar) -> web.Application:
+    async def token(request):
+        return web.json_response({"access_token": "fake-access-token", "expires_in": 3600, "token_type": "Bearer"})
+
+    async def calendar_metadata(request):
+        return web.json_response({"id": request.match_info["calendar"], "summary": "Fake calendar", "timeZone": "UTC"})
+
+    async def list_events(request):
+        return _json(*calendar.list(request.query))
+
+    async def insert_event(request):
+        return _json(*calendar.dispatch("POST", request.path, await request.json()))
+
+    async def patch_event(request):
+        return _json(*calendar.dispatch("PATCH", request.path, await request.json()))
+
+    async def delete_event(request):
+        return _json(*calendar.dispatch("DELETE", request.path, None))
+
+    async def batch(request):
+        boundary = request.headers["Content-Type"].split("boundary=", 1)[1].strip().strip('"')
+        body = (await request.text()).replace("\r\n", "\n")
+        responses = []
+
+        for part in body.split(f"--{boundary}"):
+            part = part.strip()
+            if not part or part == "--":
+                continue
+            outer, _, inner = part.partition("\n\n")
+            content_id = next(
+                (line.split(":", 1)[1].strip().strip("<>") for line in outer.split("\n")
+                 if line.lower().startswith("content-id")),
+                ""
+            )
+            request_line, _, rest = inner.partition("\n")
+            method, path, _ = request_line.split(" ", 2)
+            _, _, payload = rest.partition("\n\n")
+            status, data = calendar.dispatch(method, path, json.loads(payload) if payload.strip() else None)
+            responses.append((content_id, status, data))
+
+        out_boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for content_id, status, data in responses:
+            chunk = (
+                f"--{out_boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\nHTTP/1.1 {status} Fake\r\n"
+            )
+            if data is not None:
+                chunk += f"Content-Type: application/json; charset=UTF-8\r\n\r\n{json.dumps(data)}\r\n"
+            else:
+                chunk += "\r\n"
+            chunks.append(chunk)
+        return web.Response(
+            text="".join(chunks) + f"--{out_boundary}--\r\n",
+            headers={"Content-Type": f"multipart/mixed; boundary={out_boundary}"}
+        )
+
+    async def expire_sync_tokens(request):
+        calendar.min_valid_revision = calendar.revision + 1
+        return web.json_response({"expired_before": calendar.min_valid_revision})
+
+    app = web.Application()
+    app.router.add_post("/token", token)
+    app.router.add_get(API_PREFIX + "/calendars/{calendar}", calendar_metadata)
+    app.router.add_get(API_PREFIX + "/calendars/{calendar}/events", list_events)
+    app.router.add_post(API_PREFIX + "/calendars/{calendar}/events", insert_event)
+    app.router.add_patch(API_PREFIX + "/calendars/{calendar}/events/{event_id}", patch_event)
+    app.router.add_delete(API_PREFIX + "/calendars/{calendar}/events/{event_id}", delete_event)
+    app.router.add_post("/batch" + API_PREFIX, batch)
+    app.router.add_post("/_admin/expire-sync-tokens", expire_sync_tokens)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a fake Google Calendar API for local sync testing')
+    parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind to (default: 8765)')
+    parser.add_argument('--page-size', type=int, default=250, help='Events per list page (default: 250)')
+    args = parser.parse_args()
+
+    web.run_app(build_app(FakeCalendar(args.page_size)), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()